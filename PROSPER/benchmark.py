@@ -0,0 +1,70 @@
+import os
+import random
+import time
+import timeit
+from datetime import datetime
+
+from prosper import Flare, CME, predict, run_parallel, sepprob, sepprobs
+
+
+# Operational nowcast: one alert, one flare/CME pair
+FLARE = Flare(45.0, 3.7e-5, "M3.7", datetime(2011, 3, 7, 19, 43))
+CME_HALO = CME(360.0, 2125.0, datetime(2011, 3, 7, 20, 0))
+
+
+def best_of(statement, number: int = 20000, repeat: int = 5) -> float:
+    # Best time per call in microseconds
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number * 1e6
+
+
+def bench_nowcast() -> None:
+    cases = {
+        "flare & cme": (FLARE, CME_HALO),
+        "flare": (FLARE, None),
+        "cme": (None, CME_HALO),
+    }
+    print("Single trigger latency (us per call)")
+    print(f"{'inputs':<12}{'sepprobs':>12}{'sepprob':>12}")
+    for name, (flare, cme) in cases.items():
+        legacy = best_of(lambda: sepprobs([{"flare": flare, "cme": cme}]))
+        fast = best_of(lambda: sepprob(flare, cme))
+        print(f"{name:<12}{legacy:>12.2f}{fast:>12.2f}")
+
+
+def synthetic_catalog(n: int, seed: int = 0) -> list[dict]:
+    # Mix of flare & CME, flare-only and CME-only triggers
+    rng = random.Random(seed)
+    catalog = []
+    for _ in range(n):
+        flare = Flare(
+            rng.uniform(-90.0, 90.0), 10 ** rng.uniform(-6.0, -3.0), "", FLARE.start
+        )
+        cme = CME(rng.choice((60.0, 150.0, 360.0)), rng.uniform(200.0, 3000.0), CME_HALO.start)
+        kind = rng.randrange(3)
+        catalog.append({"flare": flare if kind < 2 else None, "cme": cme if kind != 1 else None})
+    return catalog
+
+
+def bench_scaling(n: int = 200000, chunk_size: int = 10000) -> None:
+    # Wall time of run_parallel against the serial predict, for powers of
+    # two up to the core count
+    catalog = synthetic_catalog(n)
+    start = time.perf_counter()
+    predict(catalog)
+    serial = time.perf_counter() - start
+
+    cores = os.cpu_count() or 1
+    workers = sorted({2 ** k for k in range(cores.bit_length()) if 2 ** k <= cores} | {cores})
+    print(f"Catalog scaling, {n} triggers, chunks of {chunk_size} ({cores} cores)")
+    print(f"{'workers':<12}{'seconds':>12}{'speedup':>12}")
+    print(f"{'serial':<12}{serial:>12.2f}{1.0:>12.2f}")
+    for count in workers:
+        start = time.perf_counter()
+        run_parallel(catalog, workers=count, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+        print(f"{count:<12}{elapsed:>12.2f}{serial / elapsed:>12.2f}")
+
+
+if __name__ == "__main__":
+    bench_nowcast()
+    bench_scaling()
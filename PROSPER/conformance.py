@@ -0,0 +1,318 @@
+import glob
+import math
+import os
+import random
+import time
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+import legacy_prosper
+import prosper
+from prosper import Flare, CME
+
+
+# An engine maps triggers to the sepprobs and sepchars results of each trigger
+Engine = Callable[[list[dict]], tuple[Sequence[Mapping], Sequence[Mapping]]]
+
+START = datetime(2011, 3, 7, 19, 43)
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "examples")
+
+
+def legacy_engine(triggers: list[dict]) -> tuple[Sequence[Mapping], Sequence[Mapping]]:
+    # The reference: the original sepprobs and sepchars, quirks included
+    legacy_triggers = [
+        {
+            "flare": None if t["flare"] is None else legacy_prosper.Flare(
+                t["flare"].longitude, t["flare"].magnitude, t["flare"].fclass, t["flare"].start
+            ),
+            "cme": None if t["cme"] is None else legacy_prosper.CME(
+                t["cme"].width, t["cme"].velocity, t["cme"].start
+            ),
+        }
+        for t in triggers
+    ]
+    sep_probabilities = legacy_prosper.sepprobs(legacy_triggers)["sep_probabilities"]
+    sep_characteristics = legacy_prosper.sepchars(legacy_triggers, sep_probabilities)
+    return sep_probabilities, sep_characteristics["sep_characteristics"]
+
+
+def dict_engine(triggers: list[dict]) -> tuple[Sequence[Mapping], Sequence[Mapping]]:
+    sep_probabilities = prosper.sepprobs(triggers)["sep_probabilities"]
+    return sep_probabilities, prosper.sepchars(triggers, sep_probabilities)["sep_characteristics"]
+
+
+def columnar_engine(triggers: list[dict]) -> tuple[Sequence[Mapping], Sequence[Mapping]]:
+    sep_probabilities = prosper.sepprobs(triggers, columnar=True)["sep_probabilities"]
+    return sep_probabilities, prosper.sepchars(triggers, sep_probabilities)["sep_characteristics"]
+
+
+def predict_engine(triggers: list[dict]) -> tuple[Sequence[Mapping], Sequence[Mapping]]:
+    result = prosper.predict(triggers)
+    return result["sep_probabilities"], result["sep_characteristics"]
+
+
+def float32_engine(triggers: list[dict]) -> tuple[Sequence[Mapping], Sequence[Mapping]]:
+    result = prosper.predict(triggers, dtype=np.float32)
+    return result["sep_probabilities"], result["sep_characteristics"]
+
+
+CANDIDATES: dict[str, Engine] = {
+    "sepprobs": dict_engine,
+    "columnar": columnar_engine,
+    "predict": predict_engine,
+    "float32": float32_engine,
+}
+
+
+def check_float32(triggers: list[dict]) -> None:
+    # The float32 predict against the float64 one: every probability within
+    # precision_error_bound(np.float32) of its regime and channel, the same
+    # peak flux bands (None in the same places) and every peak flux within
+    # peak_flux_error_bound(np.float32), over the ranges of the triggers
+    reference = prosper.predict(triggers)
+    candidate = prosper.predict(triggers, dtype=np.float32)
+    _, magnitude, _, velocity, has_flare, has_cme = prosper.trigger_columns(triggers)
+    ranges = [
+        (float(np.min(x[present])), float(np.max(x[present]))) if present.any() else (1.0, 1.0)
+        for x, present in ((velocity, has_cme), (magnitude, has_flare))
+    ]
+
+    bound = prosper.precision_error_bound(np.float32, *ranges)
+    regimes = reference["sep_probabilities"].regimes
+    error = np.abs(
+        candidate["sep_probabilities"].probabilities - reference["sep_probabilities"].probabilities
+    )
+    if np.any(error > bound[regimes].T):
+        raise ValueError("float32 probabilities exceed precision_error_bound.")
+
+    expected = reference["sep_characteristics"].peak_flux
+    actual = candidate["sep_characteristics"].peak_flux
+    if np.any(np.isnan(expected) != np.isnan(actual)):
+        raise ValueError("float32 peak fluxes are of other bands than the float64 ones.")
+    error = np.nan_to_num(np.abs(actual - expected))
+    if np.any(error > prosper.peak_flux_error_bound(np.float32, *ranges)[..., None]):
+        raise ValueError("float32 peak fluxes exceed peak_flux_error_bound.")
+
+
+def legacy_fails(triggerset: dict) -> bool:
+    # The original divides products of PDFs, which underflow to 0 / 0 far out
+    # in the tails; the engines of prosper.py work with log odds instead
+    try:
+        legacy_engine([triggerset])
+    except ArithmeticError:
+        return True
+    return False
+
+
+def known_deviation(triggerset: dict) -> bool:
+    # Flare-only triggers without longitude: the original evaluates them with
+    # an undefined connectivity, the engines of prosper.py give no prediction
+    flare = triggerset["flare"]
+    return triggerset["cme"] is None and flare is not None and math.isnan(flare.longitude)
+
+
+def example_catalog() -> list[dict]:
+    # Every row of examples/*.csv as flare & CME, flare-only and CME-only trigger
+    catalog = []
+    for path in sorted(glob.glob(os.path.join(EXAMPLES, "*.csv"))):
+        df = pd.read_csv(path, header=0, parse_dates=[0, 4])
+        for _, row in df.iterrows():
+            flare = Flare(
+                row["flare_longitude"], row["flare_magnitude"], row["flare_class"],
+                row["flare_date"].to_pydatetime(),
+            ) if not pd.isna(row["flare_date"]) else None
+            cme = CME(
+                row["cme_width"], row["cme_speed"], row["cme_date"].to_pydatetime()
+            ) if not pd.isna(row["cme_date"]) else None
+            catalog += [
+                {"flare": flare, "cme": cme},
+                {"flare": flare, "cme": None},
+                {"flare": None, "cme": cme},
+            ]
+    return catalog
+
+
+# The cut points of the original engine: its regime boundaries and the
+# magnitude (W/m^2), velocity (km/s) and width (deg) edges of its sepchars
+# chains. They are taken from the original, not from the engines compared
+# against it, so that a threshold an engine gets wrong is still sampled.
+LEGACY_CUT_POINTS = {
+    "longitude": (20.0,),
+    "width": (120.0, 360.0),
+    "magnitude": (1e-6, 3e-5, 6e-5, 1e-4, 3e-4),
+    "velocity": (0.0, 1000.0, 1250.0, 1350.0, 1400.0, 1600.0, 1650.0),
+}
+
+
+def check_cut_points(model: prosper.CompiledModel | None = None) -> None:
+    # The peak flux thresholds of model (default: the active one) against the
+    # legacy cut points: every magnitude and velocity edge, and no threshold
+    # of a legacy variable that the original doesn't have. A mismatch means
+    # the boundary catalog no longer samples where the engines branch.
+    table = (prosper.MODEL if model is None else model).peak_flux_table
+    thresholds = {
+        variable: set(values) for variable, values in zip(table.variables, table.thresholds)
+    }
+    for variable, edges in LEGACY_CUT_POINTS.items():
+        unknown = thresholds.get(variable, set()) - set(edges)
+        missing = set(edges) - thresholds.get(variable, set())
+        if unknown or (missing and variable in ("magnitude", "velocity")):
+            raise ValueError(
+                f"Peak flux thresholds of {variable} {sorted(thresholds.get(variable, ()))} "
+                f"differ from the legacy cut points {list(edges)}."
+            )
+
+
+def cut_points() -> dict[str, list[float]]:
+    # Every legacy cut point with its neighbours on either side (magnitudes
+    # and velocities only where positive, as both are log scaled)
+    return {
+        variable: sorted(
+            value
+            for edge in edges
+            for value in (edge * (1 - 1e-9) or -1e-9, edge, edge * (1 + 1e-9) or 1e-9)
+            if value > 0 or variable in ("longitude", "width")
+        )
+        for variable, edges in LEGACY_CUT_POINTS.items()
+    }
+
+
+def boundary_catalog(n: int, seed: int = 0) -> list[dict]:
+    # Triggers of every kind, drawing each property at a cut point or from
+    # its physical range with equal odds
+    rng = random.Random(seed)
+    points = cut_points()
+
+    def draw(variable: str, low: float, high: float, log_scale: bool = False) -> float:
+        if rng.random() < 0.5:
+            return rng.choice(points[variable])
+        if log_scale:
+            return 10 ** rng.uniform(math.log10(low), math.log10(high))
+        return rng.uniform(low, high)
+
+    catalog = []
+    for _ in range(n):
+        flare = Flare(
+            draw("longitude", -90.0, 90.0), draw("magnitude", 1e-8, 1e-2, True), "", START
+        )
+        cme = CME(draw("width", 10.0, 360.0), draw("velocity", 100.0, 3500.0, True), START)
+        kind = rng.randrange(7)
+        catalog.append({
+            "flare": flare if kind < 5 else None,
+            "cme": cme if kind not in (3, 4, 6) else None,
+        })
+    return catalog
+
+
+def fields(sep_probability: Mapping, sep_characteristic: Mapping) -> dict[str, Any]:
+    # Flat field -> value of one trigger's results
+    values = dict(sep_probability)
+    for energy, levels in sep_characteristic["peak_flux"].items():
+        for level, value in levels.items():
+            values[f"peak_flux_{energy}_{level}"] = value
+    return values
+
+
+def deviations(reference: tuple, candidate: tuple) -> dict[str, tuple[float, int]]:
+    # Per field: max |candidate - reference| over the triggers both give a
+    # value for, and the number of triggers where only one of them does
+    worst: dict[str, tuple[float, int]] = {}
+    for expected, actual in zip(zip(*reference), zip(*candidate)):
+        expected, actual = fields(*expected), fields(*actual)
+        for field in expected.keys() | actual.keys():
+            deviation, mismatches = worst.get(field, (0.0, 0))
+            a = expected.get(field)
+            b = actual.get(field)
+            if isinstance(a, tuple) or isinstance(b, tuple):
+                pairs = list(zip(a or (), b or ()))
+                if a is None or b is None or len(a) != len(b):
+                    mismatches += 1
+                    pairs = []
+            else:
+                pairs = [(a, b)]
+            for x, y in pairs:
+                if (x is None) != (y is None):
+                    mismatches += 1
+                elif x is not None:
+                    deviation = max(deviation, abs(float(x) - float(y)))
+            worst[field] = (deviation, mismatches)
+    return worst
+
+
+def throughput(engine: Engine, triggers: list[dict], repeat: int = 3) -> float:
+    # Triggers per second, best of repeat
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        engine(triggers)
+        best = min(best, time.perf_counter() - start)
+    return len(triggers) / best
+
+
+def compare(
+    name: str,
+    triggers: list[dict],
+    candidates: dict[str, Engine] = CANDIDATES,
+    repeat: int = 3,
+) -> dict[str, Any]:
+
+    # Max deviation per output field of every candidate from the reference,
+    # and the throughput of each relative to it. Triggers of a known
+    # deviation, and those the reference fails on, are left out of the
+    # comparison and only counted.
+    excluded = sum(known_deviation(t) for t in triggers)
+    triggers = [t for t in triggers if not known_deviation(t)]
+    try:
+        reference = legacy_engine(triggers)
+        failures = 0
+    except ArithmeticError:
+        defined = [t for t in triggers if not legacy_fails(t)]
+        failures = len(triggers) - len(defined)
+        triggers = defined
+        reference = legacy_engine(triggers)
+    report = {
+        "catalog": name,
+        "triggers": len(triggers),
+        "known_deviations": excluded,
+        "legacy_failures": failures,
+        "deviations": {},
+        "throughput": {"legacy": throughput(legacy_engine, triggers, repeat)},
+    }
+    for candidate, engine in candidates.items():
+        report["deviations"][candidate] = deviations(reference, engine(triggers))
+        report["throughput"][candidate] = throughput(engine, triggers, repeat)
+    return report
+
+
+def print_report(report: dict[str, Any]) -> None:
+    print(
+        f"{report['catalog']}: {report['triggers']} triggers "
+        f"({report['known_deviations']} flare-only without longitude and "
+        f"{report['legacy_failures']} the original fails on left out)"
+    )
+    candidates = list(report["deviations"])
+    print(f"{'field':<24}" + "".join(f"{c:>24}" for c in candidates))
+    for field in sorted(report["deviations"][candidates[0]]):
+        cells = []
+        for candidate in candidates:
+            deviation, mismatches = report["deviations"][candidate][field]
+            cells.append(f"{deviation:.3g}" + (f" ({mismatches} None)" if mismatches else ""))
+        print(f"{field:<24}" + "".join(f"{cell:>24}" for cell in cells))
+
+    legacy = report["throughput"]["legacy"]
+    print(f"{'engine':<24}{'triggers/s':>24}{'vs legacy':>24}")
+    for engine, rate in report["throughput"].items():
+        print(f"{engine:<24}{rate:>24.0f}{rate / legacy:>24.1f}")
+    print()
+
+
+if __name__ == "__main__":
+    check_cut_points()
+    check_float32(example_catalog())
+    check_float32(boundary_catalog(100000))
+    print_report(compare("examples", example_catalog()))
+    print_report(compare("boundaries", boundary_catalog(100000)))
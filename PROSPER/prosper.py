@@ -1,8 +1,19 @@
-from math import log, log10, sqrt, exp, pi
-from typing import Any
+import hashlib
+import heapq
+import json
+import sqlite3
+from math import log, log10, log1p, sqrt, exp, expm1, pi, inf, isfinite
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, NamedTuple
 from dateutil import parser as dateparser
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache, wraps
+from itertools import islice, repeat
+from time import perf_counter
+
+import numpy as np
 
 
 @dataclass
@@ -20,4278 +31,3435 @@ class CME:
     start: datetime
 
 
+ENERGIES = (10, 30, 60, 100, 300)
+# The peak-flux band of every energy in sepchars is picked from all of these
+SEPCHARS_PROBABILITIES = (10, 30, 100, 300)
+PEAK_FLUX_LEVELS = ("50cl", "90cl")
 
-def sepprobs(triggers: list[dict[str, Flare | CME]]) -> list[dict[str, Any]]:
-
-    sep_probabilities = []
-
-    # keep only the triggers for which a prediction hasn't already been produced
-
-    for triggerset in triggers:
-        flare = triggerset["flare"]
-        cme = triggerset["cme"]
-        if flare is not None and cme is not None:
-            # Flare & CME
-            if flare.longitude >= 20:
-                # Well Connected Flare
-                if cme.width == 360:
-                    # Halo CME
-
-                    # E>10 MeV
-                    # P(V | SEP)
-                    mean_log_hs_10 = 3.15780115128
-                    sigma_log_hs_10 = 0.17488001287
-                    pdf_halo_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10)
-                                / (sqrt(2) * sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_10 = -4.30615707813
-                    wc_sigma_log_hs_10 = 0.77544026801
-                    pdf_wc_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10)
-                                / (sqrt(2) * wc_sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_10 = 2.91011047363
-                    sigma_log_hns_10 = 0.22652350366
-                    p_halo_not_sep_10 = 0.61870504
-                    pdf_halo_not_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_10)
-                                / (sqrt(2) * sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_10 = -5.47723640282
-                    wc_sigma_log_hns_10 = 0.40369972744
-                    pdf_wc_not_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_10)
-                                / (sqrt(2) * wc_sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.4680851 * pdf_halo_sep_10 * pdf_wc_sep_10
-                    term2 = term1 + (
-                        0.53191489 * pdf_halo_not_sep_10 * pdf_wc_not_sep_10
-                    )
-                    p_sep_10 = term1 / term2
-
-                    # E>30 MeV
-                    # P(V | SEP)
-                    mean_log_hs_30 = 3.18264794350
-                    sigma_log_hs_30 = 0.17392908037
-                    pdf_halo_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_30)
-                                / (sqrt(2) * sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_30 = -4.16030931293
-                    wc_sigma_log_hs_30 = 0.77491862688
-                    pdf_wc_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_30)
-                                / (sqrt(2) * wc_sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_30 = 2.91011047363
-                    sigma_log_hns_30 = 0.22652350366
-                    p_halo_not_sep_30 = 0.61870504
-                    pdf_halo_not_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_30)
-                                / (sqrt(2) * sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_30 = -5.47723640282
-                    wc_sigma_log_hns_30 = 0.40369972744
-                    pdf_wc_not_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_30)
-                                / (sqrt(2) * wc_sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-30)
-                    p_nhalo_sep_10_30 = 0.061151079
-                    mean_log_hs_10_30 = 3.04670405388
-                    sigma_log_hs_10_30 = 0.08136505634
-                    pdf_halo_sep_10_30 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10_30)
-                                / (sqrt(2) * sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-30)
-                    wc_mean_log_hs_10_30 = -4.78902523009
-                    wc_sigma_log_hs_10_30 = 0.60458977795
-                    pdf_wc_sep_10_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10_30)
-                                / (sqrt(2) * wc_sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.4680851 * pdf_halo_sep_30 * pdf_wc_sep_30
-                    term2 = (
-                        term1
-                        + (0.53191489 * pdf_halo_not_sep_30 * pdf_wc_not_sep_30)
-                        + (0.053191489 * pdf_halo_sep_10_30 * pdf_wc_sep_10_30)
-                    )
-                    p_sep_30 = term1 / term2
-
-                    # E>60 MeV
-                    p_sep_60 = 0
-
-                    # E>100 MeV
-                    # P(V | SEP)
-                    mean_log_hs_100 = 3.22216272354
-                    sigma_log_hs_100 = 0.17536236346
-                    pdf_halo_sep_100 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_100 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_100)
-                                / (sqrt(2) * sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_100 = -3.94288784905
-                    wc_sigma_log_hs_100 = 0.71734976905
-                    pdf_wc_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_100)
-                                / (sqrt(2) * wc_sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-100)
-                    mean_log_hs_10_100 = -4.68866759299
-                    sigma_log_hs_10_100 = 0.61025004699
-                    pdf_halo_sep_10_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * sigma_log_hs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - mean_log_hs_10_100)
-                                / (sqrt(2) * sigma_log_hs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-100)
-                    mean_log_nhs_10_100 = 3.10820102692
-                    sigma_log_nhs_10_100 = 0.14900480211
-                    pdf_nhalo_sep_10_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_nhs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_nhs_10_100)
-                                / (sqrt(2) * sigma_log_nhs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_100 = 2.91011047363
-                    sigma_log_hns_100 = 0.22652350366
-                    p_halo_not_sep_100 = 0.61870504
-                    pdf_halo_not_sep_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_100)
-                                / (sqrt(2) * sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_100 = -5.46471549786
-                    wc_sigma_log_hns_100 = 0.40609458630
-                    pdf_wc_not_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_100)
-                                / (sqrt(2) * wc_sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.287234 * pdf_halo_sep_100 * pdf_wc_sep_100
-                    term2 = (
-                        term1
-                        + (0.712765 * pdf_halo_not_sep_100 * pdf_wc_not_sep_100)
-                        + (0.18085106 * pdf_nhalo_sep_10_100 * pdf_halo_sep_10_100)
-                    )
-                    p_sep_100 = term1 / term2
-
-                    # E>300 MeV
-                    # P(V | SEP)
-                    mean_log_hs_300 = 3.29878282547
-                    sigma_log_hs_300 = 0.11873473972
-                    pdf_halo_sep_300 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_300 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_300)
-                                / (sqrt(2) * sigma_log_hs_300)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_300 = -3.45311151509
-                    wc_sigma_log_hs_300 = 0.47153478691
-                    pdf_wc_sep_300 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_300)
-                                / (sqrt(2) * wc_sigma_log_hs_300)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-300)
-                    mean_log_hs_10_300 = -4.23701745383
-                    sigma_log_hs_10_300 = 0.48230103188
-                    p_halo_sep_10_300 = 0.068269977
-                    pdf_halo_sep_10_300 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * sigma_log_hs_10_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - mean_log_hs_10_300)
-                                / (sqrt(2) * sigma_log_hs_10_300)
-                            )
-                            ** 2
-                        )
-                    )
 
-                    # P(V | SEP10-300)
-                    mean_log_hs_10_300 = 3.13173818588
-                    sigma_log_hs_10_300 = 0.16359749436
-                    ######################## BUG: Maybe an error???? line 546 in IDL file (flare + cme)
-                    pdf_halo_wc_sep_10_300 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * sigma_log_hs_10_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - mean_log_hs_10_300)
-                                / (sqrt(2) * sigma_log_hs_10_300)
-                            )
-                            ** 2
-                        )
-                    )
+def _energy_mask(energies: tuple[int, ...] | list[int] | None) -> tuple[bool, ...]:
+    # Which entries of ENERGIES are requested (all of them for None)
+    if energies is None:
+        return (True,) * len(ENERGIES)
+    return _cached_energy_mask(tuple(energies))
 
-                    # P(V | NOT SEP)
-                    mean_log_hns_300 = 2.91011047363
-                    sigma_log_hns_300 = 0.22652350366
-                    p_halo_not_sep_300 = 0.61870504
-                    pdf_halo_not_sep_300 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hns_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_300)
-                                / (sqrt(2) * sigma_log_hns_300)
-                            )
-                            ** 2
-                        )
-                    )
 
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_300 = -5.46471549786
-                    wc_sigma_log_hns_300 = 0.40609458630
-                    pdf_wc_not_sep_300 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_300)
-                                / (sqrt(2) * wc_sigma_log_hns_300)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.12698413 * pdf_halo_sep_30 * pdf_wc_sep_30
-                    term2 = (
-                        term1
-                        + (0.87301587 * pdf_halo_not_sep_30 * pdf_wc_not_sep_30)
-                        + (
-                            0.47619048
-                            * pdf_halo_wc_sep_10_300
-                            * pdf_halo_sep_10_300
-                        )
-                    )
-                    p_sep_300 = term1 / term2
-
-                    # Advanced Warnign Time (AWT) in minutes for each integral energy for Non Halo CMEs
-                    awt_10 = 189.78  # mean value from statistics
-                    awt_30 = 170.35  # dummy
-                    awt_60 = 132.58  # dummy
-                    awt_100 = 112.72  # dummy
-                    awt_300 = 98.32  # dummy
-
-                    # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Non Halo CMEs
-                    p_error_10 = (0.019044089, 0.016825785, 0.015605077)
-                    p_error_30 = (0.0017833936, 0.0014276593, 0.0012886692)
-                    p_error_60 = (0.00029824883, 0.00040755684, 0.00049231248)
-                    p_error_100 = (0.0050464103, 0.0037166936, 0.0032635845)
-                    p_error_300 = (None, None, None)
-                elif 120 <= cme.width < 360:
-                    # Partial Halo CME
-
-                    # E>10 MeV
-                    # P(V | SEP)
-                    mean_log_hs_10 = 3.02453112602
-                    sigma_log_hs_10 = 0.23913200200
-                    pdf_halo_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10)
-                                / (sqrt(2) * sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_10 = -4.30615707813
-                    wc_sigma_log_hs_10 = 0.77544026801
-                    pdf_wc_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10)
-                                / (sqrt(2) * wc_sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_10 = 2.74093413353
-                    sigma_log_hns_10 = 0.22231969237
-                    p_halo_not_sep_10 = 0.90886700
-                    pdf_halo_not_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_10)
-                                / (sqrt(2) * sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_10 = -5.47723640282
-                    wc_sigma_log_hns_10 = 0.40369972744
-                    pdf_wc_not_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_10)
-                                / (sqrt(2) * wc_sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.15789474 * pdf_halo_sep_10 * pdf_wc_sep_10
-                    term2 = term1 + (
-                        0.84210526 * pdf_halo_not_sep_10 * pdf_wc_not_sep_10
-                    )
-                    p_sep_10 = term1 / term2
-
-                    # E>30 MeV
-                    # P(V | SEP)
-                    mean_log_hs_30 = 3.02310156822
-                    sigma_log_hs_30 = 0.25269654393
-                    pdf_halo_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_30)
-                                / (sqrt(2) * sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_30 = -4.16030931293
-                    wc_sigma_log_hs_30 = 0.77491862688
-                    pdf_wc_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_30)
-                                / (sqrt(2) * wc_sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
+@lru_cache(maxsize=64)
+def _cached_energy_mask(energies: tuple[int, ...]) -> tuple[bool, ...]:
+    unknown = set(energies) - set(ENERGIES)
+    if unknown:
+        raise ValueError(f"Unknown energy channels {sorted(unknown)}, expected some of {ENERGIES}.")
+    return tuple(energy in energies for energy in ENERGIES)
 
-                    # P(V | NOT SEP)
-                    mean_log_hns_30 = 2.74093413353
-                    sigma_log_hns_30 = 0.22231969237
-                    p_halo_not_sep_30 = 0.90886700
-                    pdf_halo_not_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_30)
-                                / (sqrt(2) * sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_30 = -5.47723640282
-                    wc_sigma_log_hns_30 = 0.40369972744
-                    pdf_wc_not_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_30)
-                                / (sqrt(2) * wc_sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-30)
-                    mean_log_hs_10_30 = 2.98286390305
-                    sigma_log_hs_10_30 = 0.20173968375
-                    pdf_halo_sep_10_30 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10_30)
-                                / (sqrt(2) * sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-30)
-                    wc_mean_log_hs_10_30 = -4.78902523009
-                    wc_sigma_log_hs_10_30 = 0.60458977795
-                    pdf_wc_sep_10_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10_30)
-                                / (sqrt(2) * wc_sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.13815789 * pdf_halo_sep_30 * pdf_wc_sep_30
-                    term2 = (
-                        term1
-                        + (0.86184211 * pdf_halo_not_sep_30 * pdf_wc_not_sep_30)
-                        + (0.019736842 * pdf_halo_sep_10_30 * pdf_wc_sep_10_30)
-                    )
-                    p_sep_30 = term1 / term2
-
-                    # E>60 MeV
-                    p_sep_60 = 0
-
-                    # E>100 MeV
-                    # P(V | SEP)
-                    mean_log_hs_100 = 3.04320573807
-                    sigma_log_hs_100 = 0.20936892927
-                    pdf_halo_sep_100 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_100 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_100)
-                                / (sqrt(2) * sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_100 = -3.94288784905
-                    wc_sigma_log_hs_100 = 0.71734976905
-                    pdf_wc_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_100)
-                                / (sqrt(2) * wc_sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-100)
-                    mean_log_hs_10_100 = -4.68866759299
-                    sigma_log_hs_10_100 = 0.61025004699
-                    pdf_wc_sep_10_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * sigma_log_hs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - mean_log_hs_10_100)
-                                / (sqrt(2) * sigma_log_hs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-100)
-                    mean_log_hs_10_100 = 3.00515580177
-                    sigma_log_hs_10_100 = 0.24573022127
-                    pdf_halo_sep_10_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10_100)
-                                / (sqrt(2) * sigma_log_hs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_100 = 2.74093413353
-                    sigma_log_hns_100 = 0.22231969237
-                    p_halo_not_sep_100 = 0.90886700
-                    pdf_halo_not_sep_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_100)
-                                / (sqrt(2) * sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_100 = -5.46471549786
-                    wc_sigma_log_hns_100 = 0.40609458630
-                    pdf_wc_not_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_100)
-                                / (sqrt(2) * wc_sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.059210526 * pdf_halo_sep_100 * pdf_wc_sep_100
-                    term2 = (
-                        term1
-                        + (0.940789474 * pdf_halo_not_sep_100 * pdf_wc_not_sep_100)
-                        + (0.098684211 * pdf_halo_sep_10_100 * pdf_wc_sep_10_100)
-                    )
-                    p_sep_100 = term1 / term2
-
-                    # E>300 MeV
-                    p_sep_300 = 0
-
-                    # Advanced Warnign Time (AWT) in minutes for each integral energy for Non Halo CMEs
-                    awt_10 = 189.78  # mean value from statistics
-                    awt_30 = 170.35  # dummy
-                    awt_60 = 132.58  # dummy
-                    awt_100 = 112.72  # dummy
-                    awt_300 = 98.32  # dummy
-
-                    # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Non Halo CMEs
-                    p_error_10 = (0.019044089, 0.016825785, 0.015605077)
-                    p_error_30 = (0.0017833936, 0.0014276593, 0.0012886692)
-                    p_error_60 = (0.00029824883, 0.00040755684, 0.00049231248)
-                    p_error_100 = (0.0050464103, 0.0037166936, 0.0032635845)
-                    p_error_300 = (None, None, None)
-                else:
-                    # Non Halo CME
-
-                    # E>10 MeV
-                    # P(V | SEP)
-                    mean_log_hs_10 = 2.82257556915
-                    sigma_log_hs_10 = 0.27493494749
-                    pdf_halo_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10)
-                                / (sqrt(2) * sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_10 = -4.30615707813
-                    wc_sigma_log_hs_10 = 0.77544026801
-                    pdf_wc_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10)
-                                / (sqrt(2) * wc_sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_10 = 2.56826519966
-                    sigma_log_hns_10 = 0.22966578603
-                    p_halo_not_sep_10 = 0.99501992
-                    pdf_halo_not_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_10)
-                                / (sqrt(2) * sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_10 = -5.47723640282
-                    wc_sigma_log_hns_10 = 0.40369972744
-                    pdf_wc_not_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_10)
-                                / (sqrt(2) * wc_sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.0067057837 * pdf_halo_sep_10 * pdf_wc_sep_10
-                    term2 = term1 + (
-                        0.9932942163 * pdf_halo_not_sep_10 * pdf_wc_not_sep_10
-                    )
-                    p_sep_10 = term1 / term2
-
-                    # E>30 MeV
-                    # P(V | SEP)
-                    mean_log_hs_30 = 2.87594962120
-                    sigma_log_hs_30 = 0.29943174124
-                    pdf_halo_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_30)
-                                / (sqrt(2) * sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_30 = -4.16030931293
-                    wc_sigma_log_hs_30 = 0.77491862688
-                    pdf_wc_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_30)
-                                / (sqrt(2) * wc_sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_30 = 2.56826519966
-                    sigma_log_hns_30 = 0.22966578603
-                    p_halo_not_sep_30 = 0.99501992
-                    pdf_halo_not_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_30)
-                                / (sqrt(2) * sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_30 = -5.47723640282
-                    wc_sigma_log_hns_30 = 0.40369972744
-                    pdf_wc_not_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_30)
-                                / (sqrt(2) * wc_sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-30)
-                    mean_log_hs_10_30 = 2.70479297638
-                    sigma_log_hs_10_30 = 0.21277628839
-                    pdf_halo_sep_10_30 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10_30)
-                                / (sqrt(2) * sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-30)
-                    wc_mean_log_hs_10_30 = -4.78902523009
-                    wc_sigma_log_hs_10_30 = 0.60458977795
-                    pdf_wc_sep_10_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10_30)
-                                / (sqrt(2) * wc_sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.0041911148 * pdf_halo_sep_30 * pdf_wc_sep_30
-                    term2 = (
-                        term1
-                        + (0.9958088852 * pdf_halo_not_sep_30 * pdf_wc_not_sep_30)
-                        + (0.0025146689 * pdf_halo_sep_10_30 * pdf_wc_sep_10_30)
-                    )
-                    p_sep_30 = term1 / term2
-
-                    # E>60 MeV
-                    p_sep_60 = 0
-
-                    # E>100 MeV
-                    # P(V | SEP)
-                    mean_log_hs_100 = 2.78089141846
-                    sigma_log_hs_100 = 0.46015313268
-                    pdf_halo_sep_100 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_100 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_100)
-                                / (sqrt(2) * sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_100 = -3.94288784905
-                    wc_sigma_log_hs_100 = 0.71734976905
-                    pdf_wc_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_100)
-                                / (sqrt(2) * wc_sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-100)
-                    mean_log_hs_10_100 = 2.78115367889
-                    sigma_log_hs_10_100 = 0.21313931048
-                    pdf_halo_sep_10_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10_100)
-                                / (sqrt(2) * sigma_log_hs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-100)
-                    wc_mean_log_hs_10_100 = -4.68866759299
-                    wc_sigma_log_hs_10_100 = 0.61025004699
-                    pdf_wc_sep_10_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10_100)
-                                / (sqrt(2) * wc_sigma_log_hs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_100 = 2.56826519966
-                    sigma_log_hns_100 = 0.22966578603
-                    p_halo_not_sep_100 = 0.99501992
-                    pdf_halo_not_sep_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_100)
-                                / (sqrt(2) * sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_100 = -5.46471549786
-                    wc_sigma_log_hns_100 = 0.40609458630
-                    pdf_wc_not_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_100)
-                                / (sqrt(2) * wc_sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.0033528919 * pdf_halo_sep_100 * pdf_wc_sep_100
-                    term2 = (
-                        term1
-                        + (0.9966471081 * pdf_halo_not_sep_100 * pdf_wc_not_sep_100)
-                        + (0.0033528919 * pdf_halo_sep_10_100 * pdf_wc_sep_10_100)
-                    )
-                    p_sep_100 = term1 / term2
-
-                    # E>300 MeV
-                    p_sep_300 = 0
-
-                    # Advanced Warnign Time (AWT) in minutes for each integral energy for Non Halo CMEs
-                    awt_10 = 189.78  # mean value from statistics
-                    awt_30 = 170.35  # dummy
-                    awt_60 = 132.58  # dummy
-                    awt_100 = 112.72  # dummy
-                    awt_300 = 98.32  # dummy
-
-                    # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Non Halo CMEs
-                    p_error_10 = (0.019044089, 0.016825785, 0.015605077)
-                    p_error_30 = (0.0017833936, 0.0014276593, 0.0012886692)
-                    p_error_60 = (0.00029824883, 0.00040755684, 0.00049231248)
-                    p_error_100 = (0.0050464103, 0.0037166936, 0.0032635845)
-                    p_error_300 = (None, None, None)
-            else:
-                # Poorly Connected Flare
-                if cme.width == 360:
-                    # Halo CME
-
-                    # E>10 MeV
-                    # P(V | SEP)
-                    mean_log_hs_10 = 3.15780115128
-                    sigma_log_hs_10 = 0.17488001287
-                    pdf_halo_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10)
-                                / (sqrt(2) * sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_10 = -4.16627093702
-                    wc_sigma_log_hs_10 = 0.71992156865
-                    pdf_wc_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10)
-                                / (sqrt(2) * wc_sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
 
-                    # P(V | NOT SEP)
-                    mean_log_hns_10 = 2.91011047363
-                    sigma_log_hns_10 = 0.22652350366
-                    p_halo_not_sep_10 = 0.61870504
-                    pdf_halo_not_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_10)
-                                / (sqrt(2) * sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_10 = -5.49096499172
-                    wc_sigma_log_hns_10 = 0.39712862763
-                    pdf_wc_not_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_10)
-                                / (sqrt(2) * wc_sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.28235294 * pdf_halo_sep_10 * pdf_wc_sep_10
-                    term2 = term1 + (
-                        0.71764706 * pdf_halo_not_sep_10 * pdf_wc_not_sep_10
-                    )
-                    p_sep_10 = term1 / term2
-
-                    # E>30 MeV
-                    # P(V | SEP)
-                    mean_log_hs_30 = 3.18264794350
-                    sigma_log_hs_30 = 0.17392908037
-                    pdf_halo_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_30)
-                                / (sqrt(2) * sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_30 = -4.01889502483
-                    wc_sigma_log_hs_30 = 0.64946127335
-                    pdf_wc_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_30)
-                                / (sqrt(2) * wc_sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-30)
-                    p_nhalo_sep_10_30 = 0.061151079
-                    mean_log_hs_10_30 = 3.04670405388
-                    sigma_log_hs_10_30 = 0.08136505634
-                    pdf_halo_sep_10_30 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10_30)
-                                / (sqrt(2) * sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-30)
-                    wc_mean_log_hs_10_30 = -4.50200834019
-                    wc_sigma_log_hs_10_30 = 0.60458977795
-                    pdf_pc_sep_10_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10_30)
-                                / (sqrt(2) * wc_sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_30 = 2.91011047363
-                    sigma_log_hns_30 = 0.22652350366
-                    p_halo_not_sep_30 = 0.61870504
-                    pdf_halo_not_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_30)
-                                / (sqrt(2) * sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_30 = -5.49096499172
-                    wc_sigma_log_hns_30 = 0.39712862763
-                    pdf_wc_not_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_30)
-                                / (sqrt(2) * wc_sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.21764706 * pdf_halo_sep_30 * pdf_wc_sep_30
-                    term2 = (
-                        term1
-                        + (0.78235294 * pdf_halo_not_sep_30 * pdf_wc_not_sep_30)
-                        + (0.064705882 * pdf_halo_sep_10_30 * pdf_pc_sep_10_30)
-                    )
-                    p_sep_30 = term1 / term2
-
-                    # E>60 MeV
-                    p_sep_60 = 0
-
-                    # E>100 MeV
-                    # P(V | SEP)
-                    mean_log_hs_100 = 3.22216272354
-                    sigma_log_hs_100 = 0.17536236346
-                    pdf_halo_sep_100 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_100 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_100)
-                                / (sqrt(2) * sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_100 = -3.84450553191
-                    wc_sigma_log_hs_100 = 0.75770488028
-                    pdf_wc_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_100)
-                                / (sqrt(2) * wc_sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-100)
-                    mean_log_hs_10_100 = -4.28984644442
-                    sigma_log_hs_10_100 = 0.64620449520
-                    pdf_halo_sep_10_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * sigma_log_hs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - mean_log_hs_10_100)
-                                / (sqrt(2) * sigma_log_hs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-100)
-                    mean_log_nhs_10_100 = 3.10820102692
-                    sigma_log_nhs_10_100 = 0.14900480211
-                    pdf_nhalo_sep_10_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_nhs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_nhs_10_100)
-                                / (sqrt(2) * sigma_log_nhs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_100 = 2.91011047363
-                    sigma_log_hns_100 = 0.22652350366
-                    p_halo_not_sep_100 = 0.61870504
-                    pdf_halo_not_sep_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_100)
-                                / (sqrt(2) * sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_100 = -5.51027933809
-                    wc_sigma_log_hns_100 = 0.38777545772
-                    pdf_wc_not_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_100)
-                                / (sqrt(2) * wc_sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.094117647 * pdf_halo_sep_30 * pdf_wc_sep_30
-                    term2 = (
-                        term1
-                        + (0.905882353 * pdf_halo_not_sep_30 * pdf_wc_not_sep_30)
-                        + (0.18823529 * pdf_nhalo_sep_10_100 * pdf_halo_sep_10_100)
-                    )
-                    p_sep_100 = term1 / term2
-
-                    # E>300 MeV
-                    # P(V | SEP)
-                    mean_log_hs_300 = 3.29878282547
-                    sigma_log_hs_300 = 0.11873473972
-                    pdf_halo_sep_300 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_300 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_300)
-                                / (sqrt(2) * sigma_log_hs_300)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_300 = -3.21840130251
-                    wc_sigma_log_hs_300 = 0.40466116203
-                    pdf_wc_sep_300 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_300)
-                                / (sqrt(2) * wc_sigma_log_hs_300)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-300)
-                    mean_log_hs_10_300 = -4.23292661895
-                    sigma_log_hs_10_300 = 0.68785341383
-                    p_halo_sep_10_300 = 0.055664063
-                    pdf_halo_sep_10_300 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * sigma_log_hs_10_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - mean_log_hs_10_300)
-                                / (sqrt(2) * sigma_log_hs_10_300)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-300)
-                    mean_log_hs_10_300 = 3.13173818588
-                    sigma_log_hs_10_300 = 0.16359749436
-                    ######################## BUG: Maybe an error???? line 1709 in IDL file (flare + cme)
-                    pdf_halo_wc_sep_10_300 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * sigma_log_hs_10_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - mean_log_hs_10_300)
-                                / (sqrt(2) * sigma_log_hs_10_300)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_300 = 2.91011047363
-                    sigma_log_hns_300 = 0.22652350366
-                    p_halo_not_sep_300 = 0.61870504
-                    pdf_halo_not_sep_300 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hns_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_300)
-                                / (sqrt(2) * sigma_log_hns_300)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_300 = -5.51027933809
-                    wc_sigma_log_hns_300 = 0.38777545772
-                    pdf_wc_not_sep_300 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_300
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_300)
-                                / (sqrt(2) * wc_sigma_log_hns_300)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.058823529 * pdf_halo_sep_300 * pdf_wc_sep_300
-                    term2 = (
-                        term1
-                        + (0.941176471 * pdf_halo_not_sep_300 * pdf_wc_not_sep_300)
-                        + (
-                            0.049019608
-                            * pdf_halo_wc_sep_10_300
-                            * pdf_halo_sep_10_300
-                        )
-                    )
-                    p_sep_300 = term1 / term2
-
-                    # Advanced Warnign Time (AWT) in minutes for each integral energy for Non Halo CMEs
-                    awt_10 = 189.78  # mean value from statistics
-                    awt_30 = 170.35  # dummy
-                    awt_60 = 132.58  # dummy
-                    awt_100 = 112.72  # dummy
-                    awt_300 = 98.32  # dummy
-
-                    # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Non Halo CMEs
-                    p_error_10 = (0.019044089, 0.016825785, 0.015605077)
-                    p_error_30 = (0.0017833936, 0.0014276593, 0.0012886692)
-                    p_error_60 = (0.00029824883, 0.00040755684, 0.00049231248)
-                    p_error_100 = (0.0050464103, 0.0037166936, 0.0032635845)
-                    p_error_300 = (None, None, None)
-                elif 120 <= cme.width < 360:
-                    # Partial Halo CME
-
-                    # E>10 MeV
-                    # P(V | SEP)
-                    mean_log_hs_10 = 3.02453112602
-                    sigma_log_hs_10 = 0.23913200200
-                    pdf_halo_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10)
-                                / (sqrt(2) * sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_10 = -4.16627093702
-                    wc_sigma_log_hs_10 = 0.71992156865
-                    pdf_wc_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10)
-                                / (sqrt(2) * wc_sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_10 = 2.74093413353
-                    sigma_log_hns_10 = 0.22231969237
-                    p_halo_not_sep_10 = 0.90886700
-                    pdf_halo_not_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_10)
-                                / (sqrt(2) * sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_10 = -5.49096499172
-                    wc_sigma_log_hns_10 = 0.39712862763
-                    pdf_wc_not_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_10)
-                                / (sqrt(2) * wc_sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.012295082 * pdf_halo_sep_10 * pdf_wc_sep_10
-                    term2 = term1 + (
-                        0.987704918 * pdf_halo_not_sep_10 * pdf_wc_not_sep_10
-                    )
-                    p_sep_10 = term1 / term2
-
-                    # E>30 MeV
-                    # P(V | SEP)
-                    mean_log_hs_30 = 3.02310156822
-                    sigma_log_hs_30 = 0.25269654393
-                    pdf_halo_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_30)
-                                / (sqrt(2) * sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_30 = -4.01889502483
-                    wc_sigma_log_hs_30 = 0.64946127335
-                    pdf_wc_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_30)
-                                / (sqrt(2) * wc_sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-30)
-                    mean_log_hs_10_30 = 2.98286390305
-                    sigma_log_hs_10_30 = 0.20173968375
-                    pdf_halo_sep_10_30 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10_30)
-                                / (sqrt(2) * sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-30)
-                    wc_mean_log_hs_10_30 = -4.50200834019
-                    wc_sigma_log_hs_10_30 = 0.60458977795
-                    pdf_wc_sep_10_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10_30)
-                                / (sqrt(2) * wc_sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_30 = 2.74093413353
-                    sigma_log_hns_30 = 0.22231969237
-                    p_halo_not_sep_30 = 0.90886700
-                    pdf_halo_not_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_30)
-                                / (sqrt(2) * sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_30 = -5.49096499172
-                    wc_sigma_log_hns_30 = 0.39712862763
-                    pdf_wc_not_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_30)
-                                / (sqrt(2) * wc_sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.0081967213 * pdf_halo_sep_30 * pdf_wc_sep_30
-                    term2 = (
-                        term1
-                        + (0.9918032787 * pdf_halo_not_sep_30 * pdf_wc_not_sep_30)
-                        + (0.0040983607 * pdf_wc_sep_10_30 * pdf_halo_sep_10_30)
-                    )
-                    p_sep_30 = term1 / term2
-
-                    # E>60 MeV
-                    p_sep_60 = 0
-
-                    # E>100 MeV
-                    # P(V | SEP)
-                    mean_log_hs_100 = 3.04320573807
-                    sigma_log_hs_100 = 0.20936892927
-                    pdf_halo_sep_100 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_100 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_100)
-                                / (sqrt(2) * sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_100 = -3.84450553191
-                    wc_sigma_log_hs_100 = 0.75770488028
-                    pdf_wc_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_100)
-                                / (sqrt(2) * wc_sigma_log_hs_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-100)
-                    mean_log_hs_10_100 = -4.28984644442
-                    sigma_log_hs_10_100 = 0.64620449520
-                    pdf_wc_sep_10_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * sigma_log_hs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - mean_log_hs_10_100)
-                                / (sqrt(2) * sigma_log_hs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-100)
-                    mean_log_hs_10_100 = 3.00515580177
-                    sigma_log_hs_10_100 = 0.24573022127
-                    pdf_halo_sep_10_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hs_10_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10_100)
-                                / (sqrt(2) * sigma_log_hs_10_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_100 = 2.74093413353
-                    sigma_log_hns_100 = 0.22231969237
-                    p_halo_not_sep_100 = 0.90886700
-                    pdf_halo_not_sep_100 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_100)
-                                / (sqrt(2) * sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_100 = -5.51027933809
-                    wc_sigma_log_hns_100 = 0.38777545772
-                    pdf_wc_not_sep_100 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_100
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_100)
-                                / (sqrt(2) * wc_sigma_log_hns_100)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    p_sep_100 = 0
-
-                    # E>300 MeV
-                    p_sep_300 = 0
-
-                    # Advanced Warnign Time (AWT) in minutes for each integral energy for Non Halo CMEs
-                    awt_10 = 189.78  # mean value from statistics
-                    awt_30 = 170.35  # dummy
-                    awt_60 = 132.58  # dummy
-                    awt_100 = 112.72  # dummy
-                    awt_300 = 98.32  # dummy
-
-                    # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Non Halo CMEs
-                    p_error_10 = (0.019044089, 0.016825785, 0.015605077)
-                    p_error_30 = (0.0017833936, 0.0014276593, 0.0012886692)
-                    p_error_60 = (0.00029824883, 0.00040755684, 0.00049231248)
-                    p_error_100 = (0.0050464103, 0.0037166936, 0.0032635845)
-                    p_error_300 = (None, None, None)
-                else:
-                    # Non Halo CME
-
-                    # E>10 MeV
-                    # P(V | SEP)
-                    mean_log_hs_10 = 2.82257556915
-                    sigma_log_hs_10 = 0.27493494749
-                    pdf_halo_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hs_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10)
-                                / (sqrt(2) * sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_10 = -4.16627093702
-                    wc_sigma_log_hs_10 = 0.71992156865
-                    p_halo_sep_10 = 0.018457044
-                    pdf_wc_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10)
-                                / (sqrt(2) * wc_sigma_log_hs_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_10 = 2.56826519966
-                    sigma_log_hns_10 = 0.22966578603
-                    p_halo_not_sep_10 = 0.99501992
-                    pdf_halo_not_sep_10 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_10 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_10)
-                                / (sqrt(2) * sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_10 = -5.49096499172
-                    wc_sigma_log_hns_10 = 0.39712862763
-                    pdf_wc_not_sep_10 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_10
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_10)
-                                / (sqrt(2) * wc_sigma_log_hns_10)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.00054585153 * pdf_halo_sep_10 * pdf_wc_sep_10
-                    term2 = term1 + (
-                        0.99945414847 * pdf_halo_not_sep_10 * pdf_wc_not_sep_10
-                    )
-                    p_sep_10 = term1 / term2
-
-                    # E>30 MeV
-                    # P(V | SEP)
-                    mean_log_nhs_30 = 2.87594962120
-                    sigma_log_nhs_30 = 0.29943174124
-                    pdf_halo_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_nhs_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_nhs_30)
-                                / (sqrt(2) * sigma_log_nhs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP)
-                    wc_mean_log_hs_30 = -4.01889502483
-                    wc_sigma_log_hs_30 = 0.64946127335
-                    pdf_wc_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_30)
-                                / (sqrt(2) * wc_sigma_log_hs_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | SEP10-30)
-                    p_nhalo_sep_10_30 = 0.061151079
-                    mean_log_hs_10_30 = 3.04670405388
-                    sigma_log_hs_10_30 = 0.08136505634
-                    pdf_halo_sep_10_30 = (
-                        1.0
-                        / (
-                            cme.velocity
-                            * sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hs_10_30)
-                                / (sqrt(2) * sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(F | SEP10-30)
-                    wc_mean_log_hs_10_30 = -4.50200834019
-                    wc_sigma_log_hs_10_30 = 0.60458977795
-                    pdf_pc_sep_10_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hs_10_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hs_10_30)
-                                / (sqrt(2) * wc_sigma_log_hs_10_30)
-                            )
-                            ** 2
-                        )
-                    )
-
-                    # P(V | NOT SEP)
-                    mean_log_hns_30 = 2.70479297638
-                    sigma_log_hns_30 = 0.21277628839
-                    p_halo_not_sep_30 = 0.0019920319
-                    pdf_halo_not_sep_30 = (
-                        1.0
-                        / (cme.velocity * sigma_log_hns_30 * log(10) * sqrt(2 * pi))
-                    ) * exp(
-                        -(
-                            (
-                                (log10(cme.velocity) - mean_log_hns_30)
-                                / (sqrt(2) * sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
+@dataclass
+class LogNormal:
+    # Log-normal PDF of a trigger property ("velocity" or "magnitude")
+    variable: str
+    mean: float
+    sigma: float
 
-                    # P(F | NOT SEP)
-                    wc_mean_log_hns_30 = -5.49096499172
-                    wc_sigma_log_hns_30 = 0.39712862763
-                    pdf_wc_not_sep_30 = (
-                        1.0
-                        / (
-                            flare.magnitude
-                            * wc_sigma_log_hns_30
-                            * log(10)
-                            * sqrt(2 * pi)
-                        )
-                    ) * exp(
-                        -(
-                            (
-                                (log10(flare.magnitude) - wc_mean_log_hns_30)
-                                / (sqrt(2) * wc_sigma_log_hns_30)
-                            )
-                            ** 2
-                        )
-                    )
 
-                    # Probability of SEP occurrence based on V, F  P(SEP | V, F)
-                    # P(SEP | V, F) = P(SEP) P(V | SEP) P (F | SEP) / P(SEP) P(V | SEP) P (F | SEP) + P(NOT SEP) P(V | NOT SEP) P (F |NOT SEP)
-                    term1 = 0.00054585153 * pdf_halo_sep_30 * pdf_wc_sep_30
-                    term2 = (
-                        term1
-                        + (0.99945414847 * pdf_halo_not_sep_30 * pdf_wc_not_sep_30)
-                        + (0.0 * pdf_pc_sep_10_30 * pdf_halo_sep_10_30)
-                    )
-                    p_sep_30 = term1 / term2
+@dataclass
+class Population:
+    # P(population) P(property | population) ...
+    prior: float
+    pdfs: tuple[LogNormal, ...]
 
-                    # E>60 MeV
-                    p_sep_60 = 0
 
-                    # E>100 MeV
-                    p_sep_100 = 0
+@dataclass
+class Regime:
+    inputs: str  # "flare & cme", "flare", "cme" or "none"
+    connectivity: str | None  # "well" or "poor" connected flare
+    cme_class: str | None  # "halo", "partial halo" or "non halo" CME
+    # Per energy: the SEP population first, then the competing ones;
+    # a constant (or None) for channels the regime has no model for
+    channels: dict[int, tuple[Population, ...] | float | None]
+    # Advanced Warning Time (AWT) in minutes per energy
+    awt: dict[int, float] | None
+    # Errors (1 sigma), (2 sigma), (3 sigma) per energy
+    p_error: dict[int, tuple[float | None, ...]] | None
+
+
+# Advanced Warning Time (AWT) in minutes for each integral energy for Non
+# Halo CMEs, also used by every Flare & CME regime
+_AWT_NON_HALO = {10: 189.78, 30: 170.35, 60: 132.58, 100: 112.72, 300: 98.32}
+
+# Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Non Halo CMEs
+_P_ERROR_NON_HALO = {
+    10: (0.019044089, 0.016825785, 0.015605077),
+    30: (0.0017833936, 0.0014276593, 0.0012886692),
+    60: (0.00029824883, 0.00040755684, 0.00049231248),
+    100: (0.0050464103, 0.0037166936, 0.0032635845),
+    300: (None, None, None),
+}
+
+
+REGIMES: tuple[Regime, ...] = (
+    # Flare & CME, Well Connected Flare, Halo CME
+    Regime(
+        inputs="flare & cme",
+        connectivity="well",
+        cme_class="halo",
+        channels={
+            10: (
+                # SEP
+                Population(0.4680851, (
+                    LogNormal("velocity", 3.15780115128, 0.17488001287),
+                    LogNormal("magnitude", -4.30615707813, 0.77544026801),
+                )),
+                # NOT SEP
+                Population(0.53191489, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                    LogNormal("magnitude", -5.47723640282, 0.40369972744),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.4680851, (
+                    LogNormal("velocity", 3.1826479435, 0.17392908037),
+                    LogNormal("magnitude", -4.16030931293, 0.77491862688),
+                )),
+                # NOT SEP
+                Population(0.53191489, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                    LogNormal("magnitude", -5.47723640282, 0.40369972744),
+                )),
+                # SEP10-30
+                Population(0.053191489, (
+                    LogNormal("velocity", 3.04670405388, 0.08136505634),
+                    LogNormal("magnitude", -4.78902523009, 0.60458977795),
+                )),
+            ),
+            60: 0,
+            100: (
+                # SEP
+                Population(0.287234, (
+                    LogNormal("velocity", 3.22216272354, 0.17536236346),
+                    LogNormal("magnitude", -3.94288784905, 0.71734976905),
+                )),
+                # NOT SEP
+                Population(0.712765, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                    LogNormal("magnitude", -5.46471549786, 0.4060945863),
+                )),
+                # SEP10-100
+                Population(0.18085106, (
+                    LogNormal("velocity", 3.10820102692, 0.14900480211),
+                    LogNormal("magnitude", -4.68866759299, 0.61025004699),
+                )),
+            ),
+            300: (
+                # SEP (E>30 MeV PDFs)
+                Population(0.12698413, (
+                    LogNormal("velocity", 3.1826479435, 0.17392908037),
+                    LogNormal("magnitude", -4.16030931293, 0.77491862688),
+                )),
+                # NOT SEP
+                Population(0.87301587, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                    LogNormal("magnitude", -5.47723640282, 0.40369972744),
+                )),
+                # SEP10-300
+                ######################## BUG: Maybe an error???? line 546 in IDL file (flare + cme)
+                # P(V | SEP10-300) is evaluated at the flare magnitude
+                Population(0.47619048, (
+                    LogNormal("magnitude", 3.13173818588, 0.16359749436),
+                    LogNormal("magnitude", -4.23701745383, 0.48230103188),
+                )),
+            ),
+        },
+        awt=_AWT_NON_HALO,
+        p_error=_P_ERROR_NON_HALO,
+    ),
+    # Flare & CME, Well Connected Flare, Partial Halo CME
+    Regime(
+        inputs="flare & cme",
+        connectivity="well",
+        cme_class="partial halo",
+        channels={
+            10: (
+                # SEP
+                Population(0.15789474, (
+                    LogNormal("velocity", 3.02453112602, 0.239132002),
+                    LogNormal("magnitude", -4.30615707813, 0.77544026801),
+                )),
+                # NOT SEP
+                Population(0.84210526, (
+                    LogNormal("velocity", 2.74093413353, 0.22231969237),
+                    LogNormal("magnitude", -5.47723640282, 0.40369972744),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.13815789, (
+                    LogNormal("velocity", 3.02310156822, 0.25269654393),
+                    LogNormal("magnitude", -4.16030931293, 0.77491862688),
+                )),
+                # NOT SEP
+                Population(0.86184211, (
+                    LogNormal("velocity", 2.74093413353, 0.22231969237),
+                    LogNormal("magnitude", -5.47723640282, 0.40369972744),
+                )),
+                # SEP10-30
+                Population(0.019736842, (
+                    LogNormal("velocity", 2.98286390305, 0.20173968375),
+                    LogNormal("magnitude", -4.78902523009, 0.60458977795),
+                )),
+            ),
+            60: 0,
+            100: (
+                # SEP
+                Population(0.059210526, (
+                    LogNormal("velocity", 3.04320573807, 0.20936892927),
+                    LogNormal("magnitude", -3.94288784905, 0.71734976905),
+                )),
+                # NOT SEP
+                Population(0.940789474, (
+                    LogNormal("velocity", 2.74093413353, 0.22231969237),
+                    LogNormal("magnitude", -5.46471549786, 0.4060945863),
+                )),
+                # SEP10-100
+                Population(0.098684211, (
+                    LogNormal("velocity", 3.00515580177, 0.24573022127),
+                    LogNormal("magnitude", -4.68866759299, 0.61025004699),
+                )),
+            ),
+            300: 0,
+        },
+        awt=_AWT_NON_HALO,
+        p_error=_P_ERROR_NON_HALO,
+    ),
+    # Flare & CME, Well Connected Flare, Non Halo CME
+    Regime(
+        inputs="flare & cme",
+        connectivity="well",
+        cme_class="non halo",
+        channels={
+            10: (
+                # SEP
+                Population(0.0067057837, (
+                    LogNormal("velocity", 2.82257556915, 0.27493494749),
+                    LogNormal("magnitude", -4.30615707813, 0.77544026801),
+                )),
+                # NOT SEP
+                Population(0.9932942163, (
+                    LogNormal("velocity", 2.56826519966, 0.22966578603),
+                    LogNormal("magnitude", -5.47723640282, 0.40369972744),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.0041911148, (
+                    LogNormal("velocity", 2.8759496212, 0.29943174124),
+                    LogNormal("magnitude", -4.16030931293, 0.77491862688),
+                )),
+                # NOT SEP
+                Population(0.9958088852, (
+                    LogNormal("velocity", 2.56826519966, 0.22966578603),
+                    LogNormal("magnitude", -5.47723640282, 0.40369972744),
+                )),
+                # SEP10-30
+                Population(0.0025146689, (
+                    LogNormal("velocity", 2.70479297638, 0.21277628839),
+                    LogNormal("magnitude", -4.78902523009, 0.60458977795),
+                )),
+            ),
+            60: 0,
+            100: (
+                # SEP
+                Population(0.0033528919, (
+                    LogNormal("velocity", 2.78089141846, 0.46015313268),
+                    LogNormal("magnitude", -3.94288784905, 0.71734976905),
+                )),
+                # NOT SEP
+                Population(0.9966471081, (
+                    LogNormal("velocity", 2.56826519966, 0.22966578603),
+                    LogNormal("magnitude", -5.46471549786, 0.4060945863),
+                )),
+                # SEP10-100
+                Population(0.0033528919, (
+                    LogNormal("velocity", 2.78115367889, 0.21313931048),
+                    LogNormal("magnitude", -4.68866759299, 0.61025004699),
+                )),
+            ),
+            300: 0,
+        },
+        awt=_AWT_NON_HALO,
+        p_error=_P_ERROR_NON_HALO,
+    ),
+    # Flare & CME, Poorly Connected Flare, Halo CME
+    Regime(
+        inputs="flare & cme",
+        connectivity="poor",
+        cme_class="halo",
+        channels={
+            10: (
+                # SEP
+                Population(0.28235294, (
+                    LogNormal("velocity", 3.15780115128, 0.17488001287),
+                    LogNormal("magnitude", -4.16627093702, 0.71992156865),
+                )),
+                # NOT SEP
+                Population(0.71764706, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                    LogNormal("magnitude", -5.49096499172, 0.39712862763),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.21764706, (
+                    LogNormal("velocity", 3.1826479435, 0.17392908037),
+                    LogNormal("magnitude", -4.01889502483, 0.64946127335),
+                )),
+                # NOT SEP
+                Population(0.78235294, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                    LogNormal("magnitude", -5.49096499172, 0.39712862763),
+                )),
+                # SEP10-30
+                Population(0.064705882, (
+                    LogNormal("velocity", 3.04670405388, 0.08136505634),
+                    LogNormal("magnitude", -4.50200834019, 0.60458977795),
+                )),
+            ),
+            60: 0,
+            100: (
+                # SEP (E>30 MeV PDFs)
+                Population(0.094117647, (
+                    LogNormal("velocity", 3.1826479435, 0.17392908037),
+                    LogNormal("magnitude", -4.01889502483, 0.64946127335),
+                )),
+                # NOT SEP
+                Population(0.905882353, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                    LogNormal("magnitude", -5.49096499172, 0.39712862763),
+                )),
+                # SEP10-100
+                Population(0.18823529, (
+                    LogNormal("velocity", 3.10820102692, 0.14900480211),
+                    LogNormal("magnitude", -4.28984644442, 0.6462044952),
+                )),
+            ),
+            300: (
+                # SEP
+                Population(0.058823529, (
+                    LogNormal("velocity", 3.29878282547, 0.11873473972),
+                    LogNormal("magnitude", -3.21840130251, 0.40466116203),
+                )),
+                # NOT SEP
+                Population(0.941176471, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                    LogNormal("magnitude", -5.51027933809, 0.38777545772),
+                )),
+                # SEP10-300
+                ######################## BUG: Maybe an error???? line 1709 in IDL file (flare + cme)
+                # P(V | SEP10-300) is evaluated at the flare magnitude
+                Population(0.049019608, (
+                    LogNormal("magnitude", 3.13173818588, 0.16359749436),
+                    LogNormal("magnitude", -4.23292661895, 0.68785341383),
+                )),
+            ),
+        },
+        awt=_AWT_NON_HALO,
+        p_error=_P_ERROR_NON_HALO,
+    ),
+    # Flare & CME, Poorly Connected Flare, Partial Halo CME
+    Regime(
+        inputs="flare & cme",
+        connectivity="poor",
+        cme_class="partial halo",
+        channels={
+            10: (
+                # SEP
+                Population(0.012295082, (
+                    LogNormal("velocity", 3.02453112602, 0.239132002),
+                    LogNormal("magnitude", -4.16627093702, 0.71992156865),
+                )),
+                # NOT SEP
+                Population(0.987704918, (
+                    LogNormal("velocity", 2.74093413353, 0.22231969237),
+                    LogNormal("magnitude", -5.49096499172, 0.39712862763),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.0081967213, (
+                    LogNormal("velocity", 3.02310156822, 0.25269654393),
+                    LogNormal("magnitude", -4.01889502483, 0.64946127335),
+                )),
+                # NOT SEP
+                Population(0.9918032787, (
+                    LogNormal("velocity", 2.74093413353, 0.22231969237),
+                    LogNormal("magnitude", -5.49096499172, 0.39712862763),
+                )),
+                # SEP10-30
+                Population(0.0040983607, (
+                    LogNormal("magnitude", -4.50200834019, 0.60458977795),
+                    LogNormal("velocity", 2.98286390305, 0.20173968375),
+                )),
+            ),
+            60: 0,
+            100: 0,
+            300: 0,
+        },
+        awt=_AWT_NON_HALO,
+        p_error=_P_ERROR_NON_HALO,
+    ),
+    # Flare & CME, Poorly Connected Flare, Non Halo CME
+    Regime(
+        inputs="flare & cme",
+        connectivity="poor",
+        cme_class="non halo",
+        channels={
+            10: (
+                # SEP
+                Population(0.00054585153, (
+                    LogNormal("velocity", 2.82257556915, 0.27493494749),
+                    LogNormal("magnitude", -4.16627093702, 0.71992156865),
+                )),
+                # NOT SEP
+                Population(0.99945414847, (
+                    LogNormal("velocity", 2.56826519966, 0.22966578603),
+                    LogNormal("magnitude", -5.49096499172, 0.39712862763),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.00054585153, (
+                    LogNormal("velocity", 2.8759496212, 0.29943174124),
+                    LogNormal("magnitude", -4.01889502483, 0.64946127335),
+                )),
+                # NOT SEP
+                Population(0.99945414847, (
+                    LogNormal("velocity", 2.70479297638, 0.21277628839),
+                    LogNormal("magnitude", -5.49096499172, 0.39712862763),
+                )),
+                # SEP10-30
+                Population(0.0, (
+                    LogNormal("magnitude", -4.50200834019, 0.60458977795),
+                    LogNormal("velocity", 3.04670405388, 0.08136505634),
+                )),
+            ),
+            60: 0,
+            100: 0,
+            300: 0,
+        },
+        awt=_AWT_NON_HALO,
+        p_error=_P_ERROR_NON_HALO,
+    ),
+    # Flare, Well Connected Flare
+    Regime(
+        inputs="flare",
+        connectivity="well",
+        cme_class=None,
+        channels={
+            10: (
+                # SEP
+                Population(0.018457044, (
+                    LogNormal("magnitude", -4.30615707813, 0.77544026801),
+                )),
+                # NOT SEP
+                Population(0.98154296, (
+                    LogNormal("magnitude", -5.47723640282, 0.40369972744),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.014473509, (
+                    LogNormal("magnitude", -4.16030931293, 0.77491862688),
+                )),
+                # SEP10-30
+                Population(0.0039835347, (
+                    LogNormal("magnitude", -4.78902523009, 0.60458977795),
+                )),
+                # NOT SEP
+                Population(0.98154296, (
+                    LogNormal("magnitude", -5.47723640282, 0.40369972744),
+                )),
+            ),
+            60: (
+                # SEP
+                Population(0.012083389, (
+                    LogNormal("magnitude", -4.03956277409, 0.73534454303),
+                )),
+                # SEP10-60
+                Population(0.0063736556, (
+                    LogNormal("magnitude", -4.76416660627, 0.59112431878),
+                )),
+                # NOT SEP
+                Population(0.97991189, (
+                    LogNormal("magnitude", -5.46471549786, 0.4060945863),
+                )),
+            ),
+            100: (
+                # SEP
+                Population(0.0099588368, (
+                    LogNormal("magnitude", -3.94288784905, 0.71734976905),
+                )),
+                # SEP10-100
+                Population(0.0084982074, (
+                    LogNormal("magnitude", -4.68866759299, 0.61025004699),
+                )),
+                # NOT SEP
+                Population(0.97991189, (
+                    LogNormal("magnitude", -5.46471549786, 0.4060945863),
+                )),
+            ),
+            300: (
+                # SEP
+                Population(0.017843289, (
+                    LogNormal("magnitude", -3.45311151509, 0.47153478691),
+                )),
+                # SEP10-300
+                Population(0.068269977, (
+                    LogNormal("magnitude", -4.23701745383, 0.48230103188),
+                )),
+                # NOT SEP
+                Population(0.97991189, (
+                    LogNormal("magnitude", -5.46471549786, 0.4060945863),
+                )),
+            ),
+        },
+        awt={10: 61.7, 30: 55.25, 60: 42.85, 100: 34.25, 300: 22.36},
+        p_error={
+            10: (0.014066304, 0.020337673, 0.024509694),
+            30: (0.012562036, 0.017870102, 0.021311094),
+            60: (0.01131556, 0.016107894, 0.018875476),
+            100: (0.009522366, 0.013405966, 0.015616814),
+            300: (0.00073615809, 0.0010778833, 0.0013181242),
+        },
+    ),
+    # Flare, Poorly Connected Flare
+    Regime(
+        inputs="flare",
+        connectivity="poor",
+        cme_class=None,
+        channels={
+            10: (
+                # SEP
+                Population(0.0095541401, (
+                    LogNormal("magnitude", -4.16627093702, 0.71992156865),
+                )),
+                # NOT SEP
+                Population(0.99044586, (
+                    LogNormal("magnitude", -5.49096499172, 0.39712862763),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.0066024546, (
+                    LogNormal("magnitude", -4.01889502483, 0.64946127335),
+                )),
+                # SEP10-30
+                Population(0.0029516856, (
+                    LogNormal("magnitude", -4.50200834019, 0.63040595626),
+                )),
+                # NOT SEP
+                Population(0.99044586, (
+                    LogNormal("magnitude", -5.49096499172, 0.39712862763),
+                )),
+            ),
+            60: (
+                # SEP
+                Population(0.0043498524, (
+                    LogNormal("magnitude", -3.92413613184, 0.61928361541),
+                )),
+                # SEP10-60
+                Population(0.0052042877, (
+                    LogNormal("magnitude", -4.3690651784, 0.66202275738),
+                )),
+                # NOT SEP
+                Population(0.98781433, (
+                    LogNormal("magnitude", -5.51027933809, 0.38777545772),
+                )),
+            ),
+            100: (
+                # SEP
+                Population(0.0028740096, (
+                    LogNormal("magnitude", -3.84450553191, 0.75770488028),
+                )),
+                # SEP10-100
+                Population(0.0066801305, (
+                    LogNormal("magnitude", -4.28984644442, 0.6462044952),
+                )),
+                # NOT SEP
+                Population(0.98781433, (
+                    LogNormal("magnitude", -5.51027933809, 0.38777545772),
+                )),
+            ),
+            300: (
+                # SEP
+                Population(0.0043945313, (
+                    LogNormal("magnitude", -3.21840130251, 0.40466116203),
+                )),
+                # SEP10-300
+                Population(0.055664063, (
+                    LogNormal("magnitude", -4.23292661895, 0.68785341383),
+                )),
+                # NOT SEP
+                Population(0.98781433, (
+                    LogNormal("magnitude", -5.51027933809, 0.38777545772),
+                )),
+            ),
+        },
+        awt={10: 65.05, 30: 60.58, 60: 55.23, 100: 47.36, 300: 36.25},
+        p_error={
+            10: (0.019304538, 0.027341748, 0.031418604),
+            30: (0.013921091, 0.019509173, 0.022322554),
+            60: (0.0083737216, 0.011893846, 0.013542637),
+            100: (0.004786442, 0.0067026134, 0.0075787174),
+            300: (0.00020983171, 0.0003586491, 0.00050209594),
+        },
+    ),
+    # CME, Non Halo CME
+    Regime(
+        inputs="cme",
+        connectivity=None,
+        cme_class="non halo",
+        channels={
+            10: (
+                # SEP
+                Population(0.0049800797, (
+                    LogNormal("velocity", 2.82257556915, 0.27493494749),
+                )),
+                # NOT SEP
+                Population(0.99501992, (
+                    LogNormal("velocity", 2.56826519966, 0.22966578603),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.0029880478, (
+                    LogNormal("velocity", 2.8759496212, 0.29943174124),
+                )),
+                # SEP10-30
+                Population(0.0019920319, (
+                    LogNormal("velocity", 2.70479297638, 0.21277628839),
+                )),
+                # NOT SEP
+                Population(0.99501992, (
+                    LogNormal("velocity", 2.56826519966, 0.22966578603),
+                )),
+            ),
+            60: (
+                # SEP
+                Population(0.0016600266, (
+                    LogNormal("velocity", 2.92284369469, 0.34405881166),
+                )),
+                # SEP10-60
+                Population(0.0033200531, (
+                    LogNormal("velocity", 2.75087952614, 0.14460618794),
+                )),
+                # NOT SEP
+                Population(0.99501992, (
+                    LogNormal("velocity", 2.56826519966, 0.22966578603),
+                )),
+            ),
+            100: (
+                # SEP
+                Population(0.0013280212, (
+                    LogNormal("velocity", 2.78089141846, 0.46015313268),
+                )),
+                # SEP10-100
+                Population(0.0036520584, (
+                    LogNormal("velocity", 2.78115367889, 0.21313931048),
+                )),
+                # NOT SEP
+                Population(0.99501992, (
+                    LogNormal("velocity", 2.56826519966, 0.22966578603),
+                )),
+            ),
+            300: None,
+        },
+        awt=_AWT_NON_HALO,
+        p_error=_P_ERROR_NON_HALO,
+    ),
+    # CME, Partial Halo CME
+    Regime(
+        inputs="cme",
+        connectivity=None,
+        cme_class="partial halo",
+        channels={
+            10: (
+                # SEP
+                Population(0.091133005, (
+                    LogNormal("velocity", 3.02453112602, 0.239132002),
+                )),
+                # NOT SEP
+                Population(0.908867, (
+                    LogNormal("velocity", 2.74093413353, 0.22231969237),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.071428571, (
+                    LogNormal("velocity", 3.02310156822, 0.25269654393),
+                )),
+                # SEP10-30
+                Population(0.019704433, (
+                    LogNormal("velocity", 2.98286390305, 0.20173968375),
+                )),
+                # NOT SEP
+                Population(0.908867, (
+                    LogNormal("velocity", 2.74093413353, 0.22231969237),
+                )),
+            ),
+            60: (
+                # SEP
+                Population(0.044334975, (
+                    LogNormal("velocity", 3.0165514946, 0.23858144879),
+                )),
+                # SEP10-60
+                Population(0.04679803, (
+                    LogNormal("velocity", 3.01141262054, 0.24460618198),
+                )),
+                # NOT SEP
+                Population(0.90886, (
+                    LogNormal("velocity", 2.74093413353, 0.22231969237),
+                )),
+            ),
+            100: (
+                # SEP
+                Population(0.027093596, (
+                    LogNormal("velocity", 3.04320573807, 0.20936892927),
+                )),
+                # SEP10-100
+                Population(0.064039409, (
+                    LogNormal("velocity", 3.00515580177, 0.24573022127),
+                )),
+                # NOT SEP
+                Population(0.908867, (
+                    LogNormal("velocity", 2.74093413353, 0.22231969237),
+                )),
+            ),
+            300: None,
+        },
+        awt={10: 63.35, 30: 60.58, 60: 55.23, 100: 47.36, 300: 36.25},
+        p_error={
+            10: (0.027292223, 0.032975703, 0.0366456),
+            30: (0.025947781, 0.030993743, 0.034218997),
+            60: (0.015225575, 0.018487387, 0.020608458),
+            100: (0.011864542, 0.01494523, 0.017056895),
+            300: (None, None, None),
+        },
+    ),
+    # CME, Halo CME
+    Regime(
+        inputs="cme",
+        connectivity=None,
+        cme_class="halo",
+        channels={
+            10: (
+                # SEP
+                Population(0.38129496, (
+                    LogNormal("velocity", 3.15780115128, 0.17488001287),
+                )),
+                # NOT SEP
+                Population(0.61870504, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                )),
+            ),
+            30: (
+                # SEP
+                Population(0.32014388, (
+                    LogNormal("velocity", 3.1826479435, 0.17392908037),
+                )),
+                # SEP10-30
+                Population(0.061151079, (
+                    LogNormal("velocity", 3.04670405388, 0.08136505634),
+                )),
+                # NOT SEP
+                Population(0.61870504, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                )),
+            ),
+            60: (
+                # SEP
+                Population(0.25179856, (
+                    LogNormal("velocity", 3.19835877419, 0.18075096607),
+                )),
+                # SEP10-60
+                Population(0.1294964, (
+                    LogNormal("velocity", 3.08597326279, 0.13453669846),
+                )),
+                # NOT SEP
+                Population(0.61870504, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                )),
+            ),
+            100: (
+                # SEP
+                Population(0.16906475, (
+                    LogNormal("velocity", 3.22216272354, 0.17536236346),
+                )),
+                # SEP10-100
+                Population(0.21223022, (
+                    LogNormal("velocity", 3.10820102692, 0.14900480211),
+                )),
+                # NOT SEP
+                Population(0.61870504, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                )),
+            ),
+            300: (
+                # SEP
+                Population(0.053956835, (
+                    LogNormal("velocity", 3.29878282547, 0.11873473972),
+                )),
+                # SEP10-300
+                Population(0.32733813, (
+                    LogNormal("velocity", 3.13173818588, 0.16359749436),
+                )),
+                # NOT SEP
+                Population(0.61870504, (
+                    LogNormal("velocity", 2.91011047363, 0.22652350366),
+                )),
+            ),
+        },
+        awt={10: 139.49, 30: 115.32, 60: 100.58, 100: 90.25, 300: 70.32},
+        p_error={
+            10: (0.026346158, 0.028627921, 0.030565187),
+            30: (0.0016775079, 0.0030731815, 0.0043822598),
+            60: (0.0075471041, 0.011301916, 0.014358412),
+            100: (0.016388003, 0.021868145, 0.025966066),
+            300: (0.016903247, 0.017832285, 0.018523705),
+        },
+    ),
+    # No Flare, no CME
+    Regime(
+        inputs="none",
+        connectivity=None,
+        cme_class=None,
+        channels={energy: None for energy in ENERGIES},
+        awt=None,
+        p_error=None,
+    ),
+)
+
+# (inputs, connectivity, CME class) -> Regime, the channels are keyed by energy
+REGIME_TABLE: dict[tuple[str, str | None, str | None], Regime] = {
+    (regime.inputs, regime.connectivity, regime.cme_class): regime
+    for regime in REGIMES
+}
+# Regime -> its position in REGIMES and in the compiled model
+REGIME_CODES: dict[tuple[str, str | None, str | None], int] = {
+    key: code for code, key in enumerate(REGIME_TABLE)
+}
+
+
+@dataclass(frozen=True)
+class PeakFluxRule:
+    inputs: str  # "flare & cme", "flare" or "cme"
+    # "<variable> <operator> <threshold>" conditions that must all hold, on
+    # probability_<energy> (None read as 0), magnitude, velocity and width
+    conditions: tuple[str, ...]
+    # The first case whose conditions hold gives the peak flux of (energy,
+    # confidence level) as slope * p + PEAK_FLUX_BACKGROUND[energy] * (1 - p),
+    # p the probability of the energy; None for the others or if none holds
+    cases: tuple[tuple[tuple[str, ...], dict[tuple[int, str], float]], ...]
+
+
+PEAK_FLUX_BACKGROUND = {10: 0.23, 30: 0.122, 100: 0.05, 300: 0.02}
+
+# The sepchars decision chains: the first rule of a trigger's inputs whose
+# conditions hold applies
+PEAK_FLUX_RULES = (
+    PeakFluxRule(
+        "flare & cme",
+        ("magnitude < 1e-06",),
+        (),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_10 >= 0.26", "probability_30 < 0.2", "probability_100 < 0.15",
+         "probability_300 < 0.12", "magnitude >= 1e-06", "magnitude < 3e-05"),
+        (
+            (("velocity >= 0", "velocity < 1250"), {(10, "50cl"): 9.52842, (10, "90cl"): 44.7101}),
+            (("velocity >= 1250",), {(10, "50cl"): 29.2921, (10, "90cl"): 766.743}),
+        ),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_10 >= 0.26", "probability_30 < 0.2", "probability_100 < 0.15",
+         "probability_300 < 0.12", "magnitude >= 3e-05", "magnitude < 0.0001"),
+        (
+            (("velocity >= 0", "velocity < 1400"), {(10, "50cl"): 8.89949, (10, "90cl"): 78.5001}),
+            (("velocity >= 1400",), {(10, "50cl"): 94.5556, (10, "90cl"): 5591.01}),
+        ),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_10 >= 0.26", "probability_30 < 0.2", "probability_100 < 0.15",
+         "probability_300 < 0.12", "magnitude >= 0.0001"),
+        (
+            (("velocity >= 0", "velocity < 1650"), {(10, "50cl"): 62.1402, (10, "90cl"): 588.377}),
+            (("velocity >= 1650",), {(10, "50cl"): 620.803, (10, "90cl"): 13597.8}),
+        ),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_30 >= 0.2", "probability_100 < 0.15", "probability_300 < 0.12",
+         "magnitude >= 1e-06", "magnitude < 3e-05"),
+        (
+            (
+                ("velocity >= 0", "velocity < 1250"),
+                {(10, "50cl"): 20.6514, (10, "90cl"): 62.9657, (30, "50cl"): 13.5934,
+                 (30, "90cl"): 15.9081},
+            ),
+            (
+                ("velocity >= 1250",),
+                {(10, "50cl"): 48.4039, (10, "90cl"): 1006.11, (30, "50cl"): 3.56488,
+                 (30, "90cl"): 43.5621},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_30 >= 0.2", "probability_100 < 0.15", "probability_300 < 0.12",
+         "magnitude >= 3e-05", "magnitude < 0.0001"),
+        (
+            (
+                ("velocity >= 0", "velocity < 1350"),
+                {(10, "50cl"): 11.7702, (10, "90cl"): 116.76, (30, "50cl"): 9.06236,
+                 (30, "90cl"): 16.5954},
+            ),
+            (
+                ("velocity >= 1350",),
+                {(10, "50cl"): 115.621, (10, "90cl"): 6054.29, (30, "50cl"): 8.74686,
+                 (30, "90cl"): 591.231},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_30 >= 0.2", "probability_100 < 0.15", "probability_300 < 0.12",
+         "magnitude >= 0.0001"),
+        (
+            (
+                ("velocity >= 0", "velocity < 1650"),
+                {(10, "50cl"): 67.8335, (10, "90cl"): 555.601, (30, "50cl"): 7.1456,
+                 (30, "90cl"): 132.028},
+            ),
+            (
+                ("velocity >= 1650",),
+                {(10, "50cl"): 620.803, (10, "90cl"): 13597.8, (30, "50cl"): 80.8776,
+                 (30, "90cl"): 2123.37},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_100 >= 0.15", "probability_300 < 0.12", "magnitude >= 1e-06",
+         "magnitude < 6e-05"),
+        (
+            (
+                ("velocity >= 0", "velocity < 1350"),
+                {(30, "50cl"): 6.5366, (30, "90cl"): 18.108, (100, "50cl"): 0.584017,
+                 (100, "90cl"): 1.37347},
+            ),
+            (
+                ("velocity >= 1350",),
+                {(10, "50cl"): 166.61, (10, "90cl"): 6752.46, (30, "50cl"): 30.7113,
+                 (30, "90cl"): 459.814, (100, "50cl"): 1.65698, (100, "90cl"): 8.76971},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_100 >= 0.15", "probability_300 < 0.12", "magnitude >= 6e-05",
+         "magnitude < 0.0003"),
+        (
+            (
+                ("velocity >= 0", "velocity < 1350"),
+                {(10, "50cl"): 34.5999, (10, "90cl"): 401.767, (30, "50cl"): 9.03943,
+                 (30, "90cl"): 72.6586, (100, "50cl"): 0.979442, (100, "90cl"): 3.70818},
+            ),
+            (
+                ("velocity >= 1350",),
+                {(10, "50cl"): 645.922, (10, "90cl"): 13132.7, (30, "50cl"): 66.3046,
+                 (30, "90cl"): 2244.59, (100, "50cl"): 1.65698, (100, "90cl"): 8.76971},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_100 >= 0.15", "probability_300 < 0.12", "magnitude >= 0.0003"),
+        (
+            (("velocity >= 0", "velocity < 1600"), {}),
+            (
+                ("velocity >= 1600",),
+                {(10, "50cl"): 1562.33, (10, "90cl"): 17428.9, (30, "50cl"): 363.673,
+                 (30, "90cl"): 2638.26, (100, "50cl"): 14.2809, (100, "90cl"): 263.053},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "flare & cme",
+        ("probability_300 >= 0.12",),
+        (
+            (
+                ("magnitude >= 1e-06", "magnitude < 0.0003"),
+                {(10, "50cl"): 539.706, (10, "90cl"): 12038.4, (30, "50cl"): 140.577,
+                 (30, "90cl"): 2471.69, (100, "50cl"): 9.77284, (100, "90cl"): 94.166,
+                 (300, "50cl"): 1.33046, (300, "90cl"): 7.09169},
+            ),
+            (
+                ("magnitude >= 0.0003",),
+                {(10, "50cl"): 1575.84, (10, "90cl"): 21655.1, (30, "50cl"): 422.419,
+                 (30, "90cl"): 3288.15, (100, "50cl"): 35.9343, (100, "90cl"): 229.113,
+                 (300, "50cl"): 4.67401, (300, "90cl"): 58.7679},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "flare",
+        ("magnitude < 1e-06",),
+        (),
+    ),
+    PeakFluxRule(
+        "flare",
+        ("probability_10 >= 0.26", "probability_30 < 0.2", "probability_100 < 0.15",
+         "probability_300 < 0.12"),
+        (
+            (
+                ("magnitude >= 1e-06", "magnitude < 3e-05"),
+                {(10, "50cl"): 8.99763, (10, "90cl"): 136.348},
+            ),
+            (
+                ("magnitude >= 3e-05", "magnitude < 0.0001"),
+                {(10, "50cl"): 16.7516, (10, "90cl"): 793.274},
+            ),
+            (("magnitude >= 0.0001",), {(10, "50cl"): 97.8199, (10, "90cl"): 6640.01}),
+        ),
+    ),
+    PeakFluxRule(
+        "flare",
+        ("probability_30 >= 0.2", "probability_100 < 0.15", "probability_300 < 0.12"),
+        (
+            (
+                ("magnitude >= 1e-06", "magnitude < 3e-05"),
+                {(10, "50cl"): 21.0038, (10, "90cl"): 308.828, (30, "50cl"): 2.79427,
+                 (30, "90cl"): 21.5382},
+            ),
+            (
+                ("magnitude >= 3e-05", "magnitude < 0.0001"),
+                {(10, "50cl"): 32.7346, (10, "90cl"): 1773.08, (30, "50cl"): 3.43276,
+                 (30, "90cl"): 69.9711},
+            ),
+            (
+                ("magnitude >= 0.0001",),
+                {(10, "50cl"): 148.26, (10, "90cl"): 7469.22, (30, "50cl"): 18.4128,
+                 (30, "90cl"): 1088.35},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "flare",
+        ("probability_100 >= 0.15", "probability_300 < 0.12"),
+        (
+            (
+                ("magnitude >= 1e-06", "magnitude < 6e-05"),
+                {(10, "50cl"): 33.7337, (10, "90cl"): 942.493, (30, "50cl"): 5.00712,
+                 (30, "90cl"): 252.977, (100, "50cl"): 0.842783, (100, "90cl"): 3.63988},
+            ),
+            (
+                ("magnitude >= 6e-05", "magnitude < 0.0003"),
+                {(10, "50cl"): 131.691, (10, "90cl"): 5706.75, (30, "50cl"): 18.4679,
+                 (30, "90cl"): 733.797, (100, "50cl"): 1.22056, (100, "90cl"): 20.8781},
+            ),
+            (
+                ("magnitude >= 0.0003",),
+                {(10, "50cl"): 607.181, (10, "90cl"): 15477.5, (30, "50cl"): 128.3,
+                 (30, "90cl"): 2348.82, (100, "50cl"): 11.0429, (100, "90cl"): 172.332},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "flare",
+        ("probability_300 >= 0.12",),
+        (
+            (
+                ("magnitude >= 1e-06", "magnitude < 0.0003"),
+                {(10, "50cl"): 539.706, (10, "90cl"): 12038.4, (30, "50cl"): 140.577,
+                 (30, "90cl"): 2471.69, (100, "50cl"): 9.77284, (100, "90cl"): 94.166,
+                 (300, "50cl"): 1.33046, (300, "90cl"): 7.09169},
+            ),
+            (
+                ("magnitude >= 0.0003",),
+                {(10, "50cl"): 1575.84, (10, "90cl"): 21655.1, (30, "50cl"): 422.419,
+                 (30, "90cl"): 3288.15, (100, "50cl"): 35.9343, (100, "90cl"): 229.113,
+                 (300, "50cl"): 4.67401, (300, "90cl"): 58.7679},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "cme",
+        ("probability_10 >= 0.26", "probability_30 < 0.2", "probability_100 < 0.15",
+         "probability_300 < 0.12"),
+        (
+            (("width == 360", "velocity < 1250"), {(10, "50cl"): 12.6647, (10, "90cl"): 65.6945}),
+            (("width == 360", "velocity >= 1250"), {(10, "50cl"): 84.9488, (10, "90cl"): 5527.92}),
+            (("width < 360", "velocity < 1250"), {(10, "50cl"): 8.69473, (10, "90cl"): 118.212}),
+            (("width < 360", "velocity >= 1250"), {(10, "50cl"): 21.3844, (10, "90cl"): 1154.19}),
+        ),
+    ),
+    PeakFluxRule(
+        "cme",
+        ("probability_30 >= 0.2", "probability_100 < 0.15", "probability_300 < 0.12"),
+        (
+            (
+                ("width == 360", "velocity < 1000"),
+                {(10, "50cl"): 17.4308, (10, "90cl"): 1208.46, (30, "50cl"): 2.09444,
+                 (30, "90cl"): 9.91747},
+            ),
+            (
+                ("width == 360", "velocity >= 1000"),
+                {(10, "50cl"): 26.5127, (10, "90cl"): 856.442, (30, "50cl"): 4.8067,
+                 (30, "90cl"): 417.42},
+            ),
+            (
+                ("width < 360", "velocity < 1000"),
+                {(10, "50cl"): 22.1198, (10, "90cl"): 4570.61, (30, "50cl"): 2.77579,
+                 (30, "90cl"): 26.555},
+            ),
+            (
+                ("width < 360", "velocity >= 1000"),
+                {(10, "50cl"): 26.5127, (10, "90cl"): 856.442, (30, "50cl"): 4.8067,
+                 (30, "90cl"): 417.42},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "cme",
+        ("probability_100 >= 0.15", "probability_300 < 0.12"),
+        (
+            (
+                (),
+                {(10, "50cl"): 13.5745, (10, "90cl"): 879.658, (30, "50cl"): 4.85624,
+                 (30, "90cl"): 190.566, (100, "50cl"): 1.44041, (100, "90cl"): 44.8417},
+            ),
+        ),
+    ),
+    PeakFluxRule(
+        "cme",
+        ("probability_300 >= 0.12",),
+        (
+            (
+                (),
+                {(10, "50cl"): 8.7584, (10, "90cl"): 159.326, (30, "50cl"): 5.816,
+                 (30, "90cl"): 200.824, (100, "50cl"): 2.574, (100, "90cl"): 127.048,
+                 (300, "50cl"): 3.06019, (300, "90cl"): 34.3502},
+            ),
+        ),
+    ),
+)
+
+_OPERATORS = {">=": np.greater_equal, "<": np.less, "==": np.equal}
+_PEAK_FLUX_VARIABLES = (
+    "magnitude", "velocity", "width", *(f"probability_{energy}" for energy in SEPCHARS_PROBABILITIES)
+)
+# Kinds of trigger, in the order of the first axis of PeakFluxTable.bands
+_PEAK_FLUX_INPUTS = ("flare & cme", "flare", "cme", "none")
+# Largest PeakFluxTable.bands compile_peak_flux_table tabulates
+_MAX_PEAK_FLUX_CELLS = 1 << 24
 
-                    # E>300 MeV
-                    p_sep_300 = 0
 
-                    # Advanced Warnign Time (AWT) in minutes for each integral energy for Non Halo CMEs
-                    awt_10 = 189.78  # mean value from statistics
-                    awt_30 = 170.35  # dummy
-                    awt_60 = 132.58  # dummy
-                    awt_100 = 112.72  # dummy
-                    awt_300 = 98.32  # dummy
+@dataclass
+class PeakFluxTable:
+    # Peak flux rules compiled into bands, and the band of every cell of the
+    # trigger space that the thresholds of their conditions cut out.
+    # Bands: one per case of every rule, then one per rule for the triggers
+    # it applies to but none of its cases does, then one per kind of trigger
+    # (_PEAK_FLUX_INPUTS) for those no rule applies to. Only the case bands
+    # have peak fluxes.
+    labels: tuple[str, ...]
+    # (band, energy, level) slopes, NaN for no peak flux, and (energy,) floors
+    slopes: np.ndarray
+    floors: np.ndarray
+    # Per variable the conditions test: the thresholds where its interval
+    # changes, crossed by x > threshold if strict else x >= threshold. The
+    # interval of a value is the number of thresholds it crosses, NaN has the
+    # last interval to itself.
+    variables: tuple[str, ...]
+    thresholds: tuple[tuple[float, ...], ...]
+    strict: tuple[tuple[bool, ...], ...]
+    # (kind of trigger, interval of each variable) band
+    bands: np.ndarray
+
+
+def compile_peak_flux_table(
+    rules: tuple[PeakFluxRule, ...], background: dict[int, float]
+) -> PeakFluxTable:
+
+    # The conditions only change value where a variable crosses one of their
+    # thresholds, so walking the rules once for a representative value of
+    # each interval gives the band of every trigger in the interval
+    labels = []
+    slopes = []
+    no_case = np.full((len(SEPCHARS_PROBABILITIES), len(PEAK_FLUX_LEVELS)), np.nan)
+    for rule in rules:
+        for conditions, case in rule.cases:
+            labels.append(f"{rule.inputs}: {', '.join(rule.conditions + conditions)}")
+            row = no_case.copy()
+            for (energy, level), slope in case.items():
+                row[SEPCHARS_PROBABILITIES.index(energy), PEAK_FLUX_LEVELS.index(level)] = slope
+            slopes.append(row)
+        labels.append(f"{rule.inputs}: {', '.join(rule.conditions)}")
+        slopes.append(no_case)
+    no_band = len(labels)
+    labels += [f"{inputs}: no band" for inputs in _PEAK_FLUX_INPUTS]
+    slopes += [no_case] * len(_PEAK_FLUX_INPUTS)
+
+    boundaries = {}
+    for rule in rules:
+        for condition in rule.conditions + tuple(c for conditions, _ in rule.cases for c in conditions):
+            variable, operator, threshold = condition.split()
+            crossings = boundaries.setdefault(variable, set())
+            crossings.add((float(threshold), False))
+            if operator == "==":
+                crossings.add((float(threshold), True))
+    variables = tuple(v for v in _PEAK_FLUX_VARIABLES if v in boundaries)
+    crossings = [sorted(boundaries[variable]) for variable in variables]
+
+    shape = (len(_PEAK_FLUX_INPUTS), *(len(c) + 2 for c in crossings))
+    if np.prod(shape, dtype=float) > _MAX_PEAK_FLUX_CELLS:
+        raise ValueError("The peak flux rules have too many thresholds to tabulate.")
+    # representative value of every interval: below all thresholds, at (or
+    # just above, if strict) each threshold, and NaN
+    representatives = [
+        np.array(
+            [np.nextafter(c[0][0], -inf) if c else 0.0]
+            + [np.nextafter(threshold, inf) if strict else threshold for threshold, strict in c]
+            + [np.nan]
+        )
+        for c in crossings
+    ]
+    grid = np.meshgrid(*representatives, indexing="ij")
+    values = {variable: axis.ravel() for variable, axis in zip(variables, grid)}
+    cells = grid[0].size if grid else 1
+
+    bands = np.empty((len(_PEAK_FLUX_INPUTS), cells), dtype=np.int32)
+    for k, inputs in enumerate(_PEAK_FLUX_INPUTS):
+        band = np.full(cells, no_band + k)
+        pending = np.ones(cells, dtype=bool)
+        first = 0
+        for rule in rules:
+            if rule.inputs == inputs:
+                matched = pending & _holds(rule.conditions, values, cells)
+                pending &= ~matched
+                for b, (conditions, _) in enumerate(rule.cases):
+                    case = matched & _holds(conditions, values, cells)
+                    matched &= ~case
+                    band[case] = first + b
+                band[matched] = first + len(rule.cases)
+            first += len(rule.cases) + 1
+        bands[k] = band
+
+    return PeakFluxTable(
+        labels=tuple(labels),
+        slopes=np.array(slopes),
+        floors=np.array([background[energy] for energy in SEPCHARS_PROBABILITIES]),
+        variables=variables,
+        thresholds=tuple(tuple(threshold for threshold, _ in c) for c in crossings),
+        strict=tuple(tuple(strict for _, strict in c) for c in crossings),
+        bands=bands.reshape(shape).astype(np.min_scalar_type(len(labels) - 1)),
+    )
+
+
+def _holds(conditions: tuple[str, ...], values: dict[str, np.ndarray], size: int) -> np.ndarray:
+    # Where all "<variable> <operator> <threshold>" conditions hold
+    mask = np.ones(size, dtype=bool)
+    for condition in conditions:
+        variable, operator, threshold = condition.split()
+        mask &= _OPERATORS[operator](values[variable], float(threshold))
+    return mask
+
+
+# Every P(population) P(V | population) P(F | population) term is the exponential
+# of a quadratic polynomial in log10(V) and log10(F), so each probability is
+#   P(SEP | V, F) = 1 / (1 + sum_i exp(q_i)),  q_i = log(term_i / term_SEP)
+# with one polynomial q_i per competing population. The coefficients of q_i
+# are stored in the order below.
+POLYNOMIAL_TERMS = ("1", "log_velocity", "log_magnitude", "log_velocity^2", "log_magnitude^2")
+_LINEAR_TERM = {"velocity": 1, "magnitude": 2}
+
+
+def _log_term_polynomial(population: Population) -> np.ndarray:
+    polynomial = np.zeros(len(POLYNOMIAL_TERMS))
+    polynomial[0] = log(population.prior)
+    for pdf in population.pdfs:
+        i = _LINEAR_TERM[pdf.variable]
+        # log of 1 / (x sigma log(10) sqrt(2 pi)) exp(-((log10(x) - mean) / (sqrt(2) sigma))^2)
+        polynomial[0] -= log(pdf.sigma * log(10) * sqrt(2 * pi)) + pdf.mean**2 / (
+            2 * pdf.sigma**2
+        )
+        polynomial[i] += pdf.mean / pdf.sigma**2 - log(10)
+        polynomial[i + 2] -= 1 / (2 * pdf.sigma**2)
+    return polynomial
 
-                    # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Non Halo CMEs
-                    p_error_10 = (0.019044089, 0.016825785, 0.015605077)
-                    p_error_30 = (0.0017833936, 0.0014276593, 0.0012886692)
-                    p_error_60 = (0.00029824883, 0.00040755684, 0.00049231248)
-                    p_error_100 = (0.0050464103, 0.0037166936, 0.0032635845)
-                    p_error_300 = (None, None, None)
 
-            sep_probabilities.append(
-                {
-                    "probability_10": p_sep_10,
-                    "probability_30": p_sep_30,
-                    "probability_60": p_sep_60,
-                    "probability_100": p_sep_100,
-                    "probability_300": p_sep_300,
-                    "awt_10": awt_10,
-                    "awt_30": awt_30,
-                    "awt_60": awt_60,
-                    "awt_100": awt_100,
-                    "awt_300": awt_300,
-                    "p_error_10": p_error_10,
-                    "p_error_30": p_error_30,
-                    "p_error_60": p_error_60,
-                    "p_error_100": p_error_100,
-                    "p_error_300": p_error_300,
-                }
+@dataclass
+class CompiledModel:
+    # Name the model is registered and selected by (use_model)
+    name: str
+    regimes: tuple[Regime, ...]
+    # "<name>@<fingerprint>", the fingerprint changes with any coefficient or
+    # peak flux rule; carried by every result
+    version: str
+    # (regime, energy, competing population, term) coefficients of q_i; unused
+    # population slots have a constant term of -inf and contribute nothing
+    log_odds: np.ndarray
+    # (regime, energy) number of competing populations, 0 for channels that
+    # are not modelled and take their value from constants (NaN for None)
+    populations: np.ndarray
+    constants: np.ndarray
+    # Same coefficients as Python floats, [regime][energy], for scalar use;
+    # unmodelled channels hold their constant value (0 or None) instead
+    polynomials: tuple[tuple[tuple[tuple[float, ...], ...] | float | None, ...], ...]
+    # (regime, energy) AWT and (regime, energy, sigma) errors, NaN for None
+    awt: np.ndarray
+    p_error: np.ndarray
+    # Per regime, the awt_<energy> and p_error_<energy> entries of the
+    # sepprobs dicts (None for the no input regime)
+    entries: tuple[dict[str, Any] | None, ...]
+    peak_flux_rules: tuple[PeakFluxRule, ...]
+    peak_flux_background: dict[int, float]
+    peak_flux_table: PeakFluxTable
+
+
+def model_version(
+    name: str,
+    regimes: tuple[Regime, ...],
+    peak_flux_rules: tuple[PeakFluxRule, ...],
+    peak_flux_background: dict[int, float],
+) -> str:
+    fingerprint = hashlib.sha256(
+        repr((regimes, peak_flux_rules, peak_flux_background)).encode()
+    ).hexdigest()[:16]
+    return f"{name}@{fingerprint}"
+
+
+def compile_model(
+    regimes: tuple[Regime, ...],
+    peak_flux_rules: tuple[PeakFluxRule, ...] = PEAK_FLUX_RULES,
+    peak_flux_background: dict[int, float] = PEAK_FLUX_BACKGROUND,
+    name: str = "builtin",
+) -> CompiledModel:
+    size = max(
+        len(channel) - 1
+        for regime in regimes
+        for channel in regime.channels.values()
+        if isinstance(channel, tuple)
+    )
+    log_odds = np.zeros((len(regimes), len(ENERGIES), size, len(POLYNOMIAL_TERMS)))
+    log_odds[..., 0] = -np.inf
+    populations = np.zeros((len(regimes), len(ENERGIES)), dtype=int)
+    constants = np.full((len(regimes), len(ENERGIES)), np.nan)
+
+    for r, regime in enumerate(regimes):
+        for e, energy in enumerate(ENERGIES):
+            channel = regime.channels[energy]
+            if not isinstance(channel, tuple):
+                constants[r, e] = np.nan if channel is None else channel
+                continue
+            sep = _log_term_polynomial(channel[0])
+            for population in channel[1:]:
+                # a population without prior never contributes
+                if population.prior == 0:
+                    continue
+                log_odds[r, e, populations[r, e]] = _log_term_polynomial(population) - sep
+                populations[r, e] += 1
+
+    polynomials = tuple(
+        tuple(
+            tuple(tuple(q) for q in log_odds[r, e, : populations[r, e]].tolist())
+            if populations[r, e] > 0
+            else regime.channels[energy]
+            for e, energy in enumerate(ENERGIES)
+        )
+        for r, regime in enumerate(regimes)
+    )
+    awt = np.array([
+        [np.nan if regime.awt is None else regime.awt[energy] for energy in ENERGIES]
+        for regime in regimes
+    ])
+    p_error = np.array([
+        [
+            [np.nan] * 3 if regime.p_error is None
+            else [np.nan if error is None else error for error in regime.p_error[energy]]
+            for energy in ENERGIES
+        ]
+        for regime in regimes
+    ])
+
+    entries = tuple(
+        None if regime.awt is None else {
+            **{f"awt_{energy}": regime.awt[energy] for energy in ENERGIES},
+            **{f"p_error_{energy}": regime.p_error[energy] for energy in ENERGIES},
+        }
+        for regime in regimes
+    )
+
+    return CompiledModel(
+        name=name,
+        regimes=regimes,
+        version=model_version(name, regimes, peak_flux_rules, peak_flux_background),
+        log_odds=log_odds,
+        populations=populations,
+        constants=constants,
+        polynomials=polynomials,
+        awt=awt,
+        p_error=p_error,
+        entries=entries,
+        peak_flux_rules=peak_flux_rules,
+        peak_flux_background=peak_flux_background,
+        peak_flux_table=compile_peak_flux_table(peak_flux_rules, peak_flux_background),
+    )
+
+
+# The active model, swapped by use_model; every evaluation reads it
+MODEL = compile_model(REGIMES)
+
+# Loaded models by name, and every model compiled so far by version, so that
+# switching back to a model, reloading an unchanged one or resolving the
+# tables of an earlier result never compiles again
+_MODELS: dict[str, CompiledModel] = {MODEL.name: MODEL}
+_COMPILED: dict[str, CompiledModel] = {MODEL.version: MODEL}
+
+# Trigger properties the populations of each kind of regime may depend on
+_REGIME_VARIABLES = {
+    "flare & cme": ("velocity", "magnitude"),
+    "flare": ("magnitude",),
+    "cme": ("velocity",),
+    "none": (),
+}
+
+
+def _number(value: Any, where: str) -> float:
+    # value as given (int or float), so that the model version is reproducible
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not isfinite(value):
+        raise ValueError(f"{where}: expected a finite number, got {value!r}.")
+    return value
+
+
+def _energy_table(data: Any, energies: tuple[int, ...], where: str) -> dict[int, Any]:
+    # {"<energy>": value} with exactly the given energies, in their order
+    if not isinstance(data, dict) or set(data) != {str(energy) for energy in energies}:
+        raise ValueError(f"{where}: expected an entry for each of the energies {energies}.")
+    return {energy: data[str(energy)] for energy in energies}
+
+
+def _parse_channel(data: Any, inputs: str, where: str) -> tuple[Population, ...] | float | None:
+    # A constant (or null), or [[prior, [[variable, mean, sigma], ...]], ...]
+    # with the SEP population first
+    if data is None:
+        return None
+    if not isinstance(data, list):
+        return _number(data, where)
+    if not data:
+        raise ValueError(f"{where}: expected at least the SEP population.")
+    populations = []
+    for i, population in enumerate(data):
+        if not isinstance(population, list) or len(population) != 2:
+            raise ValueError(f"{where}: expected [prior, pdfs] populations.")
+        prior = _number(population[0], where)
+        if prior < 0 or (i == 0 and prior == 0):
+            raise ValueError(f"{where}: priors must be >= 0, that of the SEP population > 0.")
+        pdfs = []
+        for pdf in population[1]:
+            if not isinstance(pdf, list) or len(pdf) != 3:
+                raise ValueError(f"{where}: expected [variable, mean, sigma] PDFs.")
+            variable, mean, sigma = pdf
+            if variable not in _REGIME_VARIABLES[inputs]:
+                raise ValueError(
+                    f"{where}: {inputs!r} regimes have PDFs of {_REGIME_VARIABLES[inputs]}, "
+                    f"got {variable!r}."
+                )
+            if _number(sigma, where) <= 0:
+                raise ValueError(f"{where}: sigma must be positive, got {sigma!r}.")
+            pdfs.append(LogNormal(variable, _number(mean, where), sigma))
+        populations.append(Population(prior, tuple(pdfs)))
+    return tuple(populations)
+
+
+def _parse_regimes(data: Any) -> tuple[Regime, ...]:
+    # One regime of each of REGIME_CODES, in any order
+    if not isinstance(data, list):
+        raise ValueError("regimes: expected a list.")
+    regimes = {}
+    for entry in data:
+        key = (entry.get("inputs"), entry.get("connectivity"), entry.get("cme_class"))
+        if key not in REGIME_CODES or key in regimes:
+            raise ValueError(f"regimes: unknown or repeated regime {key}.")
+        where = f"regime {key}"
+        awt = entry.get("awt")
+        p_error = entry.get("p_error")
+        if (awt is None) != (key[0] == "none") or (p_error is None) != (key[0] == "none"):
+            raise ValueError(f"{where}: awt and p_error are required, except without inputs.")
+        regimes[key] = Regime(
+            inputs=key[0],
+            connectivity=key[1],
+            cme_class=key[2],
+            channels={
+                energy: _parse_channel(channel, key[0], f"{where}, channel {energy}")
+                for energy, channel in _energy_table(entry.get("channels"), ENERGIES, where).items()
+            },
+            awt=None if awt is None else {
+                energy: _number(value, f"{where}, awt")
+                for energy, value in _energy_table(awt, ENERGIES, where).items()
+            },
+            p_error=None if p_error is None else {
+                energy: tuple(
+                    None if error is None else _number(error, f"{where}, p_error")
+                    for error in errors
+                )
+                for energy, errors in _energy_table(p_error, ENERGIES, where).items()
+            },
+        )
+    if len(regimes) != len(REGIME_CODES):
+        raise ValueError(f"regimes: missing {sorted(set(REGIME_CODES) - set(regimes), key=str)}.")
+    return tuple(regimes[key] for key in REGIME_CODES)
+
+
+def _parse_conditions(data: Any, where: str) -> tuple[str, ...]:
+    if not isinstance(data, list):
+        raise ValueError(f"{where}: expected a list of conditions.")
+    for condition in data:
+        parts = condition.split() if isinstance(condition, str) else ()
+        if (
+            len(parts) != 3
+            or parts[0] not in _PEAK_FLUX_VARIABLES
+            or parts[1] not in _OPERATORS
+        ):
+            raise ValueError(f"{where}: expected '<variable> <operator> <threshold>', got {condition!r}.")
+        try:
+            float(parts[2])
+        except ValueError:
+            raise ValueError(f"{where}: invalid threshold in {condition!r}.") from None
+    return tuple(data)
+
+
+def _parse_peak_flux_rules(data: Any) -> tuple[PeakFluxRule, ...]:
+    # [{"inputs", "conditions", "cases": [[conditions, {"<energy>": {level: slope}}]]}]
+    if not isinstance(data, list):
+        raise ValueError("peak_flux_rules: expected a list.")
+    rules = []
+    for i, rule in enumerate(data):
+        where = f"peak flux rule {i}"
+        if rule.get("inputs") not in ("flare & cme", "flare", "cme"):
+            raise ValueError(f"{where}: unknown inputs {rule.get('inputs')!r}.")
+        cases = []
+        for conditions, slopes in rule.get("cases", ()):
+            if not isinstance(slopes, dict) or not set(slopes) <= {
+                str(energy) for energy in SEPCHARS_PROBABILITIES
+            }:
+                raise ValueError(f"{where}: slopes are keyed by {SEPCHARS_PROBABILITIES}.")
+            case = {}
+            for energy, levels in slopes.items():
+                if not isinstance(levels, dict) or not set(levels) <= set(PEAK_FLUX_LEVELS):
+                    raise ValueError(f"{where}: slopes per energy are keyed by {PEAK_FLUX_LEVELS}.")
+                for level, slope in levels.items():
+                    case[int(energy), level] = _number(slope, where)
+            cases.append((_parse_conditions(conditions, where), case))
+        rules.append(PeakFluxRule(
+            rule["inputs"], _parse_conditions(rule.get("conditions"), where), tuple(cases)
+        ))
+    return tuple(rules)
+
+
+def _model_data(model: CompiledModel) -> dict[str, Any]:
+    # The load_models format of a model
+    def channel(value):
+        if not isinstance(value, tuple):
+            return value
+        return [
+            [population.prior, [[pdf.variable, pdf.mean, pdf.sigma] for pdf in population.pdfs]]
+            for population in value
+        ]
+
+    def levels(slopes):
+        data = {}
+        for (energy, level), slope in slopes.items():
+            data.setdefault(str(energy), {})[level] = slope
+        return data
+
+    return {
+        "regimes": [
+            {
+                "inputs": regime.inputs,
+                "connectivity": regime.connectivity,
+                "cme_class": regime.cme_class,
+                "channels": {str(energy): channel(value) for energy, value in regime.channels.items()},
+                "awt": None if regime.awt is None else {
+                    str(energy): value for energy, value in regime.awt.items()
+                },
+                "p_error": None if regime.p_error is None else {
+                    str(energy): list(errors) for energy, errors in regime.p_error.items()
+                },
+            }
+            for regime in model.regimes
+        ],
+        "peak_flux_rules": [
+            {
+                "inputs": rule.inputs,
+                "conditions": list(rule.conditions),
+                "cases": [[list(conditions), levels(slopes)] for conditions, slopes in rule.cases],
+            }
+            for rule in model.peak_flux_rules
+        ],
+        "peak_flux_background": {
+            str(energy): value for energy, value in model.peak_flux_background.items()
+        },
+    }
+
+
+def load_models(path: str) -> dict[str, str]:
+
+    # Validate and compile the models of a save_models file and register them
+    # by name (a reloaded name replaces the earlier model, and becomes active
+    # if that one was); returns the version of each. Nothing is registered if
+    # any model of the file is invalid. A model identical to one compiled
+    # before reuses its evaluator.
+    global MODEL
+    with open(path) as file:
+        data = json.load(file)
+    if not isinstance(data, dict) or not isinstance(data.get("models"), dict):
+        raise ValueError(f"{path}: expected {{\"models\": {{name: model}}}}.")
+
+    models = {}
+    for name, model in data["models"].items():
+        if not isinstance(model, dict):
+            raise ValueError(f"Model {name!r}: expected an object.")
+        try:
+            regimes = _parse_regimes(model.get("regimes"))
+            rules = _parse_peak_flux_rules(model.get("peak_flux_rules"))
+            background = {
+                energy: _number(value, "peak_flux_background")
+                for energy, value in _energy_table(
+                    model.get("peak_flux_background"), SEPCHARS_PROBABILITIES,
+                    "peak_flux_background",
+                ).items()
+            }
+            version = model_version(name, regimes, rules, background)
+            models[name] = _COMPILED.get(version) or compile_model(regimes, rules, background, name)
+        except (AttributeError, TypeError, ValueError) as error:
+            raise ValueError(f"Model {name!r}: {error}") from error
+
+    for name, model in models.items():
+        _COMPILED[model.version] = model
+        if _MODELS.get(name) is MODEL:
+            MODEL = model
+        _MODELS[name] = model
+    return {name: model.version for name, model in models.items()}
+
+
+def save_models(path: str, names: Iterable[str] | None = None) -> None:
+    # Write loaded models (default: all) in the compact load_models format
+    names = list(_MODELS) if names is None else list(names)
+    unknown = set(names) - set(_MODELS)
+    if unknown:
+        raise ValueError(f"Unknown models {sorted(unknown)}, expected some of {sorted(_MODELS)}.")
+    with open(path, "w") as file:
+        json.dump(
+            {"models": {name: _model_data(_MODELS[name]) for name in names}},
+            file, separators=(",", ":"),
+        )
+
+
+def use_model(name: str) -> CompiledModel:
+
+    # Make a loaded model the active one, for the evaluations that start after
+    # the call; results already produced keep resolving their AWT and error
+    # tables against the model of their version
+    global MODEL
+    if name not in _MODELS:
+        raise ValueError(f"Unknown model {name!r}, expected one of {sorted(_MODELS)}.")
+    MODEL = _MODELS[name]
+    return MODEL
+
+
+def available_models() -> dict[str, str]:
+    # Version of every loaded model by name
+    return {name: model.version for name, model in _MODELS.items()}
+
+
+def model_of(version: str | None) -> CompiledModel:
+    # The compiled model of a result version (None: the active model)
+    if version is None or version == MODEL.version:
+        return MODEL
+    if version not in _COMPILED:
+        raise ValueError(f"Model version {version!r} has not been loaded.")
+    return _COMPILED[version]
+
+
+# Regime codes by connectivity (well, poor) and CME class (halo, partial, non halo)
+_FLARE_CME_CODES = tuple(
+    tuple(
+        REGIME_CODES[("flare & cme", connectivity, cme_class)]
+        for cme_class in ("halo", "partial halo", "non halo")
+    )
+    for connectivity in ("well", "poor")
+)
+_FLARE_CODES = (REGIME_CODES[("flare", "well", None)], REGIME_CODES[("flare", "poor", None)])
+_CME_CODES = (
+    REGIME_CODES[("cme", None, "halo")],
+    REGIME_CODES[("cme", None, "partial halo")],
+    REGIME_CODES[("cme", None, "non halo")],
+)
+NO_REGIME = REGIME_CODES[("none", None, None)]
+
+
+def trigger_code(flare: Flare | None, cme: CME | None) -> int:
+    if flare is not None and cme is not None:
+        connectivity = 0 if flare.longitude >= 20 else 1
+        if cme.width == 360:
+            return _FLARE_CME_CODES[connectivity][0]
+        elif 120 <= cme.width < 360:
+            return _FLARE_CME_CODES[connectivity][1]
+        else:
+            return _FLARE_CME_CODES[connectivity][2]
+    elif flare is not None:
+        if flare.longitude >= 20:
+            return _FLARE_CODES[0]
+        elif flare.longitude < 20:
+            return _FLARE_CODES[1]
+    elif cme is not None:
+        if cme.width < 120:
+            return _CME_CODES[2]
+        elif 120 <= cme.width < 360:
+            return _CME_CODES[1]
+        else:
+            return _CME_CODES[0]
+
+    return NO_REGIME
+
+
+def trigger_regime(flare: Flare | None, cme: CME | None) -> Regime:
+    return MODEL.regimes[trigger_code(flare, cme)]
+
+
+class SepProbability(NamedTuple):
+    probability_10: float | None
+    probability_30: float | None
+    probability_60: float | None
+    probability_100: float | None
+    probability_300: float | None
+    regime: int
+    # MODEL.version of the model that gave the probabilities
+    version: str | None = None
+
+    @property
+    def awt(self) -> dict[int, float] | None:
+        return model_of(self.version).regimes[self.regime].awt
+
+    @property
+    def p_error(self) -> dict[int, tuple[float | None, ...]] | None:
+        return model_of(self.version).regimes[self.regime].p_error
+
+
+class InstrumentationSnapshot(NamedTuple):
+    # Triggers evaluated per regime ("<inputs>, <connectivity>, <CME class>")
+    regimes: dict[str, int]
+    # Triggers per peak flux band ("<inputs>: <conditions>"), "<inputs>: no
+    # band" for those no rule applies to
+    bands: dict[str, int]
+    # Calls of, and wall time in seconds spent in, every stage; stages nest
+    # (sepprobs includes evaluate), so the times add up to more than the total
+    calls: dict[str, int]
+    seconds: dict[str, float]
+
+
+class Instrumentation:
+
+    # Counters of the evaluations made in this process while enabled (the
+    # workers of run_parallel keep their own)
+    def __init__(self) -> None:
+        self.regimes = np.zeros(len(REGIME_CODES), dtype=np.int64)
+        self.bands: dict[str, int] = {}
+        self.calls: dict[str, int] = {}
+        self.seconds: dict[str, float] = {}
+
+    def count_band(self, band: str, triggers: int) -> None:
+        if triggers:
+            self.bands[band] = self.bands.get(band, 0) + triggers
+
+    def snapshot(self) -> InstrumentationSnapshot:
+        return InstrumentationSnapshot(
+            regimes={
+                ", ".join(filter(None, key)): int(count)
+                for key, count in zip(REGIME_CODES, self.regimes)
+            },
+            bands=dict(self.bands),
+            calls=dict(self.calls),
+            seconds=dict(self.seconds),
+        )
+
+
+# Disabled unless enable_instrumentation was called; the hot paths only check
+# this for None
+_INSTRUMENTATION: Instrumentation | None = None
+
+
+def enable_instrumentation() -> None:
+    # Start counting from zero
+    global _INSTRUMENTATION
+    _INSTRUMENTATION = Instrumentation()
+
+
+def disable_instrumentation() -> InstrumentationSnapshot | None:
+    # Stop counting; returns the final counts (None if it wasn't enabled)
+    global _INSTRUMENTATION
+    instrumentation, _INSTRUMENTATION = _INSTRUMENTATION, None
+    return None if instrumentation is None else instrumentation.snapshot()
+
+
+def instrumentation_snapshot(reset: bool = False) -> InstrumentationSnapshot | None:
+    # Counts so far (None if disabled), and with reset restart from zero
+    instrumentation = _INSTRUMENTATION
+    if instrumentation is None:
+        return None
+    snapshot = instrumentation.snapshot()
+    if reset:
+        enable_instrumentation()
+    return snapshot
+
+
+def _stage(name: str):
+    # Decorator accumulating the calls and wall time of a function into the
+    # stage name while instrumentation is enabled
+    def decorate(function):
+        @wraps(function)
+        def timed(*args, **kwargs):
+            instrumentation = _INSTRUMENTATION
+            if instrumentation is None:
+                return function(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                instrumentation.calls[name] = instrumentation.calls.get(name, 0) + 1
+                instrumentation.seconds[name] = (
+                    instrumentation.seconds.get(name, 0.0) + perf_counter() - start
+                )
+        return timed
+    return decorate
+
+
+def sepprob(
+    flare: Flare | None,
+    cme: CME | None,
+    energies: tuple[int, ...] | list[int] | None = None,
+    model: CompiledModel | None = None,
+) -> SepProbability:
+
+    # Single trigger, no list or dict round trip: the log features are taken
+    # once and every channel is a compiled polynomial of them. Channels not
+    # in energies are left None. model defaults to the active model.
+    model = MODEL if model is None else model
+    code = trigger_code(flare, cme)
+    if _INSTRUMENTATION is not None:
+        _INSTRUMENTATION.regimes[code] += 1
+    log_velocity = log10(cme.velocity) if cme is not None else 0.0
+    log_magnitude = log10(flare.magnitude) if flare is not None else 0.0
+    channels = model.polynomials[code]
+    if energies is not None:
+        channels = [
+            channel if requested else None
+            for channel, requested in zip(channels, _cached_energy_mask(tuple(energies)))
+        ]
+
+    probabilities = []
+    for channel in channels:
+        if channel.__class__ is not tuple:
+            probabilities.append(channel)
+            continue
+        denominator = 1.0
+        try:
+            for c, cv, cm, cvv, cmm in channel:
+                denominator += exp(
+                    c
+                    + log_velocity * (cv + cvv * log_velocity)
+                    + log_magnitude * (cm + cmm * log_magnitude)
+                )
+        except OverflowError:
+            denominator = inf
+        probabilities.append(1.0 / denominator)
+
+    return SepProbability(*probabilities, code, model.version)
+
+
+def trigger_key(triggerset: dict[str, Flare | CME], version: str | None = None) -> str:
+
+    # Canonical hash of every Flare/CME field and the model version
+    flare = triggerset["flare"]
+    cme = triggerset["cme"]
+    fields = (
+        MODEL.version if version is None else version,
+        None if flare is None else (
+            float(flare.longitude),
+            float(flare.magnitude),
+            str(flare.fclass),
+            flare.start.isoformat() if flare.start is not None else None,
+        ),
+        None if cme is None else (
+            float(cme.width),
+            float(cme.velocity),
+            cme.start.isoformat() if cme.start is not None else None,
+        ),
+    )
+    return hashlib.sha256(repr(fields).encode()).hexdigest()
+
+
+class PredictionStore:
+
+    # Persistent trigger key -> SepProbability store in an SQLite file
+    # (":memory:" keeps it for the lifetime of the object only)
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS sep_probabilities (key TEXT PRIMARY KEY, "
+            + ", ".join(f"probability_{energy} REAL" for energy in ENERGIES)
+            + ", regime INTEGER NOT NULL)"
+        )
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM sep_probabilities").fetchone()[0]
+
+    def get(self, keys: list[str], version: str | None = None) -> dict[str, SepProbability]:
+        # The keys hash the model version (trigger_key), which the found
+        # predictions are tagged with
+        found = {}
+        # stay below the SQLite limit on query parameters
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self.connection.execute(
+                "SELECT * FROM sep_probabilities WHERE key IN "
+                f"({', '.join('?' * len(chunk))})",
+                chunk,
             )
-        elif flare is not None:
-            # Flare only
-            if flare.longitude >= 20:
-                # Well connected
-
-                # E>10 MeV
-                # SEP flares
-                mean_log_hs_10 = -4.30615707813
-                sigma_log_hs_10 = 0.77544026801
-                p_halo_sep_10 = 0.018457044
-
-                # Non-SEP flares
-                mean_log_hns_10 = -5.47723640282
-                sigma_log_hns_10 = 0.40369972744
-                p_halo_not_sep_10 = 0.98154296
-
-                # Calculation of the PDFs for Well Connected Flares | E>10 MeV
-                pdf_halo_sep_10 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hs_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hs_10)
-                            / (sqrt(2) * sigma_log_hs_10)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_10 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hns_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hns_10)
-                            / (sqrt(2) * sigma_log_hns_10)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>10 MeV
-                p_sep_10 = (pdf_halo_sep_10 * p_halo_sep_10) / (
-                    (pdf_halo_sep_10 * p_halo_sep_10)
-                    + (pdf_halo_not_sep_10 * p_halo_not_sep_10)
-                )
-
-                # E>30 MeV
-                # SEP flares
-                mean_log_hs_30 = -4.16030931293
-                sigma_log_hs_30 = 0.77491862688
-                p_halo_sep_30 = 0.014473509
-                mean_log_hs_10_30 = -4.78902523009
-                sigma_log_hs_10_30 = 0.60458977795
-                p_halo_sep_10_30 = 0.0039835347
-
-                # Non SEPs Flares
-                mean_log_hns_30 = -5.47723640282
-                sigma_log_hns_30 = 0.40369972744
-                p_halo_not_sep_30 = 0.98154296
-
-                # Calculation of the PDFs for Well Connected Flares | E>30 MeV
-                pdf_halo_sep_30 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hs_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hs_30)
-                            / (sqrt(2) * sigma_log_hs_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_sep_10_30 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_hs_10_30
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hs_10_30)
-                            / (sqrt(2) * sigma_log_hs_10_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_30 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hns_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hns_30)
-                            / (sqrt(2) * sigma_log_hns_30)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>30 MeV
-                p_sep_30 = (pdf_halo_sep_30 * p_halo_sep_30) / (
-                    (pdf_halo_sep_30 * p_halo_sep_30)
-                    + (pdf_halo_sep_10_30 * p_halo_sep_10_30)
-                    + (pdf_halo_not_sep_30 * p_halo_not_sep_30)
-                )
-
-                # E>60 MeV
-                # SEP Flares
-                mean_log_hs_60 = -4.03956277409
-                sigma_log_hs_60 = 0.73534454303
-                p_halo_sep_60 = 0.012083389
-                mean_log_hs_10_60 = -4.76416660627
-                sigma_log_hs_10_60 = 0.59112431878
-                p_halo_sep_10_60 = 0.0063736556
-
-                # Non SEPs Flares
-                mean_log_hns_60 = -5.46471549786
-                sigma_log_hns_60 = 0.40609458630
-                p_halo_not_sep_60 = 0.97991189
-
-                # Calculation of the PDFs for Well Connected Flares | E>60 MeV
-                pdf_halo_sep_60 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hs_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hs_60)
-                            / (sqrt(2) * sigma_log_hs_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_sep_10_60 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_hs_10_60
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hs_10_60)
-                            / (sqrt(2) * sigma_log_hs_10_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_60 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hns_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hns_60)
-                            / (sqrt(2) * sigma_log_hns_60)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>60 MeV
-                p_sep_60 = (pdf_halo_sep_60 * p_halo_sep_60) / (
-                    (pdf_halo_sep_60 * p_halo_sep_60)
-                    + (pdf_halo_sep_10_60 * p_halo_sep_10_60)
-                    + (pdf_halo_not_sep_60 * p_halo_not_sep_60)
-                )
-
-                # E>100 MeV
-                # SEP Flares
-                mean_log_hs_100 = -3.94288784905
-                sigma_log_hs_100 = 0.71734976905
-                p_halo_sep_100 = 0.0099588368
-                mean_log_hs_10_100 = -4.68866759299
-                sigma_log_hs_10_100 = 0.61025004699
-                p_halo_sep_10_100 = 0.0084982074
-
-                # Non SEPs Flares
-                mean_log_hns_100 = -5.46471549786
-                sigma_log_hns_100 = 0.40609458630
-                p_halo_not_sep_100 = 0.97991189
-
-                # Calculation of the PDFs for Well Connected Flares | E>100 MeV
-                pdf_halo_sep_100 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hs_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hs_100)
-                            / (sqrt(2) * sigma_log_hs_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_100 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hns_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hns_100)
-                            / (sqrt(2) * sigma_log_hns_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_sep_10_100 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_hs_10_100
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hs_10_100)
-                            / (sqrt(2) * sigma_log_hs_10_100)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>100 MeV
-                p_sep_100 = (pdf_halo_sep_100 * p_halo_sep_100) / (
-                    (pdf_halo_sep_100 * p_halo_sep_100)
-                    + (pdf_halo_sep_10_100 * p_halo_sep_10_100)
-                    + (pdf_halo_not_sep_100 * p_halo_not_sep_100)
-                )
-
-                # E>300 MeV
-                # SEP Flares
-                mean_log_hs_300 = -3.45311151509
-                sigma_log_hs_300 = 0.47153478691
-                p_halo_sep_300 = 0.017843289
-                mean_log_hns_10_300 = -4.23701745383
-                sigma_log_hns_10_300 = 0.48230103188
-                p_halo_sep_10_300 = 0.068269977
-
-                # Non SEPs Flares
-                mean_log_hns_300 = -5.46471549786
-                sigma_log_hns_300 = 0.40609458630
-                p_halo_not_sep_300 = 0.97991189
-
-                # Calculation of the PDFs for Well Connected Flares | E>300 MeV
-                pdf_halo_sep_300 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hs_300 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hs_300)
-                            / (sqrt(2) * sigma_log_hs_300)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_300 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hns_300 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hns_300)
-                            / (sqrt(2) * sigma_log_hns_300)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_sep_10_300 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_hns_10_300
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hns_10_300)
-                            / (sqrt(2) * sigma_log_hns_10_300)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>300 MeV
-                p_sep_300 = (pdf_halo_sep_300 * p_halo_sep_300) / (
-                    (pdf_halo_sep_300 * p_halo_sep_300)
-                    + (pdf_halo_sep_10_300 * p_halo_sep_10_300)
-                    + (pdf_halo_not_sep_300 * p_halo_not_sep_300)
-                )
-
-                # Advanced Warnign Time (AWT) in minutes for each integral energy for Non Halo CMEs
-                awt_10 = 61.70  # mean value from statistics
-                awt_30 = 55.25  # dummy
-                awt_60 = 42.85  # dummy
-                awt_100 = 34.25  # dummy
-                awt_300 = 22.36  # dummy
-
-                # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Non Halo CMEs
-                p_error_10 = (0.014066304, 0.020337673, 0.024509694)
-                p_error_30 = (0.012562036, 0.017870102, 0.021311094)
-                p_error_60 = (0.011315560, 0.016107894, 0.018875476)
-                p_error_100 = (0.0095223660, 0.013405966, 0.015616814)
-                p_error_300 = (0.00073615809, 0.0010778833, 0.0013181242)
-            elif flare.longitude < 20:
-                # Poorly connected
-
-                # E>10 MeV
-                # SEP Flares
-                mean_log_phs_10 = -4.16627093702
-                sigma_log_phs_10 = 0.71992156865
-                p_phalo_sep_10 = 0.0095541401
-
-                # Non SEPs Flares
-                mean_log_phns_10 = -5.49096499172
-                sigma_log_phns_10 = 0.39712862763
-                p_phalo_not_sep_10 = 0.99044586
-
-                # Calculation of the PDFs for Poorly Connected Flares | E>10 MeV
-                pdf_phalo_sep_10 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_phs_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phs_10)
-                            / (sqrt(2) * sigma_log_phs_10)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_not_sep_10 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_phns_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phns_10)
-                            / (sqrt(2) * sigma_log_phns_10)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>10 MeV
-                p_sep_10 = (pdf_phalo_sep_10 * p_phalo_sep_10) / (
-                    (pdf_phalo_sep_10 * p_phalo_sep_10)
-                    + (pdf_phalo_not_sep_10 * p_phalo_not_sep_10)
-                )
-
-                # E>30 MeV
-                # SEP Flares
-                mean_log_phs_30 = -4.01889502483
-                sigma_log_phs_30 = 0.64946127335
-                p_phalo_sep_30 = 0.0066024546
-                mean_log_phs_10_30 = -4.50200834019
-                sigma_log_phs_10_30 = 0.63040595626
-                p_phalo_sep_10_30 = 0.0029516856
-
-                # Non SEPs Flares
-                mean_log_phns_30 = -5.49096499172
-                sigma_log_phns_30 = 0.39712862763
-                p_phalo_not_sep_30 = 0.99044586
-
-                # Calculation of the PDFs for Poorly Connected Flares | E>30 MeV
-                pdf_phalo_sep_30 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_phs_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phs_30)
-                            / (sqrt(2) * sigma_log_phs_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_sep_10_30 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_phs_10_30
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phs_10_30)
-                            / (sqrt(2) * sigma_log_phs_10_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_not_sep_30 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_phns_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phns_30)
-                            / (sqrt(2) * sigma_log_phns_30)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>30 MeV
-                p_sep_30 = (pdf_phalo_sep_30 * p_phalo_sep_30) / (
-                    (pdf_phalo_sep_30 * p_phalo_sep_30)
-                    + (pdf_phalo_sep_10_30 * p_phalo_sep_10_30)
-                    + (pdf_phalo_not_sep_30 * p_phalo_not_sep_30)
-                )
-
-                # E>60 MeV
-                # SEP Flares
-                mean_log_phs_60 = -3.92413613184
-                sigma_log_phs_60 = 0.61928361541
-                p_phalo_sep_60 = 0.0043498524
-                mean_log_phs_10_60 = -4.36906517840
-                sigma_log_phs_10_60 = 0.66202275738
-                p_phalo_sep_10_60 = 0.0052042877
-
-                # Non SEPs Flares
-                mean_log_phns_60 = -5.51027933809
-                sigma_log_phns_60 = 0.38777545772
-                p_phalo_not_sep_60 = 0.98781433
-
-                # Calculation of the PDFs for Poorly Connected Flares | E>60 MeV
-                pdf_phalo_sep_60 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_phs_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phs_60)
-                            / (sqrt(2) * sigma_log_phs_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_not_sep_60 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_phns_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phns_60)
-                            / (sqrt(2) * sigma_log_phns_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_sep_10_60 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_phs_10_60
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phs_10_60)
-                            / (sqrt(2) * sigma_log_phs_10_60)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>60 MeV
-                p_sep_60 = (pdf_phalo_sep_60 * p_phalo_sep_60) / (
-                    (pdf_phalo_sep_60 * p_phalo_sep_60)
-                    + (pdf_phalo_sep_10_60 * p_phalo_sep_10_60)
-                    + (pdf_phalo_not_sep_60 * p_phalo_not_sep_60)
-                )
-
-                # E>100 MeV
-                # SEP Flares
-                mean_log_phs_100 = -3.84450553191
-                sigma_log_phs_100 = 0.75770488028
-                p_phalo_sep_100 = 0.0028740096
-                mean_log_phs_10_100 = -4.28984644442
-                sigma_log_phs_10_100 = 0.64620449520
-                p_phalo_sep_10_100 = 0.0066801305
-
-                # Non SEPs Flares
-                mean_log_phns_100 = -5.51027933809
-                sigma_log_phns_100 = 0.38777545772
-                p_phalo_not_sep_100 = 0.98781433
-
-                # Calculation of the PDFs for Poorly Connected Flares | E>100 MeV
-                pdf_phalo_sep_100 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_phs_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phs_100)
-                            / (sqrt(2) * sigma_log_phs_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_not_sep_100 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_phns_100
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phns_100)
-                            / (sqrt(2) * sigma_log_phns_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_sep_10_100 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_phs_10_100
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phs_10_100)
-                            / (sqrt(2) * sigma_log_phs_10_100)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>100 MeV
-                p_sep_100 = (pdf_phalo_sep_100 * p_phalo_sep_100) / (
-                    (pdf_phalo_sep_100 * p_phalo_sep_100)
-                    + (pdf_phalo_sep_10_100 * p_phalo_sep_10_100)
-                    + (pdf_phalo_not_sep_100 * p_phalo_not_sep_100)
-                )
-
-                # E>300 MeV
-                # SEP Flares
-                mean_log_hs_300 = -3.21840130251
-                sigma_log_hs_300 = 0.40466116203
-                p_halo_sep_300 = 0.0043945313
-                mean_log_phs_10_300 = -4.23292661895
-                sigma_log_phs_10_300 = 0.68785341383
-                p_halo_sep_10_300 = 0.055664063
-
-                # Non SEPs Flares
-                mean_log_phns_300 = -5.51027933809
-                sigma_log_phns_300 = 0.38777545772
-                p_halo_not_sep_300 = 0.98781433
-
-                # Calculation of the PDFs for Poorly Connected Flares | E>300 MeV
-                pdf_halo_sep_300 = (
-                    1.0
-                    / (flare.magnitude * sigma_log_hs_300 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_hs_300)
-                            / (sqrt(2) * sigma_log_hs_300)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_300 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_phns_300
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phns_300)
-                            / (sqrt(2) * sigma_log_phns_300)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_sep_10_300 = (
-                    1.0
-                    / (
-                        flare.magnitude
-                        * sigma_log_phs_10_300
-                        * log(10)
-                        * sqrt(2 * pi)
-                    )
-                ) * exp(
-                    -(
-                        (
-                            (log10(flare.magnitude) - mean_log_phs_10_300)
-                            / (sqrt(2) * sigma_log_phs_10_300)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>300 MeV
-                p_sep_300 = (pdf_halo_sep_300 * p_halo_sep_300) / (
-                    (pdf_halo_sep_300 * p_halo_sep_300)
-                    + (pdf_halo_sep_10_300 * p_halo_sep_10_300)
-                    + (pdf_halo_not_sep_300 * p_halo_not_sep_300)
-                )
-
-                # Advanced Warnign Time (AWT) in minutes for each integral energy for Partial Halo CMEs
-                awt_10 = 65.05  # mean value from statistics
-                awt_30 = 60.58  # dummy
-                awt_60 = 55.23  # dummy
-                awt_100 = 47.36  # dummy
-                awt_300 = 36.25  # dummy
-
-                # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Partial Halo CMEs
-                p_error_10 = (0.019304538, 0.027341748, 0.031418604)
-                p_error_30 = (0.013921091, 0.019509173, 0.022322554)
-                p_error_60 = (0.0083737216, 0.011893846, 0.013542637)
-                p_error_100 = (0.0047864420, 0.0067026134, 0.0075787174)
-                p_error_300 = (0.00020983171, 0.00035864910, 0.00050209594)
-
-            sep_probabilities.append(
-                {
-                    "probability_10": p_sep_10,
-                    "probability_30": p_sep_30,
-                    "probability_60": p_sep_60,
-                    "probability_100": p_sep_100,
-                    "probability_300": p_sep_300,
-                    "awt_10": awt_10,
-                    "awt_30": awt_30,
-                    "awt_60": awt_60,
-                    "awt_100": awt_100,
-                    "awt_300": awt_300,
-                    "p_error_10": p_error_10,
-                    "p_error_30": p_error_30,
-                    "p_error_60": p_error_60,
-                    "p_error_100": p_error_100,
-                    "p_error_300": p_error_300,
-                }
+            for key, *values in rows:
+                found[key] = SepProbability(*values, version)
+        return found
+
+    def put(self, predictions: dict[str, SepProbability]) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO sep_probabilities VALUES "
+                f"(?, {', '.join('?' * (len(ENERGIES) + 1))})",
+                [(key, *p[:len(ENERGIES)], p.regime) for key, p in predictions.items()],
             )
-        elif cme is not None:
-            # CME only
-            if cme.width < 120:
-                # Non Halo CME
-
-                # E>10 MeV
-                # SEP CMEs
-                mean_log_nhs_10 = 2.82257556915
-                sigma_log_nhs_10 = 0.27493494749
-                p_nhalo_sep_10 = 0.0049800797
-
-                # Non SEPs CMEs
-                mean_log_nhns_10 = 2.56826519966
-                sigma_log_nhns_10 = 0.22966578603
-                p_nhalo_not_sep_10 = 0.99501992
-
-                # Calculation of the PDFs for Non Halo CMEs | E>10 MeV
-                pdf_nhalo_sep_10 = (
-                    1.0 / (cme.velocity * sigma_log_nhs_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhs_10)
-                            / (sqrt(2) * sigma_log_nhs_10)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_nhalo_not_sep_10 = (
-                    1.0
-                    / (cme.velocity * sigma_log_nhns_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhns_10)
-                            / (sqrt(2) * sigma_log_nhns_10)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>10 MeV
-                p_sep_10 = (pdf_nhalo_sep_10 * p_nhalo_sep_10) / (
-                    (pdf_nhalo_sep_10 * p_nhalo_sep_10)
-                    + (pdf_nhalo_not_sep_10 * p_nhalo_not_sep_10)
-                )
-
-                # E>30 MeV
-                # SEP CMEs
-                mean_log_nhs_30 = 2.87594962120
-                sigma_log_nhs_30 = 0.29943174124
-                p_nhalo_sep_30 = 0.0029880478
-                mean_log_nhs_10_30 = 2.70479297638
-                sigma_log_nhs_10_30 = 0.21277628839
-                p_nhalo_sep_10_30 = 0.0019920319
-
-                # Non SEPs CMEs
-                mean_log_nhns_30 = 2.56826519966
-                sigma_log_nhns_30 = 0.22966578603
-                p_nhalo_not_sep_30 = 0.99501992
-
-                # Calculation of the PDFs for Non Halo CMEs | E>30 MeV
-                pdf_nhalo_sep_30 = (
-                    1.0 / (cme.velocity * sigma_log_nhs_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhs_30)
-                            / (sqrt(2) * sigma_log_nhs_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_nhalo_not_sep_30 = (
-                    1.0
-                    / (cme.velocity * sigma_log_nhns_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhns_30)
-                            / (sqrt(2) * sigma_log_nhns_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_nhalo_sep_10_30 = (
-                    1.0
-                    / (cme.velocity * sigma_log_nhs_10_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhs_10_30)
-                            / (sqrt(2) * sigma_log_nhs_10_30)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>30 MeV
-                p_sep_30 = (pdf_nhalo_sep_30 * p_nhalo_sep_30) / (
-                    (pdf_nhalo_sep_30 * p_nhalo_sep_30)
-                    + (pdf_nhalo_sep_10_30 * p_nhalo_sep_10_30)
-                    + (pdf_nhalo_not_sep_30 * p_nhalo_not_sep_30)
-                )
-
-                # E>60 MeV
-                # SEP CMEs
-                mean_log_nhs_60 = 2.92284369469
-                sigma_log_nhs_60 = 0.34405881166
-                p_nhalo_sep_60 = 0.0016600266
-                mean_log_nhs_10_60 = 2.75087952614
-                sigma_log_nhs_10_60 = 0.14460618794
-                p_nhalo_sep_10_60 = 0.0033200531
-
-                # Non SEPs CMEs
-                mean_log_nhns_60 = 2.56826519966
-                sigma_log_nhns_60 = 0.22966578603
-                p_nhalo_not_sep_60 = 0.99501992
-
-                # Calculation of the PDFs for Partial Halo CMEs | E>60 MeV
-                pdf_nhalo_sep_60 = (
-                    1.0 / (cme.velocity * sigma_log_nhs_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhs_60)
-                            / (sqrt(2) * sigma_log_nhs_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_nhalo_not_sep_60 = (
-                    1.0
-                    / (cme.velocity * sigma_log_nhns_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhns_60)
-                            / (sqrt(2) * sigma_log_nhns_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_nhalo_sep_10_60 = (
-                    1.0
-                    / (cme.velocity * sigma_log_nhs_10_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhs_10_60)
-                            / (sqrt(2) * sigma_log_nhs_10_60)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>60 MeV
-                p_sep_60 = (pdf_nhalo_sep_60 * p_nhalo_sep_60) / (
-                    (pdf_nhalo_sep_60 * p_nhalo_sep_60)
-                    + (pdf_nhalo_sep_10_60 * p_nhalo_sep_10_60)
-                    + (pdf_nhalo_not_sep_60 * p_nhalo_not_sep_60)
-                )
-
-                # E>100 MeV
-                # SEP CMEs
-                mean_log_nhs_100 = 2.78089141846
-                sigma_log_nhs_100 = 0.46015313268
-                p_nhalo_sep_100 = 0.0013280212
-                mean_log_nhs_10_100 = 2.78115367889
-                sigma_log_nhs_10_100 = 0.21313931048
-                p_nhalo_sep_10_100 = 0.0036520584
-
-                # Non SEPs CMEs
-                mean_log_nhns_100 = 2.56826519966
-                sigma_log_nhns_100 = 0.22966578603
-                p_nhalo_not_sep_100 = 0.99501992
-
-                # Calculation of the PDFs for Partial Halo CMEs | E>100 MeV
-                pdf_nhalo_sep_100 = (
-                    1.0
-                    / (cme.velocity * sigma_log_nhs_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhs_100)
-                            / (sqrt(2) * sigma_log_nhs_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_nhalo_not_sep_100 = (
-                    1.0
-                    / (cme.velocity * sigma_log_nhns_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhns_100)
-                            / (sqrt(2) * sigma_log_nhns_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_nhalo_sep_10_100 = (
-                    1.0
-                    / (cme.velocity * sigma_log_nhs_10_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_nhs_10_100)
-                            / (sqrt(2) * sigma_log_nhs_10_100)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>100 MeV
-                p_sep_100 = (pdf_nhalo_sep_100 * p_nhalo_sep_100) / (
-                    (pdf_nhalo_sep_100 * p_nhalo_sep_100)
-                    + (pdf_nhalo_sep_10_100 * p_nhalo_sep_10_100)
-                    + (pdf_nhalo_not_sep_100 * p_nhalo_not_sep_100)
-                )
-
-                # E>300 MeV
-                # SEP CMEs
-                p_sep_300 = None
-
-                # Advanced Warnign Time (AWT) in minutes for each integral energy for Non Halo CMEs
-                awt_10 = 189.78  # mean value from statistics
-                awt_30 = 170.35  # dummy
-                awt_60 = 132.58  # dummy
-                awt_100 = 112.72  # dummy
-                awt_300 = 98.32  # dummy
-
-                # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Non Halo CMEs
-                p_error_10 = (0.019044089, 0.016825785, 0.015605077)
-                p_error_30 = (0.0017833936, 0.0014276593, 0.0012886692)
-                p_error_60 = (0.00029824883, 0.00040755684, 0.00049231248)
-                p_error_100 = (0.0050464103, 0.0037166936, 0.0032635845)
-                p_error_300 = (None, None, None)
-            elif 120 <= cme.width < 360:
-                # Partial Halo CME
-
-                # E>10 MeV
-                # SEP CMEs
-                mean_log_phs_10 = 3.02453112602
-                sigma_log_phs_10 = 0.23913200200
-                p_phalo_sep_10 = 0.091133005
-
-                # Non SEPs CMEs
-                mean_log_phns_10 = 2.74093413353
-                sigma_log_phns_10 = 0.22231969237
-                p_phalo_not_sep_10 = 0.90886700
-
-                # Calculation of the PDFs for Halo CMEs | E>10 MeV
-                pdf_phalo_sep_10 = (
-                    1.0 / (cme.velocity * sigma_log_phs_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phs_10)
-                            / (sqrt(2) * sigma_log_phs_10)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_not_sep_10 = (
-                    1.0
-                    / (cme.velocity * sigma_log_phns_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phns_10)
-                            / (sqrt(2) * sigma_log_phns_10)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>10 MeV
-                p_sep_10 = (pdf_phalo_sep_10 * p_phalo_sep_10) / (
-                    (pdf_phalo_sep_10 * p_phalo_sep_10)
-                    + (pdf_phalo_not_sep_10 * p_phalo_not_sep_10)
-                )
 
-                # E>30 MeV
-                # SEP CMEs
-                mean_log_phs_30 = 3.02310156822
-                sigma_log_phs_30 = 0.25269654393
-                p_phalo_sep_30 = 0.071428571
-                mean_log_phs_10_30 = 2.98286390305
-                sigma_log_phs_10_30 = 0.20173968375
-                p_phalo_sep_10_30 = 0.019704433
-
-                # Non SEPs CMEs
-                mean_log_phns_30 = 2.74093413353
-                sigma_log_phns_30 = 0.22231969237
-                p_phalo_not_sep_30 = 0.90886700
-
-                # Calculation of the PDFs for Partial Halo CMEs | E>30 MeV
-                pdf_phalo_sep_30 = (
-                    1.0 / (cme.velocity * sigma_log_phs_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phs_30)
-                            / (sqrt(2) * sigma_log_phs_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_not_sep_30 = (
-                    1.0
-                    / (cme.velocity * sigma_log_phns_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phns_30)
-                            / (sqrt(2) * sigma_log_phns_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_sep_10_30 = (
-                    1.0
-                    / (cme.velocity * sigma_log_phs_10_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phs_10_30)
-                            / (sqrt(2) * sigma_log_phs_10_30)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>30 MeV
-                p_sep_30 = (pdf_phalo_sep_30 * p_phalo_sep_30) / (
-                    (pdf_phalo_sep_30 * p_phalo_sep_30)
-                    + (pdf_phalo_sep_10_30 * p_phalo_sep_10_30)
-                    + (pdf_phalo_not_sep_30 * p_phalo_not_sep_30)
-                )
-
-                # E>60 MeV
-                # SEP CMEs
-                mean_log_phs_60 = 3.01655149460
-                sigma_log_phs_60 = 0.23858144879
-                p_phalo_sep_60 = 0.044334975
-                mean_log_phs_10_60 = 3.01141262054
-                sigma_log_phs_10_60 = 0.24460618198
-                p_phalo_sep_10_60 = 0.046798030
-
-                # Non SEPs CMEs
-                mean_log_phns_60 = 2.74093413353
-                sigma_log_phns_60 = 0.22231969237
-                p_phalo_not_sep_60 = 0.90886
-
-                # Calculation of the PDFs for Partial Halo CMEs | E>60 MeV
-                pdf_phalo_sep_60 = (
-                    1.0 / (cme.velocity * sigma_log_phs_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phs_60)
-                            / (sqrt(2) * sigma_log_phs_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_not_sep_60 = (
-                    1.0
-                    / (cme.velocity * sigma_log_phns_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phns_60)
-                            / (sqrt(2) * sigma_log_phns_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_sep_10_60 = (
-                    1.0
-                    / (cme.velocity * sigma_log_phs_10_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phs_10_60)
-                            / (sqrt(2) * sigma_log_phs_10_60)
-                        )
-                        ** 2
-                    )
-                )
+    def close(self) -> None:
+        self.connection.close()
+
+
+_PROBABILITY_KEYS = tuple(f"probability_{energy}" for energy in ENERGIES)
+_RESULT_KEYS = (
+    _PROBABILITY_KEYS
+    + tuple(f"awt_{energy}" for energy in ENERGIES)
+    + tuple(f"p_error_{energy}" for energy in ENERGIES)
+)
+_NO_REGIME_KEYS = ("probability_10", "probability_30", "probability_100", "probability_300")
+# result key -> (Regime attribute or "probability", index in ENERGIES)
+_RESULT_KEY_INDEX = {
+    key: (kind, e)
+    for kind in ("probability", "awt", "p_error")
+    for e, key in enumerate(f"{kind}_{energy}" for energy in ENERGIES)
+}
+
+
+class SepProbabilityDict(dict):
+
+    # sepprobs result dict of a call with energies: the channels not in
+    # requested (over ENERGIES) are None whatever their probability, and
+    # sepchars evaluates those it needs itself
+    __slots__ = ("requested",)
+
+    def __init__(self, values: dict[str, Any], requested: tuple[bool, ...]) -> None:
+        super().__init__(values)
+        self.requested = requested
+
+
+def _sep_probability_dict(
+    p: SepProbability, requested: tuple[bool, ...] | None = None
+) -> dict[str, Any]:
+    # requested: the channels p was evaluated for, None for all of them
+    if p.regime == NO_REGIME:
+        sp = {
+            "probability_10": None,
+            "probability_30": None,
+            "probability_100": None,
+            "probability_300": None
+        }
+    else:
+        sp = dict(zip(_PROBABILITY_KEYS, p))
+        sp.update(model_of(p.version).entries[p.regime])
+    return sp if requested is None else SepProbabilityDict(sp, requested)
+
+
+class SepProbabilityView(Mapping):
+
+    # Read-only dict of one trigger of a SepProbabilities table, with the keys
+    # of the sepprobs result dicts, resolved on access
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "SepProbabilities", index: int) -> None:
+        self._table = table
+        self._index = index
+
+    @property
+    def requested(self) -> tuple[bool, ...]:
+        return self._table.requested
+
+    def _keys(self) -> tuple[str, ...]:
+        if self._table.regimes[self._index] == NO_REGIME:
+            return _NO_REGIME_KEYS
+        return _RESULT_KEYS
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys():
+            raise KeyError(key)
+        kind, e = _RESULT_KEY_INDEX[key]
+        if kind == "probability":
+            value = self._table.probabilities[e, self._index]
+            return None if np.isnan(value) else float(value)
+        regime = model_of(self._table.version).regimes[self._table.regimes[self._index]]
+        return getattr(regime, kind)[ENERGIES[e]]
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class SepProbabilities(Sequence):
+
+    # Columnar sepprobs results: one contiguous array per channel and the
+    # regime code of every trigger, which indexes the AWT and error tables
+    # shared by all triggers of a regime (MODEL.awt, MODEL.p_error).
+    # Indexing a trigger gives a SepProbabilityView of it.
+    def __init__(
+        self,
+        probabilities: np.ndarray,
+        regimes: np.ndarray,
+        version: str | None = None,
+        requested: tuple[bool, ...] | None = None,
+    ) -> None:
+        # probabilities: (energy, trigger), NaN where sepprobs has None;
+        # version: of the model that gave them (default: the active one);
+        # requested: the channels evaluated (default: all), the others are NaN
+        self.probabilities = probabilities
+        self.regimes = regimes.astype(np.uint8, copy=False)
+        self.version = MODEL.version if version is None else version
+        self.requested = (True,) * len(ENERGIES) if requested is None else requested
+
+    @classmethod
+    def from_predictions(
+        cls,
+        predictions: list[SepProbability],
+        dtype: type = np.float64,
+        requested: tuple[bool, ...] | None = None,
+    ) -> "SepProbabilities":
+        values = np.array(
+            [p[:len(ENERGIES)] for p in predictions], dtype=float
+        ).reshape(len(predictions), len(ENERGIES)).astype(dtype)
+        return cls(
+            np.ascontiguousarray(values.T),
+            np.array([p.regime for p in predictions], dtype=np.uint8),
+            predictions[0].version if predictions else None,
+            requested,
+        )
+
+    def __len__(self) -> int:
+        return len(self.regimes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SepProbabilities(
+                self.probabilities[:, index], self.regimes[index], self.version, self.requested
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SepProbabilities index out of range")
+        return SepProbabilityView(self, index)
+
+    def probability(self, energy: int) -> np.ndarray:
+        return self.probabilities[ENERGIES.index(energy)]
+
+    def awt(self, energy: int) -> np.ndarray:
+        return model_of(self.version).awt[self.regimes, ENERGIES.index(energy)]
+
+    def p_error(self, energy: int) -> np.ndarray:
+        # (trigger, sigma)
+        return model_of(self.version).p_error[self.regimes, ENERGIES.index(energy)]
+
+    def to_dataframe(
+        self,
+        regime_tables: bool = False,
+        sep_characteristics: "SepCharacteristics | None" = None,
+        wide: bool = False,
+        index=None,
+        copy: bool = False,
+    ):
+        # One numeric row per trigger: the probabilities and the regime code,
+        # with sep_characteristics (of the same triggers, e.g. from predict)
+        # their peak fluxes, NaN for None, and with regime_tables the AWT and
+        # p_error columns. wide names the columns p<energy> and
+        # pf<energy>_<50|90> instead of probability_<energy> and
+        # peak_flux_<energy>_<level>. The probability and peak flux columns
+        # are the result arrays themselves, so the frame is to be treated as
+        # read-only; with copy, they are copies the caller may modify.
+        import pandas as pd
+
+        if sep_characteristics is not None and len(sep_characteristics) != len(self):
+            raise ValueError("Provided mismatching number of probabilities and characteristics.")
+        columns = {
+            f"p{energy}" if wide else f"probability_{energy}": self.probabilities[e]
+            for e, energy in enumerate(ENERGIES)
+        }
+        columns["regime"] = self.regimes
+        if sep_characteristics is not None:
+            for e, energy in enumerate(SEPCHARS_PROBABILITIES):
+                for k, level in enumerate(PEAK_FLUX_LEVELS):
+                    name = (
+                        f"pf{energy}_{level.removesuffix('cl')}" if wide
+                        else f"peak_flux_{energy}_{level}"
+                    )
+                    columns[name] = sep_characteristics.peak_flux[e, k]
+        if regime_tables:
+            for energy in ENERGIES:
+                columns[f"awt_{energy}"] = self.awt(energy)
+            for energy in ENERGIES:
+                errors = self.p_error(energy)
+                for sigma in range(errors.shape[1]):
+                    columns[f"p_error_{energy}_{sigma + 1}sigma"] = errors[:, sigma]
+        return pd.DataFrame(columns, index=index, copy=copy)
+
+
+class SepCharacteristics(Sequence):
+
+    # Columnar sepchars results: (energy, confidence level, trigger) peak
+    # fluxes over SEPCHARS_PROBABILITIES and PEAK_FLUX_LEVELS, NaN for None.
+    # Indexing a trigger builds its sepchars dict.
+    def __init__(self, peak_flux: np.ndarray, version: str | None = None) -> None:
+        self.peak_flux = peak_flux
+        self.version = MODEL.version if version is None else version
+
+    def __len__(self) -> int:
+        return self.peak_flux.shape[-1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SepCharacteristics(self.peak_flux[..., index], self.version)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SepCharacteristics index out of range")
+        values = self.peak_flux[..., index].tolist()
+        return {
+            "peak_flux": {
+                str(energy): {
+                    level: None if value != value else value
+                    for level, value in zip(PEAK_FLUX_LEVELS, values[e])
+                }
+                for e, energy in enumerate(SEPCHARS_PROBABILITIES)
+            }
+        }
 
-                # Calculation of the Probability for SEP Occurrence | E>60 MeV
-                p_sep_60 = (pdf_phalo_sep_60 * p_phalo_sep_60) / (
-                    (pdf_phalo_sep_60 * p_phalo_sep_60)
-                    + (pdf_phalo_sep_10_60 * p_phalo_sep_10_60)
-                    + (pdf_phalo_not_sep_60 * p_phalo_not_sep_60)
-                )
+    def band(self, energy: int, level: str) -> np.ndarray:
+        return self.peak_flux[SEPCHARS_PROBABILITIES.index(energy), PEAK_FLUX_LEVELS.index(level)]
+
+
+@_stage("sepprobs")
+def sepprobs(
+    triggers: list[dict[str, Flare | CME]],
+    store: PredictionStore | None = None,
+    energies: tuple[int, ...] | list[int] | None = None,
+    columnar: bool = False,
+    dtype: type = np.float64,
+) -> list[dict[str, Any]]:
+
+    # Probabilities of channels not in energies are None; the store always
+    # holds complete predictions so that later calls can ask for any channel.
+    # The results record the channels requested, so that sepchars evaluates
+    # the SEPCHARS_PROBABILITIES among the others itself.
+    # With columnar the results are a SepProbabilities table instead of dicts,
+    # with probability columns of dtype (see sepprobs_batch).
+    # The results are of the model active at the call, its version is the
+    # "model_version" of the output.
+    requested = _energy_mask(energies)
+    model = MODEL
+    version = model.version
+
+    if columnar and store is None:
+        probabilities, codes = _evaluate_columns(
+            model, *trigger_columns(triggers), requested, dtype=dtype
+        )
+        return {
+            "sep_probabilities": SepProbabilities(probabilities, codes, version, requested),
+            "model_version": version,
+        }
 
-                # E>100 MeV
-                # SEP CMEs
-                mean_log_phs_100 = 3.04320573807
-                sigma_log_phs_100 = 0.20936892927
-                p_phalo_sep_100 = 0.027093596
-                mean_log_phs_10_100 = 3.00515580177
-                sigma_log_phs_10_100 = 0.24573022127
-                p_phalo_sep_10_100 = 0.064039409
-
-                # Non SEPs CMEs
-                mean_log_phns_100 = 2.74093413353
-                sigma_log_phns_100 = 0.22231969237
-                p_phalo_not_sep_100 = 0.90886700
-
-                # Calculation of the PDFs for Partial Halo CMEs | E>100 MeV
-                pdf_phalo_sep_100 = (
-                    1.0
-                    / (cme.velocity * sigma_log_phs_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phs_100)
-                            / (sqrt(2) * sigma_log_phs_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_not_sep_100 = (
-                    1.0
-                    / (cme.velocity * sigma_log_phns_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phns_100)
-                            / (sqrt(2) * sigma_log_phns_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_phalo_sep_10_100 = (
-                    1.0
-                    / (cme.velocity * sigma_log_phs_10_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_phs_10_100)
-                            / (sqrt(2) * sigma_log_phs_10_100)
-                        )
-                        ** 2
-                    )
-                )
+    # keep only the triggers for which a prediction hasn't already been produced
+    if store is not None:
+        keys = [trigger_key(triggerset, version) for triggerset in triggers]
+        predictions = store.get(keys, version)
+        new_predictions = {}
+        for key, triggerset in zip(keys, triggers):
+            if key not in predictions and key not in new_predictions:
+                new_predictions[key] = sepprob(triggerset["flare"], triggerset["cme"], model=model)
+        store.put(new_predictions)
+        predictions.update(new_predictions)
+        results = [predictions[key] for key in keys]
+        if energies is not None:
+            results = [
+                SepProbability(
+                    *(value if r else None for value, r in zip(p, requested)),
+                    p.regime, p.version,
+                )
+                for p in results
+            ]
+    else:
+        results = [
+            sepprob(triggerset["flare"], triggerset["cme"], energies, model)
+            for triggerset in triggers
+        ]
+
+    if columnar:
+        return {
+            "sep_probabilities": SepProbabilities.from_predictions(results, dtype, requested),
+            "model_version": version,
+        }
 
-                # Calculation of the Probability for SEP Occurrence | E>100 MeV
-                p_sep_100 = (pdf_phalo_sep_100 * p_phalo_sep_100) / (
-                    (pdf_phalo_sep_100 * p_phalo_sep_100)
-                    + (pdf_phalo_sep_10_100 * p_phalo_sep_10_100)
-                    + (pdf_phalo_not_sep_100 * p_phalo_not_sep_100)
+    masked = None if all(requested) else requested
+    sep_probabilities = [_sep_probability_dict(p, masked) for p in results]
+
+    return {"sep_probabilities": sep_probabilities, "model_version": version}
+
+
+def classify(
+    longitude: np.ndarray,
+    width: np.ndarray,
+    has_flare: np.ndarray,
+    has_cme: np.ndarray,
+) -> np.ndarray:
+
+    # Code in REGIMES of every trigger, with the branch conditions of
+    # trigger_regime evaluated as whole-array comparisons
+    well = longitude >= 20
+    partial_halo = (120 <= width) & (width < 360)
+    connectivity = np.where(well, 0, 1)
+    # Flare & CME: exactly 360 deg is halo, everything outside [120, 360) non halo
+    flare_cme_class = np.where(width == 360, 0, np.where(partial_halo, 1, 2))
+    # CME only: everything from 360 deg up is halo
+    cme_class = np.where(width < 120, 2, np.where(partial_halo, 1, 0))
+
+    return np.select(
+        [
+            has_flare & has_cme,
+            has_flare & ~has_cme & well,
+            # a flare without longitude is neither well nor poorly connected
+            has_flare & ~has_cme & (longitude < 20),
+            has_cme & ~has_flare,
+        ],
+        [
+            np.array(_FLARE_CME_CODES)[connectivity, flare_cme_class],
+            _FLARE_CODES[0],
+            _FLARE_CODES[1],
+            np.array(_CME_CODES)[cme_class],
+        ],
+        NO_REGIME,
+    )
+
+
+def group_by_regime(codes: np.ndarray) -> tuple[np.ndarray, list[slice]]:
+    # Permutation that makes every regime a contiguous block, and the block of
+    # each regime (in REGIMES order) within the permuted triggers
+    order = np.argsort(codes, kind="stable")
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(REGIMES)))))
+    return order, [slice(bounds[r], bounds[r + 1]) for r in range(len(REGIMES))]
+
+
+def _log_odds_probability(
+    log_odds: np.ndarray,
+    log_velocity: np.ndarray,
+    log_magnitude: np.ndarray,
+    dtype: type = np.float64,
+) -> np.ndarray:
+    # log_odds: (population, term) of one channel; the denominator is >= 1, so
+    # an overflowing exp only drives the probability to 0
+    denominator = dtype(1)
+    with np.errstate(over="ignore"):
+        for c, cv, cm, cvv, cmm in log_odds.astype(dtype):
+            if c == -np.inf:
+                break
+            denominator = denominator + np.exp(
+                c
+                + log_velocity * (cv + cvv * log_velocity)
+                + log_magnitude * (cm + cmm * log_magnitude)
+            )
+    return 1.0 / denominator
+
+
+def _log_odds_gradient(
+    log_odds: np.ndarray,
+    log_velocity: np.ndarray,
+    log_magnitude: np.ndarray,
+    dtype: type = np.float64,
+) -> np.ndarray:
+    # (p, dp/dlv, dp/dlm) of one channel from the same exp terms: with
+    # w_i = exp(q_i) / (1 + S), dp/dx = -p sum w_i dq_i/dx. The terms are
+    # scaled by exp(-max(0, q_i)) so that none overflows.
+    log_odds = log_odds[np.isfinite(log_odds[:, 0])].astype(dtype)
+    q = [
+        c + log_velocity * (cv + cvv * log_velocity) + log_magnitude * (cm + cmm * log_magnitude)
+        for c, cv, cm, cvv, cmm in log_odds
+    ]
+    scale = np.maximum.reduce([np.zeros_like(q[0]), *q])
+    terms = [np.exp(qi - scale) for qi in q]
+    denominator = np.exp(-scale) + sum(terms)
+    probability = np.exp(-scale) / denominator
+    d_velocity = sum(
+        t * (cv + 2 * cvv * log_velocity) for t, (_, cv, _, cvv, _) in zip(terms, log_odds)
+    )
+    d_magnitude = sum(
+        t * (cm + 2 * cmm * log_magnitude) for t, (_, _, cm, _, cmm) in zip(terms, log_odds)
+    )
+    return np.array([
+        probability,
+        -probability * d_velocity / denominator,
+        -probability * d_magnitude / denominator,
+    ])
+
+
+def _evaluate_regimes(
+    model: CompiledModel,
+    codes: np.ndarray,
+    log_velocity: np.ndarray,
+    log_magnitude: np.ndarray,
+    requested: tuple[bool, ...],
+    dtype: type = np.float64,
+    derivatives: bool = False,
+) -> np.ndarray:
+
+    # (energy, trigger) probabilities, each regime evaluated as one contiguous
+    # block of the regime-sorted features; channels not requested stay NaN.
+    # With derivatives: (p, dp/dlv, dp/dlm) stacked along a first axis.
+    order, blocks = group_by_regime(codes)
+    log_velocity = log_velocity[order]
+    log_magnitude = log_magnitude[order]
+    grouped = np.full((3 if derivatives else 1, len(ENERGIES), len(codes)), np.nan, dtype=dtype)
+
+    for r, block in enumerate(blocks):
+        if block.start == block.stop:
+            continue
+        for e in range(len(ENERGIES)):
+            if not requested[e]:
+                continue
+            if model.populations[r, e] == 0:
+                grouped[0, e, block] = model.constants[r, e]
+                # constant channels don't move, unless they are None
+                grouped[1:, e, block] = 0 * model.constants[r, e]
+            elif derivatives:
+                grouped[:, e, block] = _log_odds_gradient(
+                    model.log_odds[r, e], log_velocity[block], log_magnitude[block], dtype
                 )
-
-                # E>300 MeV
-                # SEP CMEs
-                p_sep_300 = None
-
-                # Advanced Warnign Time (AWT) in minutes for each integral energy for Partial Halo CMEs
-                awt_10 = 63.35  # mean value from statistics
-                awt_30 = 60.58  # dummy
-                awt_60 = 55.23  # dummy
-                awt_100 = 47.36  # dummy
-                awt_300 = 36.25  # dummy
-
-                # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Partial Halo CMEs
-                p_error_10 = (0.027292223, 0.032975703, 0.036645600)
-                p_error_30 = (0.025947781, 0.030993743, 0.034218997)
-                p_error_60 = (0.015225575, 0.018487387, 0.020608458)
-                p_error_100 = (0.011864542, 0.014945230, 0.017056895)
-                p_error_300 = (None, None, None)
             else:
-                # Halo CME
-
-                # E>10 MeV
-                # SEP CMEs
-                mean_log_hs_10 = 3.15780115128
-                sigma_log_hs_10 = 0.17488001287
-                p_halo_sep_10 = 0.38129496
-
-                # Non SEPs CMEs
-                mean_log_hns_10 = 2.91011047363
-                sigma_log_hns_10 = 0.22652350366
-                p_halo_not_sep_10 = 0.61870504
-
-                # Calculation of the PDFs for Halo CMEs | E>10 MeV
-                pdf_halo_sep_10 = (
-                    1.0 / (cme.velocity * sigma_log_hs_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hs_10)
-                            / (sqrt(2) * sigma_log_hs_10)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_10 = (
-                    1.0 / (cme.velocity * sigma_log_hns_10 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hns_10)
-                            / (sqrt(2) * sigma_log_hns_10)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>10 MeV
-                p_sep_10 = (pdf_halo_sep_10 * p_halo_sep_10) / (
-                    (pdf_halo_sep_10 * p_halo_sep_10)
-                    + (pdf_halo_not_sep_10 * p_halo_not_sep_10)
-                )
-
-                # E>30 MeV
-                # SEP CMEs
-                mean_log_hs_30 = 3.18264794350
-                sigma_log_hs_30 = 0.17392908037
-                p_halo_sep_30 = 0.32014388
-                mean_log_hs_10_30 = 3.04670405388
-                sigma_log_hs_10_30 = 0.08136505634
-                p_halo_sep_10_30 = 0.061151079
-
-                # Non SEPs CMEs
-                mean_log_hns_30 = 2.91011047363
-                sigma_log_hns_30 = 0.22652350366
-                p_halo_not_sep_30 = 0.61870504
-
-                # Calculation of the PDFs for Halo CMEs | E>30 MeV
-                pdf_halo_sep_30 = (
-                    1.0 / (cme.velocity * sigma_log_hs_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hs_30)
-                            / (sqrt(2) * sigma_log_hs_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_30 = (
-                    1.0 / (cme.velocity * sigma_log_hns_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hns_30)
-                            / (sqrt(2) * sigma_log_hns_30)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_sep_10_30 = (
-                    1.0
-                    / (cme.velocity * sigma_log_hs_10_30 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hs_10_30)
-                            / (sqrt(2) * sigma_log_hs_10_30)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>30 MeV
-                p_sep_30 = (pdf_halo_sep_30 * p_halo_sep_30) / (
-                    (pdf_halo_sep_30 * p_halo_sep_30)
-                    + (pdf_halo_sep_10_30 * p_halo_sep_10_30)
-                    + (pdf_halo_not_sep_30 * p_halo_not_sep_30)
-                )
-
-                # E>60 MeV
-                # SEP CMEs
-                mean_log_hs_60 = 3.19835877419
-                sigma_log_hs_60 = 0.18075096607
-                p_halo_sep_60 = 0.25179856
-                mean_log_hs_10_60 = 3.08597326279
-                sigma_log_hs_10_60 = 0.13453669846
-                p_halo_sep_10_60 = 0.12949640
-
-                # Non SEPs CMEs
-                mean_log_hns_60 = 2.91011047363
-                sigma_log_hns_60 = 0.22652350366
-                p_halo_not_sep_60 = 0.61870504
-
-                # Calculation of the PDFs for Halo CMEs | E>60 MeV
-                pdf_halo_sep_60 = (
-                    1.0 / (cme.velocity * sigma_log_hs_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hs_60)
-                            / (sqrt(2) * sigma_log_hs_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_60 = (
-                    1.0 / (cme.velocity * sigma_log_hns_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hns_60)
-                            / (sqrt(2) * sigma_log_hns_60)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_sep_10_60 = (
-                    1.0
-                    / (cme.velocity * sigma_log_hs_10_60 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hs_10_60)
-                            / (sqrt(2) * sigma_log_hs_10_60)
-                        )
-                        ** 2
-                    )
-                )
-
-                # Calculation of the Probability for SEP Occurrence | E>60 MeV
-                p_sep_60 = (pdf_halo_sep_60 * p_halo_sep_60) / (
-                    (pdf_halo_sep_60 * p_halo_sep_60)
-                    + (pdf_halo_sep_10_60 * p_halo_sep_10_60)
-                    + (pdf_halo_not_sep_60 * p_halo_not_sep_60)
-                )
-
-                # E>100 MeV
-                # SEP CMEs
-                mean_log_hs_100 = 3.22216272354
-                sigma_log_hs_100 = 0.17536236346
-                p_halo_sep_100 = 0.16906475
-                mean_log_hs_10_100 = 3.10820102692
-                sigma_log_hs_10_100 = 0.14900480211
-                p_halo_sep_10_100 = 0.21223022
-
-                # Non SEPs CMEs
-                mean_log_hns_100 = 2.91011047363
-                sigma_log_hns_100 = 0.22652350366
-                p_halo_not_sep_100 = 0.61870504
-
-                # Calculation of the PDFs for Halo CMEs | E>100 MeV
-                pdf_halo_sep_100 = (
-                    1.0 / (cme.velocity * sigma_log_hs_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hs_100)
-                            / (sqrt(2) * sigma_log_hs_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_100 = (
-                    1.0
-                    / (cme.velocity * sigma_log_hns_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hns_100)
-                            / (sqrt(2) * sigma_log_hns_100)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_sep_10_100 = (
-                    1.0
-                    / (cme.velocity * sigma_log_hs_10_100 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hs_10_100)
-                            / (sqrt(2) * sigma_log_hs_10_100)
-                        )
-                        ** 2
-                    )
-                )
+                grouped[0, e, block] = _log_odds_probability(
+                    model.log_odds[r, e], log_velocity[block], log_magnitude[block], dtype
+                )
+
+    probabilities = np.empty_like(grouped)
+    probabilities[..., order] = grouped
+    return probabilities if derivatives else probabilities[0]
+
+
+@_stage("sepprobs_batch")
+def sepprobs_batch(
+    longitude: np.ndarray,
+    magnitude: np.ndarray,
+    width: np.ndarray,
+    velocity: np.ndarray,
+    has_flare: np.ndarray | None = None,
+    has_cme: np.ndarray | None = None,
+    energies: tuple[int, ...] | list[int] | None = None,
+    dtype: type = np.float64,
+    derivatives: bool = False,
+) -> dict[str, np.ndarray | str]:
+
+    # Columnar counterpart of sepprobs: one array per trigger property, the
+    # flare/CME presence masks default to the non-NaN magnitudes/velocities.
+    # Probabilities that sepprobs reports as None, and channels not in
+    # energies, are NaN here. With dtype=np.float32 the probabilities are
+    # computed and stored in single precision, within
+    # precision_error_bound(np.float32) of the float64 ones.
+    # With derivatives, also the analytic probability_<energy>_dlog_velocity
+    # and probability_<energy>_dlog_magnitude (per dex; dp/dV is
+    # dp/dlog_velocity / (V ln 10)), 0 for inputs a regime doesn't use.
+    # The version of the model is under "model_version".
+    model = MODEL
+    version = model.version
+    probabilities, _ = _evaluate_columns(
+        model, longitude, magnitude, width, velocity, has_flare, has_cme, _energy_mask(energies),
+        dtype, derivatives,
+    )
+    if not derivatives:
+        return {
+            **{f"probability_{energy}": probabilities[e] for e, energy in enumerate(ENERGIES)},
+            "model_version": version,
+        }
 
-                # Calculation of the Probability for SEP Occurrence | E>100 MeV
-                p_sep_100 = (pdf_halo_sep_100 * p_halo_sep_100) / (
-                    (pdf_halo_sep_100 * p_halo_sep_100)
-                    + (pdf_halo_sep_10_100 * p_halo_sep_10_100)
-                    + (pdf_halo_not_sep_100 * p_halo_not_sep_100)
-                )
+    result = {"model_version": version}
+    for e, energy in enumerate(ENERGIES):
+        result[f"probability_{energy}"] = probabilities[0, e]
+        result[f"probability_{energy}_dlog_velocity"] = probabilities[1, e]
+        result[f"probability_{energy}_dlog_magnitude"] = probabilities[2, e]
+    return result
+
+
+def trigger_columns(triggers: list[dict[str, Flare | CME]]) -> tuple[np.ndarray, ...]:
+    # longitude, magnitude, width, velocity, has_flare, has_cme of the triggers
+    flares = [triggerset["flare"] for triggerset in triggers]
+    cmes = [triggerset["cme"] for triggerset in triggers]
+    return (
+        np.array([np.nan if f is None else f.longitude for f in flares], dtype=float),
+        np.array([np.nan if f is None else f.magnitude for f in flares], dtype=float),
+        np.array([np.nan if c is None else c.width for c in cmes], dtype=float),
+        np.array([np.nan if c is None else c.velocity for c in cmes], dtype=float),
+        np.array([f is not None for f in flares], dtype=bool),
+        np.array([c is not None for c in cmes], dtype=bool),
+    )
+
+
+def precision_error_bound(
+    dtype: type = np.float32,
+    velocity: tuple[float, float] = (100.0, 3500.0),
+    magnitude: tuple[float, float] = (1e-7, 1e-3),
+    model: CompiledModel | None = None,
+) -> np.ndarray:
+
+    # (regime, energy) bound of |p_dtype - p_float64| for triggers within the
+    # velocity and magnitude ranges, NaN for channels without a probability,
+    # by model (default: the active one).
+    # With unit roundoff u, every q_i = c + lv (cv + cvv lv) + lm (cm + cmm lm)
+    # is off by at most
+    #   dq_i <= g (|c| + |lv| (|cv| + |cvv| |lv|) + |lm| (|cm| + |cmm| |lm|))
+    #           + (|cv| + 2 |cvv| |lv|) dlv + (|cm| + 2 |cmm| |lm|) dlm + 2 u
+    # with g = 8u / (1 - 8u) for the rounded operations, dlv = 2u |lv| + u
+    # for the rounded input and log10, and 2u for exp. Since |dp/dq_i| sums
+    # to p (1 - p) <= 1/4, and the sum and division round K + 2 more times,
+    #   |dp| <= max_i dq_i / 4 + (K + 2) u
+    u = float(np.finfo(dtype).eps) / 2
+    g = 8 * u / (1 - 8 * u)
+    lv = max(abs(log10(velocity[0])), abs(log10(velocity[1])))
+    lm = max(abs(log10(magnitude[0])), abs(log10(magnitude[1])))
+    input_error = (2 * lv * u + u, 2 * lm * u + u)
+
+    model = MODEL if model is None else model
+    bounds = np.zeros((len(REGIMES), len(ENERGIES)))
+    for r in range(len(REGIMES)):
+        for e in range(len(ENERGIES)):
+            populations = model.populations[r, e]
+            if populations == 0:
+                constant = model.constants[r, e]
+                bounds[r, e] = abs(float(dtype(constant)) - constant)
+                continue
+            dq = max(
+                g * (abs(c) + lv * (abs(cv) + abs(cvv) * lv) + lm * (abs(cm) + abs(cmm) * lm))
+                + (abs(cv) + 2 * abs(cvv) * lv) * input_error[0]
+                + (abs(cm) + 2 * abs(cmm) * lm) * input_error[1]
+                + 2 * u
+                for c, cv, cm, cvv, cmm in model.log_odds[r, e, :populations]
+            )
+            bounds[r, e] = dq / 4 + (populations + 2) * u
+    return bounds
+
+
+def peak_flux_error_bound(
+    dtype: type = np.float32,
+    velocity: tuple[float, float] = (100.0, 3500.0),
+    magnitude: tuple[float, float] = (1e-7, 1e-3),
+    model: CompiledModel | None = None,
+) -> np.ndarray:
+
+    # (energy, level) bound of |pf_dtype - pf_float64| over
+    # SEPCHARS_PROBABILITIES x PEAK_FLUX_LEVELS for triggers within the
+    # velocity and magnitude ranges. The bands are always those of the
+    # float64 probabilities (see _band_probabilities), and within a band
+    #   pf = slope p + floor (1 - p)
+    # is affine in p, so with dp the precision_error_bound of the channel
+    # over all regimes and the rounding of slope, p and the four operations
+    #   |dpf| <= |slope - floor| dp + 6 u (|slope| + |floor|)
+    model = MODEL if model is None else model
+    table = model.peak_flux_table
+    u = float(np.finfo(dtype).eps) / 2
+    bounds = precision_error_bound(dtype, velocity, magnitude, model)
+    result = np.zeros((len(SEPCHARS_PROBABILITIES), len(PEAK_FLUX_LEVELS)))
+    for e, energy in enumerate(SEPCHARS_PROBABILITIES):
+        dp = np.nanmax(bounds[:, ENERGIES.index(energy)])
+        floor = float(table.floors[e])
+        for level in range(len(PEAK_FLUX_LEVELS)):
+            slopes = table.slopes[:, e, level]
+            slopes = slopes[~np.isnan(slopes)]
+            if len(slopes):
+                result[e, level] = np.max(
+                    np.abs(slopes - floor) * dp + 6 * u * (np.abs(slopes) + abs(floor))
+                )
+    return result
+
+
+def sweep(
+    velocity: np.ndarray,
+    magnitude: np.ndarray,
+    longitude: float = 0.0,
+    width: float = 360.0,
+    inputs: str = "flare & cme",
+    energies: tuple[int, ...] | list[int] | None = None,
+) -> dict[str, Any]:
+
+    # Probability surfaces over velocity x magnitude for the regime of a
+    # trigger with the given longitude, width and inputs ("flare & cme",
+    # "flare" or "cme"): (len(velocity), len(magnitude)) arrays per channel,
+    # NaN where sepprobs gives None. Surfaces of "flare" ("cme") triggers are
+    # constant along velocity (magnitude).
+    if inputs not in ("flare & cme", "flare", "cme"):
+        raise ValueError(f"Unknown inputs {inputs!r}.")
+    has_flare = inputs != "cme"
+    has_cme = inputs != "flare"
+    regime = int(classify(
+        np.array([longitude], dtype=float), np.array([width], dtype=float),
+        np.array([has_flare]), np.array([has_cme]),
+    )[0])
+
+    velocity = np.asarray(velocity, dtype=float)
+    magnitude = np.asarray(magnitude, dtype=float)
+    shape = (len(velocity), len(magnitude))
+    log_velocity = np.log10(velocity)[:, None] if has_cme else 0.0
+    log_magnitude = np.log10(magnitude)[None, :] if has_flare else 0.0
+
+    model = MODEL
+    surfaces = {}
+    for e, (energy, requested) in enumerate(zip(ENERGIES, _energy_mask(energies))):
+        if not requested:
+            surface = np.full(shape, np.nan)
+        elif model.populations[regime, e] == 0:
+            surface = np.full(shape, model.constants[regime, e])
+        else:
+            surface = np.broadcast_to(
+                _log_odds_probability(model.log_odds[regime, e], log_velocity, log_magnitude),
+                shape,
+            ).copy()
+        surfaces[f"probability_{energy}"] = surface
+    surfaces["regime"] = regime
+    surfaces["model_version"] = model.version
+    return surfaces
+
+
+@_stage("evaluate")
+def _evaluate_columns(
+    model: CompiledModel,
+    longitude: np.ndarray,
+    magnitude: np.ndarray,
+    width: np.ndarray,
+    velocity: np.ndarray,
+    has_flare: np.ndarray | None,
+    has_cme: np.ndarray | None,
+    requested: tuple[bool, ...],
+    dtype: type = np.float64,
+    derivatives: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+
+    # (energy, trigger) probabilities and the regime codes of the triggers
+    longitude = np.asarray(longitude, dtype=float)
+    magnitude = np.asarray(magnitude, dtype=dtype)
+    width = np.asarray(width, dtype=float)
+    velocity = np.asarray(velocity, dtype=dtype)
+    if has_flare is None:
+        has_flare = ~np.isnan(magnitude)
+    if has_cme is None:
+        has_cme = ~np.isnan(velocity)
+    has_flare = np.asarray(has_flare, dtype=bool)
+    has_cme = np.asarray(has_cme, dtype=bool)
+
+    # Regimes without a flare (CME) have no magnitude (velocity) terms
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_velocity = np.where(has_cme, np.log10(velocity), 0.0)
+        log_magnitude = np.where(has_flare, np.log10(magnitude), 0.0)
+
+    codes = classify(longitude, width, has_flare, has_cme)
+    if _INSTRUMENTATION is not None:
+        _INSTRUMENTATION.regimes += np.bincount(codes, minlength=len(REGIME_CODES))
+    return _evaluate_regimes(
+        model, codes, log_velocity, log_magnitude, requested, dtype, derivatives
+    ), codes
+
+
+def _band_probabilities(
+    model: CompiledModel,
+    longitude: np.ndarray,
+    magnitude: np.ndarray,
+    width: np.ndarray,
+    velocity: np.ndarray,
+    has_flare: np.ndarray,
+    has_cme: np.ndarray,
+    probabilities: np.ndarray,
+) -> np.ndarray:
+
+    # float64 (SEPCHARS_PROBABILITIES, trigger) probabilities to look the
+    # peak flux bands up by. Probabilities of a lower precision can round
+    # across a probability threshold of the peak flux table (a float64 p30 of
+    # 0.1999989 is 0.2000005 in float32), so those within precision_error_bound
+    # of a threshold are evaluated again in float64: the bands are always
+    # those of the float64 evaluation.
+    dtype = probabilities.dtype.type
+    probabilities = probabilities.astype(np.float64)
+    if dtype == np.float64 or probabilities.shape[-1] == 0:
+        return probabilities
+
+    with np.errstate(invalid="ignore"):
+        ranges = [
+            (float(np.min(x[present])), float(np.max(x[present]))) if present.any() else (1.0, 1.0)
+            for x, present in ((velocity, has_cme), (magnitude, has_flare))
+        ]
+    bounds = precision_error_bound(dtype, *ranges, model)
+    codes = classify(longitude, width, has_flare, has_cme)
+    table = model.peak_flux_table
+    near = np.zeros(len(codes), dtype=bool)
+    for e, energy in enumerate(SEPCHARS_PROBABILITIES):
+        variable = f"probability_{energy}"
+        if variable not in table.variables:
+            continue
+        margin = bounds[codes, ENERGIES.index(energy)]
+        for threshold in table.thresholds[table.variables.index(variable)]:
+            near |= np.abs(probabilities[e] - threshold) <= margin
+
+    if near.any():
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_velocity = np.where(has_cme[near], np.log10(velocity[near]), 0.0)
+            log_magnitude = np.where(has_flare[near], np.log10(magnitude[near]), 0.0)
+        exact = _evaluate_regimes(
+            model, codes[near], log_velocity, log_magnitude, (True,) * len(ENERGIES)
+        )
+        probabilities[:, near] = exact[[ENERGIES.index(energy) for energy in SEPCHARS_PROBABILITIES]]
+    return probabilities
+
+
+@_stage("peak_flux")
+def _peak_flux_batch(
+    model: CompiledModel,
+    has_flare: np.ndarray,
+    has_cme: np.ndarray,
+    probabilities: np.ndarray,
+    magnitude: np.ndarray,
+    velocity: np.ndarray,
+    width: np.ndarray,
+    dtype: type = np.float64,
+) -> np.ndarray:
+
+    # (energy, confidence level, trigger) peak fluxes of sepchars, NaN for
+    # None, from the (SEPCHARS_PROBABILITIES, trigger) probabilities, by the
+    # peak flux table of model: the band of every trigger is looked up from
+    # the intervals its values fall in, then its slopes gathered. The bands
+    # are of the probabilities as given, the peak fluxes computed in dtype.
+    table = model.peak_flux_table
+    probabilities = np.where(np.isnan(probabilities), 0.0, probabilities)
+    values = {
+        "magnitude": magnitude,
+        "velocity": velocity,
+        "width": width,
+        **{
+            f"probability_{energy}": probabilities[e]
+            for e, energy in enumerate(SEPCHARS_PROBABILITIES)
+        },
+    }
+
+    # kind of trigger, in _PEAK_FLUX_INPUTS order
+    cell = (~np.asarray(has_flare, dtype=bool)).astype(np.intp) * 2
+    cell += ~np.asarray(has_cme, dtype=bool)
+    interval = np.empty(
+        len(cell), dtype=np.min_scalar_type(max(map(len, table.thresholds), default=0) + 1)
+    )
+    for variable, thresholds, strict in zip(table.variables, table.thresholds, table.strict):
+        x = values[variable]
+        interval[:] = 0
+        for threshold, above in zip(thresholds, strict):
+            interval += x > threshold if above else x >= threshold
+        interval[np.isnan(x)] = len(thresholds) + 1
+        cell *= len(thresholds) + 2
+        cell += interval
+    band = np.take(table.bands.ravel(), cell)
+
+    if _INSTRUMENTATION is not None:
+        for label, count in zip(table.labels, np.bincount(band, minlength=len(table.labels))):
+            _INSTRUMENTATION.count_band(label, int(count))
+
+    slopes = table.slopes.astype(dtype)
+    peak_flux = np.empty(
+        (len(SEPCHARS_PROBABILITIES), len(PEAK_FLUX_LEVELS), len(band)), dtype=dtype
+    )
+    for e in range(len(SEPCHARS_PROBABILITIES)):
+        p = probabilities[e].astype(dtype, copy=False)
+        floor = float(table.floors[e]) * (1 - p)
+        for level in range(len(PEAK_FLUX_LEVELS)):
+            out = peak_flux[e, level]
+            np.multiply(np.take(slopes[:, e, level], band), p, out=out)
+            out += floor
+    return peak_flux
+
+
+@_stage("sepchars")
+def sepchars(triggers: list,
+             sep_probabilities: list,
+             energies: tuple[int, ...] | list[int] | None = None,
+             dtype: type = np.float64) -> dict[str, Any]:
 
-                # E>300 MeV
-                # SEP CMEs
-                mean_log_hs_300 = 3.29878282547
-                sigma_log_hs_300 = 0.11873473972
-                p_halo_sep_300 = 0.053956835
-                mean_log_hs_10_300 = 3.13173818588
-                sigma_log_hs_10_300 = 0.16359749436
-                p_halo_sep_10_300 = 0.32733813
-
-                # Non SEPs CMEs
-                mean_log_hns_300 = 2.91011047363
-                sigma_log_hns_300 = 0.22652350366
-                p_halo_not_sep_300 = 0.61870504
-
-                # Calculation of the PDFs for Halo CMEs | E>300 MeV
-                pdf_halo_sep_300 = (
-                    1.0 / (cme.velocity * sigma_log_hs_300 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hs_300)
-                            / (sqrt(2) * sigma_log_hs_300)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_not_sep_300 = (
-                    1.0
-                    / (cme.velocity * sigma_log_hns_300 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hns_300)
-                            / (sqrt(2) * sigma_log_hns_300)
-                        )
-                        ** 2
-                    )
-                )
-                pdf_halo_sep_10_300 = (
-                    1.0
-                    / (cme.velocity * sigma_log_hs_10_300 * log(10) * sqrt(2 * pi))
-                ) * exp(
-                    -(
-                        (
-                            (log10(cme.velocity) - mean_log_hs_10_300)
-                            / (sqrt(2) * sigma_log_hs_10_300)
-                        )
-                        ** 2
-                    )
-                )
+    if len(triggers) != len(sep_probabilities):
+        raise ValueError("Provided mismatching number of triggers and probabilities.")
 
-                # Calculation of the Probability for SEP Occurrence | E>300 MeV
-                p_sep_300 = (pdf_halo_sep_300 * p_halo_sep_300) / (
-                    (pdf_halo_sep_300 * p_halo_sep_300)
-                    + (pdf_halo_sep_10_300 * p_halo_sep_10_300)
-                    + (pdf_halo_not_sep_300 * p_halo_not_sep_300)
+    # Peak fluxes of channels not in energies are left None. The band of any
+    # channel depends on all SEPCHARS_PROBABILITIES: those that sepprobs was
+    # not asked for (its energies, recorded on the results) are evaluated
+    # here from the triggers. The bands and slopes are the peak_flux_rules
+    # of the active model.
+    # The peak fluxes are computed in dtype (within peak_flux_error_bound(dtype)
+    # of the float64 ones); the bands are always those of float64
+    # probabilities, also for a SepProbabilities table of float32.
+    def complete(mask: tuple[bool, ...] | None) -> bool:
+        return mask is None or all(
+            mask[ENERGIES.index(energy)] for energy in SEPCHARS_PROBABILITIES
+        )
+
+    if isinstance(sep_probabilities, SepProbabilities):
+        probabilities = sep_probabilities.probabilities[
+            [ENERGIES.index(energy) for energy in SEPCHARS_PROBABILITIES]
+        ]
+        incomplete = np.full(len(sep_probabilities), not complete(sep_probabilities.requested))
+    else:
+        incomplete = np.array(
+            [not complete(getattr(sp, "requested", None)) for sp in sep_probabilities], dtype=bool
+        )
+        probabilities = np.array(
+            [
+                [sp[f"probability_{energy}"] for energy in SEPCHARS_PROBABILITIES]
+                for sp in sep_probabilities
+            ],
+            dtype=float,
+        ).reshape(len(sep_probabilities), len(SEPCHARS_PROBABILITIES)).T
+
+    model = MODEL
+    columns = trigger_columns(triggers)
+    longitude, magnitude, width, velocity, has_flare, has_cme = columns
+    if incomplete.any():
+        evaluated, _ = _evaluate_columns(
+            model, *(column[incomplete] for column in columns),
+            tuple(energy in SEPCHARS_PROBABILITIES for energy in ENERGIES),
+            dtype=probabilities.dtype.type,
+        )
+        probabilities[:, incomplete] = evaluated[
+            [ENERGIES.index(energy) for energy in SEPCHARS_PROBABILITIES]
+        ]
+    peak_flux = _peak_flux_batch(
+        model, has_flare, has_cme, _band_probabilities(model, *columns, probabilities),
+        magnitude, velocity, width, dtype,
+    )
+    requested = _energy_mask(energies)
+    for e, energy in enumerate(SEPCHARS_PROBABILITIES):
+        if not requested[ENERGIES.index(energy)]:
+            peak_flux[e] = np.nan
+
+    sep_characteristics = SepCharacteristics(peak_flux, model.version)
+    return {
+        "sep_characteristics": list(sep_characteristics),
+        "model_version": sep_characteristics.version,
+    }
+
+
+@_stage("predict")
+def predict(
+    triggers: list[dict[str, Flare | CME]],
+    energies: tuple[int, ...] | list[int] | None = None,
+    dtype: type = np.float64,
+) -> dict[str, SepProbabilities | SepCharacteristics | str]:
+
+    # sepprobs and sepchars in one pass over the trigger columns: the peak
+    # fluxes are evaluated from the probability arrays and the same presence,
+    # magnitude, velocity and width columns, without per-trigger dicts.
+    # dtype sets the precision of both (see sepprobs_batch and sepchars).
+    model = MODEL
+    version = model.version
+    requested = _energy_mask(energies)
+    probabilities, codes, peak_flux = _predict_columns(
+        model, *trigger_columns(triggers), requested, dtype
+    )
+    return {
+        "sep_probabilities": SepProbabilities(probabilities, codes, version, requested),
+        "sep_characteristics": SepCharacteristics(peak_flux, version),
+        "model_version": version,
+    }
+
+
+def _predict_columns(
+    model: CompiledModel,
+    longitude: np.ndarray,
+    magnitude: np.ndarray,
+    width: np.ndarray,
+    velocity: np.ndarray,
+    has_flare: np.ndarray,
+    has_cme: np.ndarray,
+    requested: tuple[bool, ...],
+    dtype: type = np.float64,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+    # (energy, trigger) probabilities, regime codes and (energy, level,
+    # trigger) peak fluxes of predict, from the trigger columns
+    probabilities, codes = _evaluate_columns(
+        model, longitude, magnitude, width, velocity, has_flare, has_cme,
+        (True,) * len(ENERGIES), dtype=dtype,
+    )
+    peak_flux = _peak_flux_batch(
+        model, has_flare, has_cme,
+        _band_probabilities(
+            model, longitude, magnitude, width, velocity, has_flare, has_cme,
+            probabilities[[ENERGIES.index(energy) for energy in SEPCHARS_PROBABILITIES]],
+        ),
+        magnitude, velocity, width, dtype,
+    )
+
+    # channels not in energies are None, their peak fluxes too
+    probabilities[[e for e, r in enumerate(requested) if not r]] = np.nan
+    for e, energy in enumerate(SEPCHARS_PROBABILITIES):
+        if not requested[ENERGIES.index(energy)]:
+            peak_flux[e] = np.nan
+    return probabilities, codes, peak_flux
+
+
+@_stage("sepprobs_pairings")
+def sepprobs_pairings(
+    groups: list[dict[str, Flare | list[CME] | None]],
+    energies: tuple[int, ...] | list[int] | None = None,
+) -> dict[str, dict[str, np.ndarray] | str]:
+
+    # Every flare/CME pairing of groups {"flare": flare, "cmes": [candidate
+    # CMEs]} evaluated as one batch. Per channel: "matrix" (group, candidate)
+    # probabilities padded with NaN, and the "max" and "argmax" candidate of
+    # each group (NaN and -1 for groups without candidates or probability).
+    model = MODEL
+    version = model.version
+    sizes = np.array([len(group["cmes"]) for group in groups], dtype=int)
+    flares = [group["flare"] for group in groups]
+    cmes = [cme for group in groups for cme in group["cmes"]]
+    owner = np.repeat(np.arange(len(groups)), sizes)
+    position = np.arange(len(cmes)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+
+    flare_longitude = np.array([np.nan if f is None else f.longitude for f in flares], dtype=float)
+    flare_magnitude = np.array([np.nan if f is None else f.magnitude for f in flares], dtype=float)
+    has_flare = np.array([f is not None for f in flares], dtype=bool)
+    probabilities, _ = _evaluate_columns(
+        model,
+        flare_longitude[owner],
+        flare_magnitude[owner],
+        np.array([c.width for c in cmes], dtype=float),
+        np.array([c.velocity for c in cmes], dtype=float),
+        has_flare[owner],
+        np.ones(len(cmes), dtype=bool),
+        _energy_mask(energies),
+    )
+
+    # at least one (all NaN) column, so that argmax is defined
+    matrix = np.full((len(ENERGIES), len(groups), max(sizes, default=0) or 1), np.nan)
+    matrix[:, owner, position] = probabilities
+    ranked = np.where(np.isnan(matrix), -np.inf, matrix)
+    best = ranked.argmax(axis=2)
+    maximum = np.take_along_axis(matrix, best[..., None], axis=2)[..., 0]
+    argmax = np.where(np.isnan(maximum), -1, best)
+    matrix = matrix[..., :max(sizes, default=0)]
+
+    return {
+        **{
+            f"probability_{energy}": {
+                "matrix": matrix[e], "max": maximum[e], "argmax": argmax[e]
+            }
+            for e, energy in enumerate(ENERGIES)
+        },
+        "model_version": version,
+    }
+
+
+def _chunks(iterable: Iterable, chunk_size: int) -> Iterator[list]:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def iter_sepprobs(
+    triggers: Iterable[dict[str, Flare | CME]],
+    chunk_size: int = 1024,
+    store: PredictionStore | None = None,
+    energies: tuple[int, ...] | list[int] | None = None,
+) -> Iterator[Mapping[str, Any]]:
+
+    # Streaming counterpart of sepprobs: triggers are consumed lazily and
+    # evaluated chunk_size at a time, so only one chunk is held in memory.
+    # The results are the dict-like rows of a SepProbabilities table.
+    for chunk in _chunks(triggers, chunk_size):
+        yield from sepprobs(chunk, store, energies, columnar=True)["sep_probabilities"]
+
+
+def iter_sepchars(
+    triggers: Iterable[dict[str, Flare | CME]],
+    sep_probabilities: Iterable[Mapping[str, Any]],
+    chunk_size: int = 1024,
+    energies: tuple[int, ...] | list[int] | None = None,
+) -> Iterator[dict[str, Any]]:
+
+    # Streaming counterpart of sepchars. To chain it lazily after
+    # iter_sepprobs, split a single feed with itertools.tee:
+    #   feed, probability_feed = tee(triggers)
+    #   iter_sepchars(feed, iter_sepprobs(probability_feed))
+    # Feeds of different lengths raise ValueError once the shorter one ends
+    pairs = zip(triggers, sep_probabilities, strict=True)
+    for chunk in _chunks(pairs, chunk_size):
+        chunk_triggers, chunk_probabilities = zip(*chunk)
+        yield from sepchars(chunk_triggers, chunk_probabilities, energies)["sep_characteristics"]
+
+
+def _run_chunk(
+    columns: tuple[np.ndarray, ...],
+    requested: tuple[bool, ...],
+    characteristics: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+
+    # Process pool task: the worker evaluates its module-level MODEL, attached
+    # once to the parent's tables in shared memory, so only the trigger
+    # columns and the result arrays cross the process boundary
+    if characteristics:
+        return _predict_columns(MODEL, *columns, requested)
+    probabilities, codes = _evaluate_columns(MODEL, *columns, requested)
+    return probabilities, codes, None
+
+
+def run_parallel(
+    triggers: Iterable[dict[str, Flare | CME]],
+    workers: int | None = None,
+    chunk_size: int = 10000,
+    energies: tuple[int, ...] | list[int] | None = None,
+    characteristics: bool = True,
+) -> dict[str, Any]:
+
+    # sepprobs (and sepchars) of a large catalog, split into chunks evaluated
+    # over a process pool of workers (default: one per core). The results are
+    # in input order, as the SepProbabilities and SepCharacteristics tables
+    # of predict. Chunks are sent as trigger_columns arrays and come back as
+    # arrays, so no per-trigger objects are pickled either way.
+    from concurrent.futures import ProcessPoolExecutor
+
+    columns = (trigger_columns(chunk) for chunk in _chunks(triggers, chunk_size))
+    model = MODEL
+    requested = _energy_mask(energies)
+    with SharedModel(model) as shared, ProcessPoolExecutor(
+        max_workers=workers, initializer=attach_model, initargs=(shared.handle,)
+    ) as executor:
+        results = list(executor.map(
+            _run_chunk,
+            columns,
+            repeat(requested),
+            repeat(characteristics),
+        ))
+
+    if results:
+        probabilities = np.concatenate([r[0] for r in results], axis=1)
+        regimes = np.concatenate([r[1] for r in results])
+    else:
+        probabilities = np.empty((len(ENERGIES), 0))
+        regimes = np.empty(0, dtype=np.uint8)
+    output = {
+        "sep_probabilities": SepProbabilities(probabilities, regimes, model.version, requested),
+        "model_version": model.version,
+    }
+    if characteristics:
+        peak_flux = (
+            np.concatenate([r[2] for r in results], axis=-1) if results
+            else np.empty((len(SEPCHARS_PROBABILITIES), len(PEAK_FLUX_LEVELS), 0))
+        )
+        output["sep_characteristics"] = SepCharacteristics(peak_flux, model.version)
+    return output
+
+
+def _quantize(value: float, resolution: float) -> float:
+    return round(value / resolution) * resolution if isfinite(value) else value
+
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class TriggerMemo:
+
+    # Bounded LRU memo of sepprobs + sepchars results. Triggers are keyed on
+    # their velocity and magnitude at measurement precision (velocity to the
+    # given resolution, magnitude to magnitude_digits significant digits,
+    # i.e. the GOES class digit), so re-reports that only differ below that
+    # precision share one entry: the result of the first of them, evaluated
+    # exactly. The key also holds the regime and the peak flux intervals of
+    # the exact inputs, so triggers on either side of a regime boundary or a
+    # magnitude, velocity or width edge never share an entry.
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        velocity_resolution: float = 1.0,
+        magnitude_digits: int = 2,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}.")
+        self.maxsize = maxsize
+        self.velocity_resolution = velocity_resolution
+        self.magnitude_digits = magnitude_digits
+        self._entries: OrderedDict[tuple, tuple[SepProbability, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, flare: Flare | None, cme: CME | None, model: CompiledModel | None = None) -> tuple:
+        # Magnitude and velocity at measurement precision, with the regime and
+        # the intervals of the peak flux thresholds of the exact trigger, under
+        # the version of model, by default the active one (a model switch
+        # shares no entries)
+        model = MODEL if model is None else model
+        table = model.peak_flux_table
+        values = {
+            "magnitude": np.nan if flare is None else flare.magnitude,
+            "velocity": np.nan if cme is None else cme.velocity,
+            "width": np.nan if cme is None else cme.width,
+        }
+        intervals = tuple(
+            sum(values[variable] > t if above else values[variable] >= t
+                for t, above in zip(thresholds, strict))
+            for variable, thresholds, strict in zip(table.variables, table.thresholds, table.strict)
+            if variable in values
+        )
+        return (
+            model.version,
+            trigger_code(flare, cme),
+            intervals,
+            None if flare is None else float(f"{flare.magnitude:.{self.magnitude_digits - 1}e}"),
+            None if cme is None else _quantize(cme.velocity, self.velocity_resolution),
+        )
+
+    def lookup(
+        self, flare: Flare | None, cme: CME | None, model: CompiledModel | None = None
+    ) -> tuple[SepProbability, dict[str, Any]]:
+        # Prediction and characteristics of all channels; the characteristics
+        # dict is shared with the memo and must not be modified
+        model = MODEL if model is None else model
+        key = self.key(flare, cme, model)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        p = sepprob(flare, cme, model=model)
+        _, magnitude, width, velocity, has_flare, has_cme = trigger_columns(
+            [{"flare": flare, "cme": cme}]
+        )
+        probabilities = np.array(
+            [[p[ENERGIES.index(energy)]] for energy in SEPCHARS_PROBABILITIES], dtype=float
+        )
+        sc = SepCharacteristics(
+            _peak_flux_batch(model, has_flare, has_cme, probabilities, magnitude, velocity, width),
+            model.version,
+        )[0]
+        entry = self._entries[key] = (p, sc)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def evaluate(
+        self,
+        triggers: list[dict[str, Flare | CME]],
+        energies: tuple[int, ...] | list[int] | None = None,
+    ) -> dict[str, list[dict[str, Any]] | str]:
+
+        # sepprobs and sepchars of the triggers, in the format of their results
+        model = MODEL
+        version = model.version
+        requested = _energy_mask(energies)
+        bands = [str(energy) for energy, r in zip(ENERGIES, requested) if r]
+        sep_probabilities = []
+        sep_characteristics = []
+        for triggerset in triggers:
+            p, sc = self.lookup(triggerset["flare"], triggerset["cme"], model)
+            if energies is not None:
+                p = SepProbability(
+                    *(value if r else None for value, r in zip(p, requested)),
+                    p.regime, p.version,
                 )
-
-                # Advanced Warnign Time (AWT) in minutes for each integral energy for Halo CMEs
-                awt_10 = 139.49  # mean value based oin statistics
-                awt_30 = 115.32  # dummy
-                awt_60 = 100.58  # dummy
-                awt_100 = 90.25  # dummy
-                awt_300 = 70.32  # dummy
-
-                # Errors (1 sigma), (2 sigma), (3 sigma) for each energy for Halo CMEs
-                p_error_10 = (0.026346158, 0.028627921, 0.030565187)
-                p_error_30 = (0.0016775079, 0.0030731815, 0.0043822598)
-                p_error_60 = (0.0075471041, 0.011301916, 0.014358412)
-                p_error_100 = (0.016388003, 0.021868145, 0.025966066)
-                p_error_300 = (0.016903247, 0.017832285, 0.018523705)
-
             sep_probabilities.append(
-                {
-                    "probability_10": p_sep_10,
-                    "probability_30": p_sep_30,
-                    "probability_60": p_sep_60,
-                    "probability_100": p_sep_100,
-                    "probability_300": p_sep_300,
-                    "awt_10": awt_10,
-                    "awt_30": awt_30,
-                    "awt_60": awt_60,
-                    "awt_100": awt_100,
-                    "awt_300": awt_300,
-                    "p_error_10": p_error_10,
-                    "p_error_30": p_error_30,
-                    "p_error_60": p_error_60,
-                    "p_error_100": p_error_100,
-                    "p_error_300": p_error_300,
-                }
+                _sep_probability_dict(p, None if all(requested) else requested)
             )
-        else:
-            sep_probabilities.append({
-                "probability_10": None,
-                "probability_30": None,
-                "probability_100": None,
-                "probability_300": None
+            sep_characteristics.append({
+                "peak_flux": {
+                    energy: dict(band) if energy in bands else {"50cl": None, "90cl": None}
+                    for energy, band in sc["peak_flux"].items()
+                }
             })
-
-    return {"sep_probabilities": sep_probabilities}
-
-
-def sepchars(triggers: list,
-             sep_probabilities: list) -> dict[str, Any]:
-    
-    if len(triggers) != len(sep_probabilities):
-        raise ValueError("Provided mismatching number of triggers and probabilities.")
-    
-    sep_probabilities = [
-        {
-            str(e): sp[f"probability_{e}"]
-            for e in [10, 30, 100, 300]
+        return {
+            "sep_probabilities": sep_probabilities,
+            "sep_characteristics": sep_characteristics,
+            "model_version": version,
         }
-        for sp in sep_probabilities
-    ]
 
-    sep_characteristics = []
-    
-    for triggerset, probability in zip(triggers, sep_probabilities):
-        sc = {
-            "peak_flux": {
-                "10": {
-                    "50cl": None,
-                    "90cl": None
-                },
-                "30": {
-                    "50cl": None,
-                    "90cl": None
-                },
-                "100": {
-                    "50cl": None,
-                    "90cl": None
-                },
-                "300": {
-                    "50cl": None,
-                    "90cl": None
-                }
+    def info(self) -> MemoInfo:
+        return MemoInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+@dataclass(frozen=True)
+class SharedModelHandle:
+    # Picklable reference to the tables of a SharedModel: the shared memory
+    # block, the (owner, field, shape, dtype, offset) of every array in it,
+    # and the other (small) fields, which are copied. The owners are the
+    # model and its peak flux table.
+    name: str
+    arrays: tuple[tuple[str, str, tuple[int, ...], str, int], ...]
+    model: dict[str, Any]
+    peak_flux_table: dict[str, Any]
+
+
+def _array_fields(instance: Any) -> Iterator[tuple[str, np.ndarray]]:
+    # (field, array) of the array fields
+    for field in fields(instance):
+        value = getattr(instance, field.name)
+        if isinstance(value, np.ndarray):
+            yield field.name, value
+
+
+class SharedModel:
+
+    # A compiled model published once into a multiprocessing.shared_memory
+    # block. Workers given the handle attach to the tables with attach_model,
+    # without copies. The block lives until close (or the end of a with
+    # block), which the publisher must call once the workers are done.
+    def __init__(self, model: CompiledModel | None = None) -> None:
+        from multiprocessing.shared_memory import SharedMemory
+
+        model = MODEL if model is None else model
+        owners = {"model": model, "peak_flux_table": model.peak_flux_table}
+
+        layout = []
+        arrays = []
+        size = 0
+        for owner, instance in owners.items():
+            for field, array in _array_fields(instance):
+                # cache line aligned
+                size += -size % 64
+                layout.append((owner, field, array.shape, array.dtype.str, size))
+                arrays.append(array)
+                size += array.nbytes
+        self.memory = SharedMemory(create=True, size=max(size, 1))
+        for (_, _, shape, dtype, offset), array in zip(layout, arrays):
+            np.ndarray(shape, dtype, buffer=self.memory.buf, offset=offset)[...] = array
+
+        # the peak flux table is rebuilt from its own fields by attach_model
+        shared = {(owner, field) for owner, field, *_ in layout} | {("model", "peak_flux_table")}
+        copied = {
+            owner: {
+                field.name: getattr(instance, field.name)
+                for field in fields(instance)
+                if (owner, field.name) not in shared
             }
+            for owner, instance in owners.items()
         }
+        self.handle = SharedModelHandle(
+            self.memory.name, tuple(layout), copied["model"], copied["peak_flux_table"]
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self.memory.size
+
+    def close(self) -> None:
+        # Unlink the block; workers already attached keep their mapping
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self) -> "SharedModel":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# Shared memory blocks attached in this process, kept open for as long as the
+# models viewing them may be used
+_ATTACHED: dict[str, Any] = {}
+
+
+def attach_model(handle: SharedModelHandle) -> CompiledModel:
+
+    # Register the model of a SharedModel handle, with read-only views of the
+    # shared tables, and make it the active model. Can be a process pool
+    # initializer.
+    # Before Python 3.13 the resource tracker of the attaching process unlinks
+    # the block when that process ends, so attach from processes started by
+    # the publisher (such as pool workers, which share its tracker).
+    from multiprocessing.shared_memory import SharedMemory
+
+    memory = _ATTACHED.get(handle.name)
+    if memory is None:
+        try:
+            memory = SharedMemory(handle.name, track=False)
+        except TypeError:
+            memory = SharedMemory(handle.name)
+        _ATTACHED[handle.name] = memory
+
+    values = {
+        "model": dict(handle.model),
+        "peak_flux_table": dict(handle.peak_flux_table),
+    }
+    for owner, field, shape, dtype, offset in handle.arrays:
+        array = np.ndarray(shape, dtype, buffer=memory.buf, offset=offset)
+        array.flags.writeable = False
+        values[owner][field] = array
+
+    model = CompiledModel(
+        **values["model"], peak_flux_table=PeakFluxTable(**values["peak_flux_table"])
+    )
+    _MODELS[model.name] = _COMPILED[model.version] = model
+    use_model(model.name)
+    return model
+
+
+def _nan_percentiles(values: np.ndarray, percentiles: tuple[float, ...]) -> np.ndarray:
+    # (row, percentile) linearly interpolated percentiles of the non-NaN
+    # values of every row, NaN for rows without any
+    ordered = np.sort(values, axis=1)
+    count = (~np.isnan(values)).sum(axis=1)
+    position = np.outer(np.maximum(count - 1, 0), np.asarray(percentiles) / 100)
+    low = np.floor(position).astype(int)
+    high = np.minimum(low + 1, np.maximum(count - 1, 0)[:, None])
+    fraction = position - low
+    rows = np.arange(len(values))[:, None]
+    result = ordered[rows, low] * (1 - fraction) + ordered[rows, high] * fraction
+    result[count == 0] = np.nan
+    return result
 
-        flare = triggerset["flare"]
-        cme = triggerset["cme"]
-
-        if flare is None and cme is None:
-            sep_characteristics.append(sc)
-            continue
 
-        peak_flux_10_50cl = None
-        peak_flux_10_90cl = None
-        peak_flux_30_50cl = None
-        peak_flux_30_90cl = None
-        peak_flux_60_50cl = None
-        peak_flux_60_90cl = None
-        peak_flux_100_50cl = None
-        peak_flux_100_90cl = None
-        peak_flux_300_50cl = None
-        peak_flux_300_90cl = None
-        probability["10"] = 0 if probability["10"] is None else probability["10"]
-        probability["30"] = 0 if probability["30"] is None else probability["30"]
-        probability["100"] = 0 if probability["100"] is None else probability["100"]
-        probability["300"] = 0 if probability["300"] is None else probability["300"]
-
-
-        if flare is not None and cme is not None:
-            if flare.magnitude < 0.000001:
-                # all none
-                # TODO: consider deleting this statement if no bugs arise
-                pass
-            elif probability["10"] >= 0.26 and \
-                probability["30"] < 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12 and \
-                flare.magnitude >= 0.000001 and \
-                flare.magnitude < 3e-5:
-
-                if cme.velocity >= 0 and cme.velocity < 1250:
-                    peak_flux_10_50cl = 9.52842 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 44.7101 * probability["10"] + 0.23 * (1 - probability["10"])
-                elif cme.velocity >= 1250:
-                    peak_flux_10_50cl = 29.2921 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 766.743 * probability["10"] + 0.23 * (1 - probability["10"])
-
-            elif probability["10"] >= 0.26 and \
-                probability["30"] < 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12 and \
-                flare.magnitude >= 3e-5 and \
-                flare.magnitude < 0.0001:
-
-                if cme.velocity >= 0 and cme.velocity < 1400:
-                    peak_flux_10_50cl = 8.89949 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 78.5001 * probability["10"] + 0.23 * (1 - probability["10"])
-                elif cme.velocity >= 1400:
-                    peak_flux_10_50cl = 94.5556 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 5591.01 * probability["10"] + 0.23 * (1 - probability["10"])
-
-            elif probability["10"] >= 0.26 and \
-                probability["30"] < 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12 and \
-                flare.magnitude >= 0.0001:
-
-                if cme.velocity >= 0 and cme.velocity < 1650:
-                    peak_flux_10_50cl = 62.1402 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 588.377 * probability["10"] + 0.23 * (1 - probability["10"])
-                elif cme.velocity >= 1650:
-                    peak_flux_10_50cl = 620.803 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 13597.8 * probability["10"] + 0.23 * (1 - probability["10"])
-
-            elif probability["30"] >= 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12 and \
-                flare.magnitude >= 0.000001 and \
-                flare.magnitude < 3e-5:
-
-                if cme.velocity >= 0 and cme.velocity < 1250:
-                    peak_flux_10_50cl = 20.6514 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 62.9657 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 13.5934 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 15.9081 * probability["30"] + 0.122 * (1 - probability["30"])
-                elif cme.velocity >= 1250:
-                    peak_flux_10_50cl = 48.4039 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 1006.11 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 3.56488 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 43.5621 * probability["30"] + 0.122 * (1 - probability["30"])
-
-            elif probability["30"] >= 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12 and \
-                flare.magnitude >= 3e-5 and \
-                flare.magnitude < 0.0001:
-
-                if cme.velocity >= 0 and cme.velocity < 1350:
-                    peak_flux_10_50cl = 11.7702 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 116.760 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 9.06236 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 16.5954 * probability["30"] + 0.122 * (1 - probability["30"])
-                elif cme.velocity >= 1350:
-                    peak_flux_10_50cl = 115.621 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 6054.29 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 8.74686 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 591.231 * probability["30"] + 0.122 * (1 - probability["30"])
-
-            elif probability["30"] >= 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12 and \
-                flare.magnitude >= 0.0001:
-
-                if cme.velocity >= 0 and cme.velocity < 1650:
-                    peak_flux_10_50cl = 67.8335 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 555.601 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 7.14560 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 132.028 * probability["30"] + 0.122 * (1 - probability["30"])
-                elif cme.velocity >= 1650:
-                    peak_flux_10_50cl = 620.803 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 13597.8 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 80.8776 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 2123.37 * probability["30"] + 0.122 * (1 - probability["30"])
-
-            elif probability["100"] >= 0.15 and \
-                probability["300"] < 0.12 and \
-                flare.magnitude >= 0.000001 and \
-                flare.magnitude < 6e-5:
-
-                if cme.velocity >= 0 and cme.velocity < 1350:
-                    peak_flux_30_50cl = 6.53660 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 18.1080 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 0.584017 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 1.37347 * probability["100"] + 0.05 * (1 - probability["100"])
-                elif cme.velocity >= 1350:
-                    peak_flux_10_50cl = 166.610 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 6752.46 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 30.7113 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 459.814 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 1.65698 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 8.76971 * probability["100"] + 0.05 * (1 - probability["100"])
-
-            elif probability["100"] >= 0.15 and \
-                probability["300"] < 0.12 and \
-                flare.magnitude >= 6e-5 and \
-                flare.magnitude < 0.0003:
-
-                if cme.velocity >= 0 and cme.velocity < 1350:
-                    peak_flux_10_50cl = 34.5999 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 401.767 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 9.03943 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 72.6586 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 0.979442 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 3.70818 * probability["100"] + 0.05 * (1 - probability["100"])
-                elif cme.velocity >= 1350:
-                    peak_flux_10_50cl = 645.922 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 13132.7 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 66.3046 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 2244.59 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 1.65698 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 8.76971 * probability["100"] + 0.05 * (1 - probability["100"])
-
-            elif probability["100"] >= 0.15 and \
-                probability["300"] < 0.12 and \
-                flare.magnitude >= 0.0003:
-
-                if cme.velocity >= 0 and cme.velocity < 1600:
-                    pass
-                elif cme.velocity >= 1600:
-                    peak_flux_10_50cl = 1562.33 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 17428.9 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 363.673 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 2638.26 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 14.2809 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 263.053 * probability["100"] + 0.05 * (1 - probability["100"])
-
-            elif probability["300"] >= 0.12:
-                if flare.magnitude >= 0.000001 and \
-                    flare.magnitude < 0.0003:
-
-                    peak_flux_10_50cl = 539.706 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 12038.4 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 140.577 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 2471.69 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 9.77284 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 94.1660 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_300_50cl = 1.33046 * probability["300"] + 0.02 * (1 - probability["300"])
-                    peak_flux_300_90cl = 7.09169 * probability["300"] + 0.02 * (1 - probability["300"])
-
-                if flare.magnitude >=  0.0003:
-
-                    peak_flux_10_50cl = 1575.84 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 21655.1 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 422.419 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 3288.15 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 35.9343 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 229.113 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_300_50cl = 4.67401 * probability["300"] + 0.02 * (1 - probability["300"])
-                    peak_flux_300_90cl = 58.7679 * probability["300"] + 0.02 * (1 - probability["300"])
-
-            sc["peak_flux"] = {
-                    "10": {
-                        "50cl": peak_flux_10_50cl,
-                        "90cl": peak_flux_10_90cl
-                    },
-                    "30": {
-                        "50cl": peak_flux_30_50cl,
-                        "90cl": peak_flux_30_90cl
-                    },
-                    "100": {
-                        "50cl": peak_flux_100_50cl,
-                        "90cl": peak_flux_100_90cl
-                    },
-                    "300": {
-                        "50cl": peak_flux_300_50cl,
-                        "90cl": peak_flux_300_90cl
-                    }
-                }
-        elif flare is not None:
-            if flare.magnitude < 0.000001:
-                pass
-            elif probability["10"] >= 0.26 and \
-                probability["30"] < 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12:
-
-                if flare.magnitude >= 0.000001 and flare.magnitude < 3e-5:
-                    peak_flux_10_50cl = 8.99763 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 136.348 * probability["10"] + 0.23 * (1 - probability["10"])
-                elif flare.magnitude >= 3e-5 and flare.magnitude < 0.0001:
-                    peak_flux_10_50cl = 16.7516 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 793.274 * probability["10"] + 0.23 * (1 - probability["10"])
-                elif flare.magnitude >= 0.0001:
-                    peak_flux_10_50cl = 97.8199 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 6640.01 * probability["10"] + 0.23 * (1 - probability["10"])
-
-            elif probability["30"] >= 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12:
-
-                if flare.magnitude >= 0.000001 and flare.magnitude < 3e-5:
-                    peak_flux_10_50cl = 21.0038 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 308.828 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 2.79427 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 21.5382 * probability["30"] + 0.122 * (1 - probability["30"])
-                elif flare.magnitude >= 3e-5 and flare.magnitude < 0.0001:
-                    peak_flux_10_50cl = 32.7346 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 1773.08 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 3.43276 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 69.9711 * probability["30"] + 0.122 * (1 - probability["30"])
-                elif flare.magnitude >= 0.0001:
-                    peak_flux_10_50cl = 148.260 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 7469.22 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 18.4128 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 1088.35 * probability["30"] + 0.122 * (1 - probability["30"])
-
-            elif probability["100"] >= 0.15 and \
-                probability["300"] < 0.12:
-
-                if flare.magnitude >= 0.000001 and flare.magnitude < 6e-5:
-                    peak_flux_10_50cl = 33.7337 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 942.493 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 5.00712 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 252.977 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 0.842783 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 3.63988 * probability["100"] + 0.05 * (1 - probability["100"])
-                elif flare.magnitude >= 6e-5 and flare.magnitude < 0.0003:
-                    peak_flux_10_50cl = 131.691 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 5706.75 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 18.4679 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 733.797 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 1.22056 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 20.8781 * probability["100"] + 0.05 * (1 - probability["100"])
-                elif flare.magnitude >= 0.0003:
-                    peak_flux_10_50cl = 607.181 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 15477.5 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 128.30 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 2348.82 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 11.0429 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 172.332 * probability["100"] + 0.05 * (1 - probability["100"])
-
-            elif probability["300"] >= 0.12:
-
-                if flare.magnitude >= 0.000001 and flare.magnitude < 0.0003:
-                    peak_flux_10_50cl = 539.706 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 12038.4 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 140.577 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 2471.69 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 9.77284 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 94.1660 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_300_50cl = 1.33046 * probability["300"] + 0.02 * (1 - probability["300"])
-                    peak_flux_300_90cl = 7.09169 * probability["300"] + 0.02 * (1 - probability["300"])
-                elif flare.magnitude >= 0.0003:
-                    peak_flux_10_50cl = 1575.84 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 21655.1 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 422.419 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 3288.15 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_100_50cl = 35.9343 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_100_90cl = 229.113 * probability["100"] + 0.05 * (1 - probability["100"])
-                    peak_flux_300_50cl = 4.67401 * probability["300"] + 0.02 * (1 - probability["300"])
-                    peak_flux_300_90cl = 58.7679 * probability["300"] + 0.02 * (1 - probability["300"])
-
-            sc["peak_flux"] = {
-                    "10": {
-                        "50cl": peak_flux_10_50cl,
-                        "90cl": peak_flux_10_90cl
-                    },
-                    "30": {
-                        "50cl": peak_flux_30_50cl,
-                        "90cl": peak_flux_30_90cl
-                    },
-                    "100": {
-                        "50cl": peak_flux_100_50cl,
-                        "90cl": peak_flux_100_90cl
-                    },
-                    "300": {
-                        "50cl": peak_flux_300_50cl,
-                        "90cl": peak_flux_300_90cl
-                    }
+@dataclass
+class Uncertainty:
+    # 1 sigma measurement errors of a trigger: longitude and width in deg,
+    # velocity in km/s, magnitude in dex (log10 W/m^2)
+    longitude: float = 0.0
+    magnitude: float = 0.0
+    width: float = 0.0
+    velocity: float = 0.0
+
+
+@_stage("monte_carlo")
+def monte_carlo(
+    triggers: list[dict[str, Flare | CME]],
+    uncertainties: Uncertainty | list[Uncertainty],
+    samples: int = 10000,
+    percentiles: tuple[float, ...] = (5.0, 50.0, 95.0),
+    seed: int | None = None,
+    energies: tuple[int, ...] | list[int] | None = None,
+    chunk_samples: int = 1_000_000,
+    dtype: type = np.float64,
+) -> dict[str, Any]:
+
+    # Propagate normally distributed measurement errors (one Uncertainty for
+    # all triggers, or one per trigger) through sepprobs and sepchars, with
+    # samples draws per trigger evaluated chunk_samples at a time. Draws are
+    # kept physical: velocity at least 1 km/s, width within [0, 360) deg for
+    # CMEs that are not halo. A halo CME (width of 360 deg or more) is an
+    # observed class rather than a measured width, so its draws stay halo,
+    # and no draw of another CME becomes one.
+    # Returns the (trigger, percentile) arrays of every probability and peak
+    # flux; percentiles of a peak flux are over the draws that have one (NaN
+    # if none has), and the fraction of such draws is in peak_flux_defined.
+    # dtype sets the precision the draws are evaluated in (see sepprobs_batch
+    # and sepchars).
+    if isinstance(uncertainties, Uncertainty):
+        uncertainties = [uncertainties] * len(triggers)
+    if len(uncertainties) != len(triggers):
+        raise ValueError("Provided mismatching number of triggers and uncertainties.")
+
+    model = MODEL
+    version = model.version
+    rng = np.random.default_rng(seed)
+    requested = _energy_mask(energies)
+    longitude, magnitude, width, velocity, has_flare, has_cme = trigger_columns(triggers)
+    errors = {
+        name: np.array([getattr(u, name) for u in uncertainties], dtype=float)
+        for name in ("longitude", "magnitude", "width", "velocity")
+    }
+
+    probability_percentiles = np.full((len(ENERGIES), len(triggers), len(percentiles)), np.nan)
+    peak_flux_percentiles = np.full(
+        (len(SEPCHARS_PROBABILITIES), len(PEAK_FLUX_LEVELS), len(triggers), len(percentiles)),
+        np.nan,
+    )
+    peak_flux_defined = np.zeros((len(SEPCHARS_PROBABILITIES), len(PEAK_FLUX_LEVELS), len(triggers)))
+    chunk = max(1, chunk_samples // samples)
+    for start in range(0, len(triggers), chunk):
+        rows = slice(start, start + chunk)
+        shape = (len(longitude[rows]), samples)
+
+        def draw(values: np.ndarray, name: str) -> np.ndarray:
+            return (values[rows, None] + errors[name][rows, None] * rng.standard_normal(shape)).ravel()
+
+        sample_longitude = draw(longitude, "longitude")
+        with np.errstate(divide="ignore"):
+            sample_magnitude = 10 ** draw(np.log10(magnitude), "magnitude")
+        sample_width = np.where(
+            np.repeat(width[rows] >= 360, samples),
+            np.repeat(width[rows], samples),
+            np.clip(draw(width, "width"), 0.0, np.nextafter(360.0, 0.0)),
+        )
+        sample_velocity = np.maximum(draw(velocity, "velocity"), 1.0)
+        sample_flare = np.repeat(has_flare[rows], samples)
+        sample_cme = np.repeat(has_cme[rows], samples)
+
+        probabilities, _ = _evaluate_columns(
+            model, sample_longitude, sample_magnitude, sample_width, sample_velocity,
+            sample_flare, sample_cme, (True,) * len(ENERGIES), dtype=dtype,
+        )
+        peak_flux = _peak_flux_batch(
+            model, sample_flare, sample_cme,
+            _band_probabilities(
+                model, sample_longitude, sample_magnitude, sample_width, sample_velocity,
+                sample_flare, sample_cme,
+                probabilities[[ENERGIES.index(energy) for energy in SEPCHARS_PROBABILITIES]],
+            ),
+            sample_magnitude, sample_velocity, sample_width, dtype,
+        ).reshape(len(SEPCHARS_PROBABILITIES), len(PEAK_FLUX_LEVELS), *shape)
+        probabilities = probabilities.reshape(len(ENERGIES), *shape)
+
+        for e in range(len(ENERGIES)):
+            if requested[e]:
+                probability_percentiles[e, rows] = _nan_percentiles(probabilities[e], percentiles)
+        peak_flux_defined[:, :, rows] = (~np.isnan(peak_flux)).mean(axis=-1)
+        for e, energy in enumerate(SEPCHARS_PROBABILITIES):
+            if requested[ENERGIES.index(energy)]:
+                for level in range(len(PEAK_FLUX_LEVELS)):
+                    peak_flux_percentiles[e, level, rows] = _nan_percentiles(
+                        peak_flux[e, level], percentiles
+                    )
+
+    return {
+        "percentiles": tuple(percentiles),
+        "sep_probabilities": {
+            f"probability_{energy}": probability_percentiles[e]
+            for e, energy in enumerate(ENERGIES)
+        },
+        "sep_characteristics": {
+            "peak_flux": {
+                str(energy): {
+                    level: peak_flux_percentiles[e, k] for k, level in enumerate(PEAK_FLUX_LEVELS)
                 }
-        elif cme is not None:
-            if probability["10"] >= 0.26 and \
-                probability["30"] < 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12:
-
-                if cme.width == 360 and cme.velocity < 1250:
-                    peak_flux_10_50cl = 12.6647 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 65.6945 * probability["10"] + 0.23 * (1 - probability["10"])
-                elif cme.width == 360 and cme.velocity >= 1250:
-                    peak_flux_10_50cl = 84.9488 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 5527.92 * probability["10"] + 0.23 * (1 - probability["10"])
-                elif cme.width < 360 and cme.velocity < 1250:
-                    peak_flux_10_50cl = 8.69473 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 118.212 * probability["10"] + 0.23 * (1 - probability["10"])
-                elif cme.width < 360 and cme.velocity >= 1250:
-                    peak_flux_10_50cl = 21.3844 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 1154.19 * probability["10"] + 0.23 * (1 - probability["10"])
-
-            elif probability["30"] >= 0.20 and \
-                probability["100"] < 0.15 and \
-                probability["300"] < 0.12:
-
-                if cme.width == 360 and cme.velocity < 1000:
-                    peak_flux_10_50cl = 17.4308 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 1208.46 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 2.09444 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 9.91747 * probability["30"] + 0.122 * (1 - probability["30"])
-                if cme.width == 360 and cme.velocity >= 1000:
-                    peak_flux_10_50cl = 26.5127 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 856.442 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 4.8067 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 417.420 * probability["30"] + 0.122 * (1 - probability["30"])
-                if cme.width < 360 and cme.velocity < 1000:
-                    peak_flux_10_50cl = 22.1198 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 4570.61 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 2.77579 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 26.555 * probability["30"] + 0.122 * (1 - probability["30"])
-                if cme.width < 360 and cme.velocity >= 1000:
-                    peak_flux_10_50cl = 26.5127 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_10_90cl = 856.442 * probability["10"] + 0.23 * (1 - probability["10"])
-                    peak_flux_30_50cl = 4.8067 * probability["30"] + 0.122 * (1 - probability["30"])
-                    peak_flux_30_90cl = 417.420 * probability["30"] + 0.122 * (1 - probability["30"])
-
-            elif probability["100"] >= 0.15 and \
-                probability["300"] < 0.12:
-
-                peak_flux_10_50cl = 13.5745 * probability["10"] + 0.23 * (1 - probability["10"])
-                peak_flux_10_90cl = 879.658 * probability["10"] + 0.23 * (1 - probability["10"])
-                peak_flux_30_50cl = 4.85624 * probability["30"] + 0.122 * (1 - probability["30"])
-                peak_flux_30_90cl = 190.566 * probability["30"] + 0.122 * (1 - probability["30"])
-                peak_flux_100_50cl = 1.44041 * probability["100"] + 0.05 * (1 - probability["100"])
-                peak_flux_100_90cl = 44.8417 * probability["100"] + 0.05 * (1 - probability["100"])
-
-            elif probability["300"] >= 0.12:
-
-                peak_flux_10_50cl = 8.7584 * probability["10"] + 0.23 * (1 - probability["10"])
-                peak_flux_10_90cl = 159.326 * probability["10"] + 0.23 * (1 - probability["10"])
-                peak_flux_30_50cl = 5.816 * probability["30"] + 0.122 * (1 - probability["30"])
-                peak_flux_30_90cl = 200.824 * probability["30"] + 0.122 * (1 - probability["30"])
-                peak_flux_100_50cl = 2.574 * probability["100"] + 0.05 * (1 - probability["100"])
-                peak_flux_100_90cl = 127.048 * probability["100"] + 0.05 * (1 - probability["100"])
-                peak_flux_300_50cl = 3.06019 * probability["300"] + 0.02 * (1 - probability["300"])
-                peak_flux_300_90cl = 34.3502 * probability["300"] + 0.02 * (1 - probability["300"])
-
-            sc["peak_flux"] = {
-                    "10": {
-                        "50cl": peak_flux_10_50cl,
-                        "90cl": peak_flux_10_90cl
-                    },
-                    "30": {
-                        "50cl": peak_flux_30_50cl,
-                        "90cl": peak_flux_30_90cl
-                    },
-                    "100": {
-                        "50cl": peak_flux_100_50cl,
-                        "90cl": peak_flux_100_90cl
-                    },
-                    "300": {
-                        "50cl": peak_flux_300_50cl,
-                        "90cl": peak_flux_300_90cl
-                    }
+                for e, energy in enumerate(SEPCHARS_PROBABILITIES)
+            },
+            "peak_flux_defined": {
+                str(energy): {
+                    level: peak_flux_defined[e, k] for k, level in enumerate(PEAK_FLUX_LEVELS)
                 }
-
-        sep_characteristics.append(sc)
-
-    return {"sep_characteristics": sep_characteristics}
-
+                for e, energy in enumerate(SEPCHARS_PROBABILITIES)
+            },
+        },
+        "model_version": version,
+    }
+
+
+def trigger_time(triggerset: dict[str, Flare | CME]) -> datetime:
+    # Onset of a trigger: the earlier start of its flare and CME
+    return min(
+        event.start for event in (triggerset["flare"], triggerset["cme"]) if event is not None
+    )
+
+
+class RiskWindow:
+
+    # Probability of at least one SEP event per channel from all triggers in
+    # a trailing time window, 1 - prod(1 - p_i) over independent triggers.
+    # The window keeps sum(log(1 - p_i)) and the number of triggers with
+    # p_i = 1 per channel, so a trigger entering or leaving is O(log n) (a
+    # heap on trigger time, which also takes triggers out of order).
+    def __init__(
+        self,
+        window: timedelta = timedelta(hours=24),
+        energies: tuple[int, ...] | list[int] | None = None,
+    ) -> None:
+        self.window = window
+        self.requested = _energy_mask(energies)
+        self.now: datetime | None = None
+        self._heap: list[tuple[datetime, int, tuple[float, ...]]] = []
+        self._sequence = 0
+        self._log_survival = [0.0] * len(ENERGIES)
+        self._certain = [0] * len(ENERGIES)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _update(self, probabilities: tuple[float, ...], sign: int) -> None:
+        for e, p in enumerate(probabilities):
+            if p >= 1:
+                self._certain[e] += sign
+            elif p > 0:
+                self._log_survival[e] += sign * log1p(-p)
+
+    def add(
+        self,
+        triggerset: dict[str, Flare | CME],
+        probability: SepProbability | None = None,
+    ) -> None:
+        # probability defaults to sepprob of the trigger; None channels count
+        # as no risk
+        if probability is None:
+            probability = sepprob(triggerset["flare"], triggerset["cme"])
+        probabilities = tuple(0.0 if p is None else p for p in probability[:len(ENERGIES)])
+        time = trigger_time(triggerset)
+        heapq.heappush(self._heap, (time, self._sequence, probabilities))
+        self._sequence += 1
+        self._update(probabilities, +1)
+        self.advance(time if self.now is None else max(self.now, time))
+
+    def advance(self, now: datetime) -> None:
+        # Move the window to end at now; triggers at or before now - window leave
+        self.now = now if self.now is None else max(self.now, now)
+        start = self.now - self.window
+        while self._heap and self._heap[0][0] <= start:
+            _, _, probabilities = heapq.heappop(self._heap)
+            self._update(probabilities, -1)
+        if not self._heap:
+            # drop the rounding accumulated by the additions and removals
+            self._log_survival = [0.0] * len(ENERGIES)
+            self._certain = [0] * len(ENERGIES)
+
+    def risk(self, now: datetime | None = None) -> dict[str, float | None]:
+        if now is not None:
+            self.advance(now)
+        return {
+            f"probability_{energy}": (
+                (1.0 if self._certain[e] else 0.0 - expm1(self._log_survival[e]))
+                if self.requested[e] else None
+            )
+            for e, energy in enumerate(ENERGIES)
+        }